@@ -69,6 +69,7 @@ async def _scrape_async(
     include_metadata: bool,
 ):
     """Async scraping implementation."""
+    from src.core.http_client import close_shared_clients
     from src.scrapers import get_scraper
     from src.storage.json_storage import JsonStorage, export_to_training_format
     from src.models.source import load_sources
@@ -115,37 +116,41 @@ async def _scrape_async(
     # Collect reviews
     all_reviews = []
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task(f"Scraping {source}...", total=len(urls))
-        
-        async with scraper_cls() as scraper:
-            for scrape_url in urls:
-                progress.update(task, description=f"Scraping: {scrape_url[:50]}...")
-                
-                try:
-                    async for review in scraper.scrape_all_pages(
-                        scrape_url,
-                        max_pages=max_pages,
-                        max_reviews=max_reviews,
-                    ):
-                        all_reviews.append(review)
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(f"Scraping {source}...", total=len(urls))
+            
+            async with scraper_cls() as scraper:
+                for scrape_url in urls:
+                    progress.update(task, description=f"Scraping: {scrape_url[:50]}...")
+                    
+                    try:
+                        async for review in scraper.scrape_all_pages(
+                            scrape_url,
+                            max_pages=max_pages,
+                            max_reviews=max_reviews,
+                        ):
+                            all_reviews.append(review)
+                            
+                            if max_reviews and len(all_reviews) >= max_reviews:
+                                break
                         
-                        if max_reviews and len(all_reviews) >= max_reviews:
-                            break
+                    except Exception as e:
+                        console.print(f"[yellow]Warning:[/yellow] Error scraping {scrape_url}: {e}")
                     
-                except Exception as e:
-                    console.print(f"[yellow]Warning:[/yellow] Error scraping {scrape_url}: {e}")
-                
-                progress.advance(task)
-                
-                if max_reviews and len(all_reviews) >= max_reviews:
-                    break
+                    progress.advance(task)
+                    
+                    if max_reviews and len(all_reviews) >= max_reviews:
+                        break
+    finally:
+        # Scrapers share one HTTP connection pool; close it before the loop ends
+        await close_shared_clients()
     
     console.print()
     console.print(f"[green]✓[/green] Collected [bold]{len(all_reviews)}[/bold] reviews")
@@ -217,8 +222,16 @@ def export(
     with open(input_file, "r", encoding="utf-8") as f:
         data = json.load(f)
     
-    reviews = [Review(**item) for item in data]
+    reviews = []
+    skipped = 0
+    for item in data:
+        try:
+            reviews.append(Review.from_dict(item))
+        except (TypeError, ValueError):
+            skipped += 1
     console.print(f"Loaded [cyan]{len(reviews)}[/cyan] reviews")
+    if skipped:
+        console.print(f"[yellow]Warning:[/yellow] Skipped {skipped} invalid records")
     
     if format == "training":
         count = export_to_training_format(reviews, output_file, start_id=start_id)
@@ -47,6 +47,11 @@ class Settings(BaseSettings):
     request_timeout: int = 30
     max_retries: int = 3
 
+    # HTTP connection pool
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20
+    http_keepalive_expiry: float = 15.0  # Seconds an idle connection is kept open
+
     # Rate limiting
     rate_limit_rpm: int = 20  # Requests per minute per domain
 
@@ -46,6 +46,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from config.settings import settings
 from config.logging_config import setup_logging
+from src.core.http_client import close_shared_clients
 from src.models.review import Review
 
 console = Console()
@@ -518,6 +519,9 @@ async def main():
         results = await scrape_all_adac_interruptible(args.max_reviews, args.category, lambda: interrupted)
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
+    finally:
+        # Sources share one HTTP connection pool; close it before the loop ends
+        await close_shared_clients()
     
     # Save results (even if interrupted)
     if results:
@@ -23,6 +23,15 @@ class HeaderGenerator:
         '"Chromium";v="121", "Not A(Brand";v="99", "Google Chrome";v="121"',
     ]
 
+    # Headers that change per request; everything else generate() emits is fixed
+    ROTATING_FIELDS = frozenset({
+        "User-Agent",
+        "Accept-Language",
+        "Sec-Ch-Ua",
+        "Sec-Ch-Ua-Mobile",
+        "Sec-Ch-Ua-Platform",
+    })
+
     def __init__(self, user_agent_rotator: UserAgentRotator | None = None):
         self.ua_rotator = user_agent_rotator or UserAgentRotator()
 
@@ -33,10 +42,11 @@ class HeaderGenerator:
         extra_headers: dict[str, str] | None = None,
     ) -> dict[str, str]:
         """Generate a complete set of realistic headers."""
+        rotating = self.rotate_fields()
         headers = {
-            "User-Agent": self.ua_rotator.get_random(),
+            "User-Agent": rotating.pop("User-Agent"),
             "Accept": accept or self.ACCEPT_HTML,
-            "Accept-Language": random.choice(self.ACCEPT_LANGUAGES),
+            "Accept-Language": rotating.pop("Accept-Language"),
             "Accept-Encoding": self.ACCEPT_ENCODING,
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
@@ -47,10 +57,8 @@ class HeaderGenerator:
             "Cache-Control": "max-age=0",
         }
 
-        if "Chrome" in headers["User-Agent"]:
-            headers["Sec-Ch-Ua"] = random.choice(self.SEC_CH_UA)
-            headers["Sec-Ch-Ua-Mobile"] = "?0"
-            headers["Sec-Ch-Ua-Platform"] = '"Windows"'
+        # Client hints only accompany Chrome user agents
+        headers.update(rotating)
 
         if referer:
             headers["Referer"] = referer
@@ -60,6 +68,21 @@ class HeaderGenerator:
 
         return headers
 
+    def rotate_fields(self) -> dict[str, str]:
+        """Generate only the headers that rotate between requests."""
+        user_agent = self.ua_rotator.get_random()
+        headers = {
+            "User-Agent": user_agent,
+            "Accept-Language": random.choice(self.ACCEPT_LANGUAGES),
+        }
+
+        if "Chrome" in user_agent:
+            headers["Sec-Ch-Ua"] = random.choice(self.SEC_CH_UA)
+            headers["Sec-Ch-Ua-Mobile"] = "?0"
+            headers["Sec-Ch-Ua-Platform"] = '"Windows"'
+
+        return headers
+
     def generate_for_ajax(self, referer: str | None = None) -> dict[str, str]:
         """Generate headers for AJAX requests."""
         headers = self.generate(referer=referer, accept=self.ACCEPT_JSON)
@@ -18,6 +18,11 @@ class BaseScraper(ABC):
     Provides common functionality like HTTP client management, pagination,
     and error handling. Subclasses must implement the abstract methods
     to handle site-specific parsing logic.
+
+    Scrapers on one event loop share a connection pool. Leaving the
+    ``async with`` block releases it without closing its connections, so
+    the next scraper can reuse them; programs should await
+    ``close_shared_clients()`` (in a ``finally``) before their loop ends.
     """
 
     # Class-level configuration (override in subclasses)
@@ -26,6 +31,17 @@ class BaseScraper(ABC):
     rate_limit_rpm: int = 20
     requires_browser: bool = False
 
+    def __init_subclass__(cls, **kwargs):
+        """Split a subclass's comma-separated SELECTORS into alternatives once."""
+        super().__init_subclass__(**kwargs)
+        selectors = cls.__dict__.get("SELECTORS")
+        if selectors:
+            # Tried in order by parse code; splitting here keeps the split
+            # (and its list allocation) out of the per-review lookups
+            cls.SELECTOR_ALTERNATIVES = {
+                key: tuple(value.split(", ")) for key, value in selectors.items()
+            }
+
     def __init__(
         self,
         http_client: HttpClient | None = None,
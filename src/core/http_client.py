@@ -1,17 +1,178 @@
 """Async HTTP client with retry logic, proxy support, and rate limiting."""
 
 import asyncio
+import sys
+from functools import cache, lru_cache
+from time import monotonic
 from typing import Any
+from urllib.parse import urlparse
 
 import httpx
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
+
 from config.settings import settings
 from src.antibot.headers import HeaderGenerator
 from src.antibot.delays import DelayManager
 from src.core.rate_limiter import RateLimiter
 from src.core.retry_handler import RetryHandler
 
+# Connection pool limits for a single client; keepalive is kept longer than
+# httpx's 5s default so paginated scrapes reuse connections between delays.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=settings.http_max_connections,
+    max_keepalive_connections=settings.http_max_keepalive,
+    keepalive_expiry=settings.http_keepalive_expiry,
+)
+
+# Negotiated once on the client instead of being rebuilt into every request
+CLIENT_HEADERS = {"Accept-Encoding": HeaderGenerator.ACCEPT_ENCODING}
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """
+    Extract the netloc of a URL (cached, scrapers hit the same URLs repeatedly).
+
+    Plain scheme://host URLs are sliced directly; anything with userinfo,
+    IPv6 brackets or no scheme goes through urlparse. The result is
+    interned, so the per-domain dicts in the rate limiter and circuit
+    breaker compare keys by identity.
+    """
+    i = url.find("://")
+    if i == -1 or "@" in url or "[" in url:
+        return sys.intern(urlparse(url).netloc)
+    host = url[i + 3:].partition("/")[0]
+    return sys.intern(host.partition("?")[0].partition("#")[0])
+
+
+@cache
+def _shared_header_generator() -> HeaderGenerator:
+    """Process-wide header generator, created on first use."""
+    return HeaderGenerator()
+
+
+@cache
+def _shared_delay_manager() -> DelayManager:
+    """Process-wide delay manager, created on first use."""
+    return DelayManager()
+
+
+# Shared clients keyed by id() of the running event loop, so HttpClient
+# instances created on the same loop reuse one connection pool. They also
+# share one cookie jar: cookies stay scoped to the domain that set them, but
+# two scrapers of the same site on one loop see each other's session.
+_CLIENTS: dict[int, tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+_REFS: dict[int, int] = {}
+# Pending closes of unreferenced shared clients (see _release_shared_client)
+_IDLE_TIMERS: dict[int, asyncio.TimerHandle] = {}
+_CLOSING: set[asyncio.Task] = set()
+
+
+def _acquire_shared_client(timeout: httpx.Timeout) -> tuple[int, httpx.AsyncClient]:
+    """Get (or create) the shared client for the running loop and take a reference."""
+    loop = asyncio.get_running_loop()
+
+    # Drop slots left behind by loops that were closed without releasing
+    for stale_key in [k for k, (lp, _) in _CLIENTS.items() if lp.is_closed()]:
+        del _CLIENTS[stale_key]
+        _REFS.pop(stale_key, None)
+        _IDLE_TIMERS.pop(stale_key, None)
+
+    key = id(loop)
+    timer = _IDLE_TIMERS.pop(key, None)
+    if timer is not None:
+        timer.cancel()
+    entry = _CLIENTS.get(key)
+    if entry is None or entry[1].is_closed:
+        client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=DEFAULT_LIMITS,
+            headers=CLIENT_HEADERS,
+            follow_redirects=True,
+            http2=True,
+        )
+        _CLIENTS[key] = (loop, client)
+        _REFS[key] = 0
+        logger.debug("Shared HTTP client initialized")
+    else:
+        client = entry[1]
+
+    _REFS[key] += 1
+    return key, client
+
+
+async def _release_shared_client(key: int) -> None:
+    """
+    Release a reference to a shared client.
+
+    An unreferenced client is kept for one keep-alive period before it is
+    closed, so a scraper started right after another one (e.g. a loop over
+    sources) reuses the open connections instead of paying new TLS
+    handshakes. After that period the pooled connections have expired
+    anyway.
+
+    When the releasing task is being cancelled (Ctrl+C, or asyncio.run
+    cancelling leftover tasks at shutdown), the client is closed right
+    away, since the loop may close before the timer fires.
+    """
+    if key not in _REFS:
+        return
+    _REFS[key] -= 1
+    if _REFS[key] > 0:
+        return
+
+    loop, client = _CLIENTS[key]
+    if loop.is_closed():
+        del _CLIENTS[key], _REFS[key]
+        return
+    task = asyncio.current_task()
+    if task is not None and task.cancelling():
+        del _CLIENTS[key], _REFS[key]
+        await client.aclose()
+        logger.debug("Shared HTTP client closed")
+        return
+    _IDLE_TIMERS[key] = loop.call_later(settings.http_keepalive_expiry, _close_idle_client, key)
+
+
+def _close_idle_client(key: int) -> None:
+    """Close a shared client that stayed unreferenced for a keep-alive period."""
+    _IDLE_TIMERS.pop(key, None)
+    if _REFS.get(key, 0) > 0:
+        return
+    entry = _CLIENTS.pop(key, None)
+    _REFS.pop(key, None)
+    if entry is None:
+        return
+    task = entry[0].create_task(entry[1].aclose())
+    _CLOSING.add(task)
+    task.add_done_callback(_CLOSING.discard)
+    logger.debug("Idle shared HTTP client closed")
+
+
+async def close_shared_clients() -> None:
+    """
+    Close the running loop's shared client now, including an idle one.
+
+    Call at the end of a program's main coroutine so lingering keep-alive
+    connections are closed before the event loop shuts down.
+    """
+    key = id(asyncio.get_running_loop())
+    timer = _IDLE_TIMERS.pop(key, None)
+    if timer is not None:
+        timer.cancel()
+    entry = _CLIENTS.pop(key, None)
+    _REFS.pop(key, None)
+    if entry is not None:
+        await entry[1].aclose()
+        logger.debug("Shared HTTP client closed")
+    if _CLOSING:
+        await asyncio.gather(*_CLOSING, return_exceptions=True)
+
 
 class HttpClient:
     """Async HTTP client with built-in anti-detection features."""
@@ -21,14 +182,31 @@ class HttpClient:
         rate_limiter: RateLimiter | None = None,
         proxy: str | None = None,
         timeout: int | None = None,
+        limits: httpx.Limits | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         self.timeout = timeout or settings.request_timeout
         self.proxy = proxy
+        self.limits = limits or DEFAULT_LIMITS
+        # Custom network backend (e.g. a platform-specific transport); overrides proxy
+        self.transport = transport
+        # Only plain clients can share a pool; proxies, custom limits and transports need their own
+        self._shared = proxy is None and limits is None and transport is None
+        self._shared_key: int | None = None
         self.rate_limiter = rate_limiter or RateLimiter()
         self.retry_handler = RetryHandler()
-        self.header_generator = HeaderGenerator()
-        self.delay_manager = DelayManager()
+        # Stateless apart from RNG/statistics, so every client shares one instance
+        self.header_generator = _shared_header_generator()
+        self.delay_manager = _shared_delay_manager()
+        # Fixed part of the generated headers; only rotating fields change per request
+        self._base_headers = {
+            k: v
+            for k, v in self.header_generator.generate().items()
+            if k not in HeaderGenerator.ROTATING_FIELDS and k not in CLIENT_HEADERS
+        }
         self._client: httpx.AsyncClient | None = None
+        # Earliest time the next request may start (anti-bot delay of the previous one)
+        self._next_allowed_at = 0.0
 
     async def __aenter__(self) -> "HttpClient":
         """Async context manager entry."""
@@ -41,20 +219,40 @@ class HttpClient:
 
     async def start(self) -> None:
         """Initialize the HTTP client."""
-        transport = None
-        if self.proxy:
+        if self._shared:
+            self._shared_key, self._client = _acquire_shared_client(
+                httpx.Timeout(self.timeout)
+            )
+            return
+
+        transport = self.transport
+        if transport is None and self.proxy:
             transport = httpx.AsyncHTTPTransport(proxy=self.proxy)
 
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(self.timeout),
             transport=transport,
+            limits=self.limits,
+            headers=CLIENT_HEADERS,
             follow_redirects=True,
             http2=True,
         )
         logger.debug("HTTP client initialized")
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """
+        Close the HTTP client.
+
+        A shared client is only released: its connections stay open for one
+        keep-alive period (see _release_shared_client), so call
+        close_shared_clients() before the program's event loop ends.
+        """
+        if self._shared_key is not None:
+            key, self._shared_key = self._shared_key, None
+            self._client = None
+            await _release_shared_client(key)
+            return
+
         if self._client:
             await self._client.aclose()
             self._client = None
@@ -82,16 +280,22 @@ class HttpClient:
         if not self._client:
             await self.start()
 
+        # Wait out the delay scheduled by the previous response. Concurrent
+        # callers read the same deadline and are not spaced from each other
+        # (HttpClientPool relies on that); callers that fan out spread their
+        # own start times (see the forum scrapers' fetch windows).
+        wait = self._next_allowed_at - monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
         # Extract domain for rate limiting
-        if not domain:
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc
+        domain = sys.intern(domain) if domain else _netloc(url)
 
         # Apply rate limiting
         await self.rate_limiter.acquire(domain)
 
         # Generate headers
-        request_headers = self.header_generator.generate()
+        request_headers = {**self._base_headers, **self.header_generator.rotate_fields()}
         if headers:
             request_headers.update(headers)
 
@@ -103,8 +307,8 @@ class HttpClient:
             params=params,
         )
 
-        # Apply delay after request
-        await self.delay_manager.wait()
+        # Schedule the delay before the next request instead of blocking this response
+        self._next_allowed_at = monotonic() + self.delay_manager.get_delay()
 
         return response
 
@@ -116,8 +320,16 @@ class HttpClient:
     ) -> httpx.Response:
         """Make the actual HTTP request."""
         logger.debug(f"Fetching: {url}")
-        response = await self._client.get(url, headers=headers, params=params)
-        response.raise_for_status()
+        response = await self._client.get(
+            url, headers=headers, params=params, timeout=self.timeout
+        )
+        # Retryable statuses are returned as-is; the retry handler checks them
+        # directly instead of catching an HTTPStatusError per attempt
+        if (
+            response.is_error
+            and response.status_code not in self.retry_handler.RETRYABLE_STATUS_CODES
+        ):
+            response.raise_for_status()
         return response
 
     async def get_text(
@@ -136,35 +348,69 @@ class HttpClient:
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Fetch URL and return JSON response."""
+        """Fetch URL and return JSON response (parsed with orjson when installed)."""
         response = await self.get(url, headers=headers, params=params)
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
 
 
 class HttpClientPool:
-    """Pool of HTTP clients for concurrent scraping."""
+    """
+    Pool of HTTP clients for concurrent scraping.
+
+    Without proxies, a single client whose connection pool is sized to the
+    pool serves all requests, so keep-alive connections and HTTP/2 streams
+    are reused. With proxies, there is one client per proxy.
+
+    Checkout goes through a queue holding ``size`` slots spread round-robin
+    over the clients, so the queue both caps concurrency and rotates fairly.
+    """
 
-    def __init__(self, size: int | None = None):
+    def __init__(self, size: int | None = None, proxies: list[str] | None = None):
         self.size = size or settings.max_concurrent_requests
-        self._semaphore = asyncio.Semaphore(self.size)
+        self.proxies = proxies or []
         self._clients: list[HttpClient] = []
+        self._queue: asyncio.Queue[HttpClient] | None = None
 
     async def __aenter__(self) -> "HttpClientPool":
-        """Initialize the client pool."""
-        for _ in range(self.size):
-            client = HttpClient()
+        """Initialize the clients and fill the checkout queue."""
+        limits = httpx.Limits(
+            max_connections=self.size,
+            max_keepalive_connections=self.size,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        )
+        if self.proxies:
+            self._clients = [HttpClient(proxy=proxy, limits=limits) for proxy in self.proxies]
+        else:
+            self._clients = [HttpClient(limits=limits)]
+
+        for client in self._clients:
             await client.start()
-            self._clients.append(client)
+
+        self._queue = asyncio.Queue()
+        for slot in range(self.size):
+            self._queue.put_nowait(self._clients[slot % len(self._clients)])
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Close all clients in the pool."""
+        if self._queue:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue = None
+
         for client in self._clients:
             await client.close()
         self._clients.clear()
 
     async def get(self, url: str, **kwargs) -> httpx.Response:
-        """Get a client from the pool and make a request."""
-        async with self._semaphore:
-            client = self._clients[0]  # Simple round-robin could be added
-            return await client.get(url, **kwargs)
\ No newline at end of file
+        """Check out a client from the pool and make a request."""
+        if not self._queue:
+            raise RuntimeError("Client pool not initialized. Use 'async with' context manager.")
+        queue = self._queue
+        client = await queue.get()
+        try:
+            return await client.get(url, **kwargs)
+        finally:
+            queue.put_nowait(client)
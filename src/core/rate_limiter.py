@@ -2,7 +2,7 @@
 
 import asyncio
 from collections import defaultdict
-from time import time
+from time import monotonic
 
 from aiolimiter import AsyncLimiter
 from loguru import logger
@@ -21,7 +21,6 @@ class RateLimiter:
         self.rpm = requests_per_minute or settings.rate_limit_rpm
         self._limiters: dict[str, AsyncLimiter] = {}
         self._request_counts: dict[str, int] = defaultdict(int)
-        self._lock = asyncio.Lock()
 
     def _get_limiter(self, domain: str) -> AsyncLimiter:
         """Get or create a rate limiter for the given domain."""
@@ -40,8 +39,8 @@ class RateLimiter:
         """
         limiter = self._get_limiter(domain)
         async with limiter:
-            async with self._lock:
-                self._request_counts[domain] += 1
+            # No lock needed: the increment cannot be interleaved on a single loop
+            self._request_counts[domain] += 1
             logger.debug(f"Rate limit acquired for {domain} (total: {self._request_counts[domain]})")
 
     def get_stats(self) -> dict[str, int]:
@@ -53,74 +52,88 @@ class RateLimiter:
         self._request_counts.clear()
 
 
+# Column indices of an AdaptiveRateLimiter per-domain row
+_SUCCESSES, _ERRORS, _LAST_ADJUSTMENT, _RPM = range(4)
+
+
 class AdaptiveRateLimiter(RateLimiter):
     """
     Adaptive rate limiter that adjusts based on response patterns.
     
     Slows down when detecting potential blocking, speeds up when stable.
+    Per-domain counters live in a single row so one lookup serves the
+    whole success/error bookkeeping path.
     """
 
     def __init__(self, initial_rpm: int | None = None):
         super().__init__(initial_rpm)
-        self._error_counts: dict[str, int] = defaultdict(int)
-        self._success_counts: dict[str, int] = defaultdict(int)
-        self._domain_rpm: dict[str, int] = {}
-        self._last_adjustment: dict[str, float] = {}
+        # domain -> [successes, errors, last_adjustment, rpm]
+        self._rows: dict[str, list] = {}
+        self._lock = asyncio.Lock()
         self._min_rpm = 5
         self._max_rpm = 60
         self._adjustment_interval = 60  # seconds
 
+    def _row(self, domain: str) -> list:
+        """Get or create the counter row for a domain."""
+        row = self._rows.get(domain)
+        if row is None:
+            # -inf so the first check always adjusts, as with the old epoch-0 default
+            row = self._rows[domain] = [0, 0, float("-inf"), self.rpm]
+        return row
+
     async def record_success(self, domain: str) -> None:
         """Record a successful request."""
         async with self._lock:
-            self._success_counts[domain] += 1
-            await self._maybe_adjust(domain)
+            row = self._row(domain)
+            row[_SUCCESSES] += 1
+            await self._maybe_adjust(domain, row)
 
     async def record_error(self, domain: str, status_code: int) -> None:
         """Record a failed request."""
         async with self._lock:
-            self._error_counts[domain] += 1
+            row = self._row(domain)
+            row[_ERRORS] += 1
             
             # Immediately slow down on rate limit errors
             if status_code in (429, 503):
-                await self._slow_down(domain)
+                await self._slow_down(domain, row)
 
-    async def _maybe_adjust(self, domain: str) -> None:
+    async def _maybe_adjust(self, domain: str, row: list) -> None:
         """Check if we should adjust the rate limit."""
-        now = time()
-        last = self._last_adjustment.get(domain, 0)
+        now = monotonic()
         
-        if now - last < self._adjustment_interval:
+        if now - row[_LAST_ADJUSTMENT] < self._adjustment_interval:
             return
         
-        self._last_adjustment[domain] = now
+        row[_LAST_ADJUSTMENT] = now
         
-        success = self._success_counts[domain]
-        errors = self._error_counts[domain]
+        success = row[_SUCCESSES]
+        errors = row[_ERRORS]
         
         if errors == 0 and success > 10:
-            await self._speed_up(domain)
+            await self._speed_up(domain, row)
         elif errors > 0:
             error_rate = errors / (success + errors)
             if error_rate > 0.1:  # More than 10% errors
-                await self._slow_down(domain)
+                await self._slow_down(domain, row)
 
-    async def _slow_down(self, domain: str) -> None:
+    async def _slow_down(self, domain: str, row: list) -> None:
         """Reduce the rate limit for a domain."""
-        current = self._domain_rpm.get(domain, self.rpm)
+        current = row[_RPM]
         new_rpm = max(self._min_rpm, int(current * 0.7))
         
         if new_rpm != current:
-            self._domain_rpm[domain] = new_rpm
+            row[_RPM] = new_rpm
             self._limiters[domain] = AsyncLimiter(new_rpm, 60)
             logger.warning(f"Slowing down {domain}: {current} -> {new_rpm} rpm")
 
-    async def _speed_up(self, domain: str) -> None:
+    async def _speed_up(self, domain: str, row: list) -> None:
         """Increase the rate limit for a domain."""
-        current = self._domain_rpm.get(domain, self.rpm)
+        current = row[_RPM]
         new_rpm = min(self._max_rpm, int(current * 1.2))
         
         if new_rpm != current:
-            self._domain_rpm[domain] = new_rpm
+            row[_RPM] = new_rpm
             self._limiters[domain] = AsyncLimiter(new_rpm, 60)
-            logger.info(f"Speeding up {domain}: {current} -> {new_rpm} rpm")
\ No newline at end of file
+            logger.info(f"Speeding up {domain}: {current} -> {new_rpm} rpm")
@@ -1,6 +1,9 @@
 """Retry handler with exponential backoff for failed requests."""
 
 import asyncio
+from array import array
+from random import random as _rand
+from time import monotonic
 from typing import Any, Callable, TypeVar
 
 import httpx
@@ -19,14 +22,14 @@ class RetryHandler:
     """
 
     # Status codes that should trigger a retry
-    RETRYABLE_STATUS_CODES = {
+    RETRYABLE_STATUS_CODES = frozenset({
         408,  # Request Timeout
         429,  # Too Many Requests
         500,  # Internal Server Error
         502,  # Bad Gateway
         503,  # Service Unavailable
         504,  # Gateway Timeout
-    }
+    })
 
     # Exceptions that should trigger a retry
     RETRYABLE_EXCEPTIONS = (
@@ -49,6 +52,12 @@ class RetryHandler:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
 
+        # Backoff schedule (before jitter), indexed by attempt number
+        self._delays = tuple(
+            min(self.base_delay * (self.exponential_base ** i), self.max_delay)
+            for i in range(self.max_retries + 2)
+        )
+
     async def execute(
         self,
         func: Callable[..., T],
@@ -74,17 +83,6 @@ class RetryHandler:
         for attempt in range(self.max_retries + 1):
             try:
                 result = await func(*args, **kwargs)
-                
-                # Check for retryable status codes
-                if isinstance(result, httpx.Response):
-                    if result.status_code in self.RETRYABLE_STATUS_CODES:
-                        raise httpx.HTTPStatusError(
-                            f"Retryable status code: {result.status_code}",
-                            request=result.request,
-                            response=result,
-                        )
-                
-                return result
 
             except self.RETRYABLE_EXCEPTIONS as e:
                 last_exception = e
@@ -98,6 +96,27 @@ class RetryHandler:
                     # Non-retryable HTTP error
                     raise
 
+            else:
+                # Check for retryable status codes without raising until the
+                # last attempt (raised outside the try, so it is logged once)
+                if (
+                    isinstance(result, httpx.Response)
+                    and result.status_code in self.RETRYABLE_STATUS_CODES
+                ):
+                    reason = f"Retryable status code: {result.status_code}"
+                    if attempt < self.max_retries:
+                        await self._wait_before_retry(attempt, reason)
+                        continue
+
+                    logger.error(f"Final retry attempt failed: {reason}")
+                    raise httpx.HTTPStatusError(
+                        reason,
+                        request=result.request,
+                        response=result,
+                    )
+
+                return result
+
         # All retries exhausted
         logger.error(f"All {self.max_retries} retries exhausted")
         raise last_exception or RuntimeError("Retry failed with no exception")
@@ -108,21 +127,23 @@ class RetryHandler:
             logger.error(f"Final retry attempt failed: {exception}")
             raise exception
 
+        await self._wait_before_retry(attempt, exception)
+
+    async def _wait_before_retry(self, attempt: int, reason: Exception | str) -> None:
+        """Log a failed attempt and sleep for its backoff delay."""
         delay = self._calculate_delay(attempt)
         logger.warning(
-            f"Attempt {attempt + 1}/{self.max_retries + 1} failed: {exception}. "
+            f"Attempt {attempt + 1}/{self.max_retries + 1} failed: {reason}. "
             f"Retrying in {delay:.2f}s..."
         )
         await asyncio.sleep(delay)
 
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate the delay for a retry attempt using exponential backoff."""
-        delay = self.base_delay * (self.exponential_base ** attempt)
+        delay = self._delays[min(attempt, len(self._delays) - 1)]
         # Add jitter (±25%)
-        import random
-        jitter = delay * 0.25 * (2 * random.random() - 1)
-        delay = min(delay + jitter, self.max_delay)
-        return max(0.1, delay)
+        jitter = delay * 0.25 * (2 * _rand() - 1)
+        return max(0.1, min(delay + jitter, self.max_delay))
 
 
 class CircuitBreaker:
@@ -133,8 +154,17 @@ class CircuitBreaker:
     - CLOSED: Normal operation, requests go through
     - OPEN: Too many failures, requests are rejected immediately
     - HALF_OPEN: Testing if service has recovered
+
+    Failure times come from the monotonic clock, so wall-clock jumps (NTP
+    corrections, DST) cannot open or close a circuit early.
+
+    Per-key state is stored column-wise in compact arrays indexed by a
+    key -> row id table, so each check is one dict lookup plus array reads.
+    None of the methods await while mutating state, so no lock is needed.
     """
 
+    CLOSED, OPEN, HALF_OPEN = 0, 1, 2
+
     def __init__(
         self,
         failure_threshold: int = 5,
@@ -145,64 +175,71 @@ class CircuitBreaker:
         self.recovery_timeout = recovery_timeout
         self.success_threshold = success_threshold
         
-        self._failures: dict[str, int] = {}
-        self._successes: dict[str, int] = {}
-        self._state: dict[str, str] = {}  # CLOSED, OPEN, HALF_OPEN
-        self._last_failure_time: dict[str, float] = {}
-        self._lock = asyncio.Lock()
+        self._ids: dict[str, int] = {}
+        self._failures = array("i")
+        self._successes = array("i")
+        self._state = array("B")
+        self._last_failure_time = array("d")
+
+    def _idx(self, key: str) -> int:
+        """Get the row id for a key, appending a CLOSED row on first use."""
+        idx = self._ids.get(key)
+        if idx is None:
+            idx = self._ids[key] = len(self._state)
+            self._failures.append(0)
+            self._successes.append(0)
+            self._state.append(self.CLOSED)
+            self._last_failure_time.append(0.0)
+        return idx
 
     async def can_proceed(self, key: str) -> bool:
         """Check if a request can proceed."""
-        async with self._lock:
-            state = self._state.get(key, "CLOSED")
-            
-            if state == "CLOSED":
-                return True
-            
-            if state == "OPEN":
-                # Check if recovery timeout has passed
-                import time
-                if time.time() - self._last_failure_time.get(key, 0) > self.recovery_timeout:
-                    self._state[key] = "HALF_OPEN"
-                    self._successes[key] = 0
-                    logger.info(f"Circuit breaker for {key} entering HALF_OPEN state")
-                    return True
-                return False
-            
-            # HALF_OPEN
+        idx = self._ids.get(key)
+        if idx is None:
             return True
 
+        state = self._state[idx]
+        if state == self.OPEN:
+            # Check if recovery timeout has passed
+            if monotonic() - self._last_failure_time[idx] > self.recovery_timeout:
+                self._state[idx] = self.HALF_OPEN
+                self._successes[idx] = 0
+                logger.info(f"Circuit breaker for {key} entering HALF_OPEN state")
+                return True
+            return False
+
+        # CLOSED or HALF_OPEN
+        return True
+
     async def record_success(self, key: str) -> None:
         """Record a successful request."""
-        async with self._lock:
-            state = self._state.get(key, "CLOSED")
-            
-            if state == "HALF_OPEN":
-                self._successes[key] = self._successes.get(key, 0) + 1
-                if self._successes[key] >= self.success_threshold:
-                    self._state[key] = "CLOSED"
-                    self._failures[key] = 0
-                    logger.info(f"Circuit breaker for {key} CLOSED after recovery")
-            
-            elif state == "CLOSED":
-                # Reset failure count on success
-                self._failures[key] = 0
+        idx = self._idx(key)
+        state = self._state[idx]
+
+        if state == self.HALF_OPEN:
+            self._successes[idx] += 1
+            if self._successes[idx] >= self.success_threshold:
+                self._state[idx] = self.CLOSED
+                self._failures[idx] = 0
+                logger.info(f"Circuit breaker for {key} CLOSED after recovery")
+
+        elif state == self.CLOSED:
+            # Reset failure count on success
+            self._failures[idx] = 0
 
     async def record_failure(self, key: str) -> None:
         """Record a failed request."""
-        import time
-        
-        async with self._lock:
-            self._failures[key] = self._failures.get(key, 0) + 1
-            self._last_failure_time[key] = time.time()
-            
-            state = self._state.get(key, "CLOSED")
-            
-            if state == "HALF_OPEN":
-                # Any failure in half-open goes back to open
-                self._state[key] = "OPEN"
-                logger.warning(f"Circuit breaker for {key} re-OPENED after failure in HALF_OPEN")
-            
-            elif state == "CLOSED" and self._failures[key] >= self.failure_threshold:
-                self._state[key] = "OPEN"
-                logger.warning(f"Circuit breaker for {key} OPENED after {self.failure_threshold} failures")
\ No newline at end of file
+        idx = self._idx(key)
+        self._failures[idx] += 1
+        self._last_failure_time[idx] = monotonic()
+
+        state = self._state[idx]
+
+        if state == self.HALF_OPEN:
+            # Any failure in half-open goes back to open
+            self._state[idx] = self.OPEN
+            logger.warning(f"Circuit breaker for {key} re-OPENED after failure in HALF_OPEN")
+
+        elif state == self.CLOSED and self._failures[idx] >= self.failure_threshold:
+            self._state[idx] = self.OPEN
+            logger.warning(f"Circuit breaker for {key} OPENED after {self.failure_threshold} failures")
@@ -1,11 +1,12 @@
 """Data models for the review scraper."""
 
-from src.models.review import Review, ReviewBatch
+from src.models.review import Review, ReviewBatch, ReviewColumns
 from src.models.source import Source, SourceCategory
 
 __all__ = [
     "Review",
     "ReviewBatch",
+    "ReviewColumns",
     "Source",
     "SourceCategory",
 ]
\ No newline at end of file
@@ -1,51 +1,149 @@
 """Review data model."""
 
+import json
+import re
+from array import array
+from collections.abc import Sequence
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
+from itertools import repeat
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
 
+# Deletes ASCII control characters except tab, newline and carriage return.
+# str.translate applies it in one C-level pass, so __post_init__ stays cheap.
+_CONTROL_CHARS_TABLE = {i: None for i in range(32) if i not in (9, 10, 13)}
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
 
-class Review(BaseModel):
+_NAN = float("nan")
+
+
+def _normalize_text(text: str) -> str:
+    """Strip control characters and surrounding whitespace."""
+    # translate always copies; only pay for it when there is something to
+    # remove, so clean (e.g. interned) texts keep their identity
+    if _CONTROL_CHARS_RE.search(text):
+        text = text.translate(_CONTROL_CHARS_TABLE)
+    return text.strip()
+
+
+def _check_ranges(rating: float | None, helpful_count: int | None) -> None:
+    """Raise ValueError for out-of-range rating or helpful count."""
+    if rating is not None and not 0 <= rating <= 5:
+        raise ValueError(f"Rating must be between 0 and 5, got {rating}")
+    if helpful_count is not None and helpful_count < 0:
+        raise ValueError(f"Helpful count cannot be negative, got {helpful_count}")
+
+
+def _coerce_number(value: Any, kind: type) -> Any:
+    """Convert a numeric string (as found in reloaded JSON) to ``kind``; blanks become None."""
+    if isinstance(value, str):
+        value = value.strip()
+        return kind(value) if value else None
+    if isinstance(value, (int, float)) and not isinstance(value, (bool, kind)):
+        return kind(value)
+    return value
+
+
+@dataclass(slots=True)
+class Review:
     """
     Core review data model.
     
     The minimal export format is {id, text} to match the training data format.
     Additional metadata fields are available for filtering and analysis.
+
+    A slotted dataclass rather than a Pydantic model: reviews are created and
+    exported in bulk, so construction only runs the checks in __post_init__.
     """
 
     # Required fields (for export)
-    id: int = Field(..., description="Unique review identifier")
-    text: str = Field(..., description="Review text content")
+    id: int  # Unique review identifier
+    text: str  # Review text content
 
     # Optional metadata (not exported by default)
-    source: str | None = Field(default=None, description="Source platform (e.g., 'trustpilot')")
-    source_url: str | None = Field(default=None, description="Original URL of the review")
-    source_id: str | None = Field(default=None, description="Original ID from source platform")
-    
-    rating: float | None = Field(default=None, ge=0, le=5, description="Rating (0-5 scale)")
-    title: str | None = Field(default=None, description="Review title/headline")
-    author: str | None = Field(default=None, description="Author name/username")
-    date: datetime | None = Field(default=None, description="Review date")
-    
-    product_name: str | None = Field(default=None, description="Product or business name")
-    product_id: str | None = Field(default=None, description="Product identifier")
-    category: str | None = Field(default=None, description="Product category")
-    
-    helpful_count: int | None = Field(default=None, ge=0, description="Helpful votes count")
-    verified: bool | None = Field(default=None, description="Verified purchase/user")
-    
-    language: str | None = Field(default=None, description="Detected language code")
-    scraped_at: datetime = Field(default_factory=datetime.utcnow, description="Scrape timestamp")
+    source: str | None = None  # Source platform (e.g., 'trustpilot')
+    source_url: str | None = None  # Original URL of the review
+    source_id: str | None = None  # Original ID from source platform
 
-    @field_validator("text")
-    @classmethod
-    def clean_text(cls, v: str) -> str:
-        """Clean and normalize review text."""
-        if not v:
+    rating: float | None = None  # Rating (0-5 scale)
+    title: str | None = None  # Review title/headline
+    author: str | None = None  # Author name/username
+    date: datetime | None = None  # Review date
+
+    product_name: str | None = None  # Product or business name
+    product_id: str | None = None  # Product identifier
+    category: str | None = None  # Product category
+
+    helpful_count: int | None = None  # Helpful votes count
+    verified: bool | None = None  # Verified purchase/user
+    playtime_hours: float | None = None  # Hours played by the author (games)
+
+    language: str | None = None  # Detected language code
+    scraped_at: datetime = field(default_factory=datetime.utcnow)  # Scrape timestamp
+
+    def __post_init__(self) -> None:
+        """Clean text and validate field ranges."""
+        if not self.text:
             raise ValueError("Review text cannot be empty")
         # Basic normalization (more thorough cleaning happens in pipeline)
-        return v.strip()
+        self.text = _normalize_text(self.text)
+
+        _check_ranges(self.rating, self.helpful_count)
+
+        # Dates come back as ISO strings when reloading exported JSON
+        if isinstance(self.date, str):
+            self.date = datetime.fromisoformat(self.date)
+        if isinstance(self.scraped_at, str):
+            self.scraped_at = datetime.fromisoformat(self.scraped_at)
+
+    @classmethod
+    def construct_trusted(cls, **data: Any) -> "Review":
+        """
+        Build a review from already-validated data without running __post_init__.
+
+        Intended for bulk paths that re-create reviews whose text was cleaned
+        and checked upstream (dedup, re-export, replays). Missing optional
+        fields get their defaults.
+        """
+        review = object.__new__(cls)
+        for name, default, default_factory in _REVIEW_FIELDS:
+            if name in data:
+                value = data[name]
+            elif default_factory is not MISSING:
+                value = default_factory()
+            elif default is not MISSING:
+                value = default
+            else:
+                raise TypeError(f"Missing required review field: {name!r}")
+            object.__setattr__(review, name, value)
+        return review
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Review":
+        """
+        Build a review from a loosely typed dict, such as reloaded JSON.
+
+        Keys that are not Review fields are ignored, and numeric strings in
+        id, rating and helpful_count are converted, as the Pydantic model
+        did. Other invalid values still raise ValueError or TypeError.
+        """
+        kwargs = {k: v for k, v in data.items() if k in _REVIEW_FIELD_NAMES}
+        for name, kind in _NUMERIC_FIELDS:
+            if name in kwargs:
+                kwargs[name] = _coerce_number(kwargs[name], kind)
+        return cls(**kwargs)
+
+    @property
+    def display_text(self) -> str:
+        """Text with context fields (playtime) prepended, formatted on demand."""
+        if self.playtime_hours is not None and self.playtime_hours > 1:
+            return "".join(("[", format(self.playtime_hours, ".1f"), " hours played]\n\n", self.text))
+        return self.text
 
     def to_export_dict(self) -> dict[str, Any]:
         """
@@ -60,20 +158,27 @@ class Review(BaseModel):
 
     def to_full_dict(self) -> dict[str, Any]:
         """Convert to full dict including all metadata."""
-        return self.model_dump(exclude_none=True)
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None,
+        return {
+            name: value
+            for name in self.__slots__
+            if (value := getattr(self, name)) is not None
         }
 
 
-class ReviewBatch(BaseModel):
+# (name, default, default_factory) per Review field, for construct_trusted
+_REVIEW_FIELDS = tuple((f.name, f.default, f.default_factory) for f in fields(Review))
+_REVIEW_FIELD_NAMES = frozenset(name for name, _, _ in _REVIEW_FIELDS)
+# Fields from_dict converts from numeric strings
+_NUMERIC_FIELDS = (("id", int), ("rating", float), ("helpful_count", int))
+
+
+@dataclass(slots=True)
+class ReviewBatch:
     """A batch of reviews with metadata."""
 
-    reviews: list[Review] = Field(default_factory=list)
+    reviews: list[Review] = field(default_factory=list)
     source: str | None = None
-    scraped_at: datetime = Field(default_factory=datetime.utcnow)
+    scraped_at: datetime = field(default_factory=datetime.utcnow)
     total_count: int = 0
     page: int | None = None
 
@@ -97,6 +202,106 @@ class ReviewBatch(BaseModel):
         """Convert all reviews to export format."""
         return [r.to_export_dict() for r in self.reviews]
 
+    def to_jsonl_bytes(self) -> bytes:
+        """
+        Serialize all reviews as {id, text} JSON lines.
+
+        Writes straight into one buffer instead of building a list of export
+        dicts first; uses orjson when it is installed.
+        """
+        buf = bytearray()
+        if orjson is not None:
+            dumps = orjson.dumps
+            for r in self.reviews:
+                buf += dumps({"id": r.id, "text": r.text})
+                buf += b"\n"
+        else:
+            for r in self.reviews:
+                buf += json.dumps({"id": r.id, "text": r.text}, ensure_ascii=False).encode()
+                buf += b"\n"
+        return bytes(buf)
+
+
+@dataclass(slots=True)
+class ReviewColumns:
+    """
+    Reviews from one source stored column-wise.
+
+    Scrapers append parsed rows here instead of building a Review per row.
+    Pipeline steps that only look at texts (cleaning, length filter, dedup)
+    scan the texts list directly, and Review objects are created only for
+    the rows that survive (see to_reviews). Ratings live in a float array
+    with NaN for missing values. Rows are validated on append, with the same
+    checks as Review.
+    """
+
+    source: str | None = None
+    source_url: str | None = None
+    texts: list[str] = field(default_factory=list)
+    ratings: array = field(default_factory=lambda: array("d"))
+    dates: list[datetime | None] = field(default_factory=list)
+    authors: list[str | None] = field(default_factory=list)
+    source_ids: list[str | None] = field(default_factory=list)
+    helpful_counts: list[int | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def append(
+        self,
+        text: str,
+        rating: float | None = None,
+        date: datetime | str | None = None,
+        author: str | None = None,
+        source_id: str | None = None,
+        helpful_count: int | None = None,
+    ) -> None:
+        """Validate and add one row."""
+        if not text:
+            raise ValueError("Review text cannot be empty")
+        _check_ranges(rating, helpful_count)
+        if isinstance(date, str):
+            date = datetime.fromisoformat(date)
+
+        self.texts.append(_normalize_text(text))
+        self.ratings.append(_NAN if rating is None else rating)
+        self.dates.append(date)
+        self.authors.append(author)
+        self.source_ids.append(source_id)
+        self.helpful_counts.append(helpful_count)
+
+    def to_reviews(
+        self,
+        factory: "ReviewFactory",
+        rows: list[int] | range | None = None,
+    ) -> list[Review]:
+        """
+        Materialize rows as Review objects with IDs from the factory.
+
+        Args:
+            factory: Assigns consecutive IDs to the created reviews
+            rows: Row indices to materialize (default: all rows)
+        """
+        if rows is None:
+            rows = range(len(self.texts))
+
+        def take(column):
+            return [column[i] for i in rows]
+
+        return factory.create_many(
+            {
+                "text": take(self.texts),
+                "rating": [None if r != r else r for r in take(self.ratings)],
+                "date": take(self.dates),
+                "author": take(self.authors),
+                "source_id": take(self.source_ids),
+                "helpful_count": take(self.helpful_counts),
+            },
+            trusted=True,  # Rows were validated on append
+            source=self.source,
+            source_url=self.source_url,
+        )
+
 
 class ReviewFactory:
     """Factory for creating Review objects with auto-incrementing IDs."""
@@ -110,9 +315,146 @@ class ReviewFactory:
         self._next_id += 1
         return review
 
-    def create_batch(self, texts: list[str], **common_kwargs) -> list[Review]:
-        """Create multiple reviews from a list of texts."""
-        return [self.create(text, **common_kwargs) for text in texts]
+    def create_fast(
+        self,
+        text: str,
+        source: str | None,
+        source_url: str | None,
+        source_id: str | None,
+        rating: float | None,
+        date: datetime | None,
+        author: str | None,
+        helpful_count: int | None = None,
+        playtime_hours: float | None = None,
+    ) -> Review:
+        """
+        Create a review from the fields scrapers fill most often.
+
+        Same result as create(), but takes positional arguments and passes
+        them on positionally, so no keyword dicts are built per review.
+        """
+        # Positional order of Review: id, text, source, source_url, source_id,
+        # rating, title, author, date, product_name, product_id, category,
+        # helpful_count, verified, playtime_hours
+        review = Review(
+            self._next_id, text, source, source_url, source_id,
+            rating, None, author, date, None, None, None, helpful_count,
+            None, playtime_hours,
+        )
+        self._next_id += 1
+        return review
+
+    def create_batch(
+        self,
+        texts: list[str],
+        trusted: bool = False,
+        **common_kwargs,
+    ) -> list[Review]:
+        """
+        Create multiple reviews from a list of texts.
+
+        Texts and shared fields are validated once for the whole batch, then
+        reviews are built without per-review validation over a pre-allocated
+        ID range.
+
+        Args:
+            texts: Review texts
+            trusted: Texts and kwargs were already validated (e.g. pipeline
+                replays), so skip validation entirely
+            **common_kwargs: Fields shared by all reviews
+        """
+        if not texts:
+            return []
+
+        if not trusted:
+            if not all(texts):
+                raise ValueError("Review text cannot be empty")
+            # Validate (and normalize, e.g. ISO dates) the shared fields once
+            first = Review(id=self._next_id, text=texts[0], **common_kwargs)
+            common_kwargs = {name: getattr(first, name) for name in common_kwargs}
+            texts = [_normalize_text(text) for text in texts]
+
+        start = self._next_id
+        self._next_id += len(texts)
+        construct = Review.construct_trusted
+        return [
+            construct(id=review_id, text=text, **common_kwargs)
+            for review_id, text in zip(range(start, self._next_id), texts)
+        ]
+
+    def create_many(
+        self,
+        columns: dict[str, Sequence[Any]],
+        trusted: bool = False,
+        **common_kwargs,
+    ) -> list[Review]:
+        """
+        Create reviews from per-field columns.
+
+        Each column holds one value per review and must include "text".
+        Values are validated column by column, then the reviews are filled
+        one field at a time through the slot descriptors, with no per-review
+        keyword parsing. Fields missing from both columns and kwargs get
+        their defaults; default factories (scraped_at) are called once per
+        batch.
+
+        Args:
+            columns: Field name -> values, all of the same length
+            trusted: Values were already validated (e.g. ReviewColumns rows)
+            **common_kwargs: Fields shared by all reviews
+        """
+        texts = columns["text"]
+        n = len(texts)
+        if n == 0:
+            return []
+        if any(len(values) != n for values in columns.values()):
+            raise ValueError("All review columns must have the same length")
+        # IDs come from the factory, so "id" is not accepted either
+        unknown = (columns.keys() | common_kwargs.keys()) - (_REVIEW_FIELD_NAMES - {"id"})
+        if unknown:
+            raise TypeError(f"Unexpected review fields: {sorted(unknown)}")
+
+        if not trusted:
+            columns = dict(columns)
+            if not all(texts):
+                raise ValueError("Review text cannot be empty")
+            columns["text"] = list(map(_normalize_text, texts))
+            for rating in columns.get("rating", ()):
+                if rating is not None and not 0 <= rating <= 5:
+                    raise ValueError(f"Rating must be between 0 and 5, got {rating}")
+            for count in columns.get("helpful_count", ()):
+                if count is not None and count < 0:
+                    raise ValueError(f"Helpful count cannot be negative, got {count}")
+            for name in ("date", "scraped_at"):
+                if name in columns:
+                    columns[name] = [
+                        datetime.fromisoformat(v) if isinstance(v, str) else v
+                        for v in columns[name]
+                    ]
+            if common_kwargs:
+                # Validate (and normalize, e.g. ISO dates) the shared fields once
+                first = Review(id=self._next_id, text=columns["text"][0], **common_kwargs)
+                common_kwargs = {name: getattr(first, name) for name in common_kwargs}
+
+        start = self._next_id
+        self._next_id += n
+
+        new = object.__new__
+        reviews = [new(Review) for _ in range(n)]
+        for name, default, default_factory in _REVIEW_FIELDS:
+            if name == "id":
+                values = range(start, start + n)
+            elif name in columns:
+                values = columns[name]
+            elif name in common_kwargs:
+                values = repeat(common_kwargs[name], n)
+            elif default_factory is not MISSING:
+                values = repeat(default_factory(), n)
+            else:
+                values = repeat(default, n)
+            # Slot descriptor __set__ applied over the whole column in C
+            list(map(getattr(Review, name).__set__, reviews, values))
+        return reviews
 
     @property
     def next_id(self) -> int:
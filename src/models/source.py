@@ -1,11 +1,17 @@
 """Source configuration models."""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 class SourceCategory(BaseModel):
     """A category within a source with associated URLs."""
@@ -24,13 +30,10 @@ class Source(BaseModel):
     requires_browser: bool = False
     categories: list[SourceCategory] = Field(default_factory=list)
 
-    @property
-    def all_urls(self) -> list[str]:
-        """Get all URLs from all categories."""
-        urls = []
-        for category in self.categories:
-            urls.extend(category.urls)
-        return urls
+    @cached_property
+    def all_urls(self) -> tuple[str, ...]:
+        """Get all URLs from all categories (computed once; config is read-only)."""
+        return tuple(url for category in self.categories for url in category.urls)
 
     def get_urls_for_category(self, category_name: str) -> list[str]:
         """Get URLs for a specific category."""
@@ -47,26 +50,36 @@ class SourceConfig(BaseModel):
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> "SourceConfig":
-        """Load source configuration from a YAML file."""
+        """
+        Load source configuration from a YAML file.
+
+        Results are cached per file path and modification time, so repeated
+        loads of an unchanged file return the same object.
+        """
         path = Path(path)
         
         if not path.exists():
             raise FileNotFoundError(f"Source config file not found: {path}")
 
+        return _load_cached(path.resolve(), path.stat().st_mtime_ns)
+
+    @classmethod
+    def _parse_yaml(cls, path: Path) -> "SourceConfig":
+        """Parse a YAML file into a SourceConfig (trusted config, no validation)."""
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
 
         sources = {}
         for name, config in data.items():
             # Parse categories
             categories = []
             for cat_data in config.get("categories", []):
-                categories.append(SourceCategory(
+                categories.append(SourceCategory.model_construct(
                     name=cat_data.get("name", "default"),
                     urls=cat_data.get("urls", []),
                 ))
 
-            sources[name] = Source(
+            sources[name] = Source.model_construct(
                 name=name,
                 enabled=config.get("enabled", True),
                 scraper=config.get("scraper", f"{name}"),
@@ -75,7 +88,7 @@ class SourceConfig(BaseModel):
                 categories=categories,
             )
 
-        return cls(sources=sources)
+        return cls.model_construct(sources=sources)
 
     def get_enabled_sources(self) -> dict[str, Source]:
         """Get all enabled sources."""
@@ -85,13 +98,25 @@ class SourceConfig(BaseModel):
         """Get a source by name."""
         return self.sources.get(name)
 
-    def get_all_urls(self) -> list[tuple[str, str]]:
+    def get_all_urls(self) -> tuple[tuple[str, str], ...]:
         """Get all URLs from all enabled sources with source name."""
-        result = []
-        for name, source in self.get_enabled_sources().items():
-            for url in source.all_urls:
-                result.append((name, url))
-        return result
+        return self.all_urls
+
+    @cached_property
+    def all_urls(self) -> tuple[tuple[str, str], ...]:
+        """Flat (source name, URL) pairs, built once per loaded config."""
+        return tuple(
+            (name, url)
+            for name, source in self.sources.items()
+            if source.enabled
+            for url in source.all_urls
+        )
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path: Path, mtime_ns: int) -> SourceConfig:
+    """Parse a source config once per (path, mtime) pair."""
+    return SourceConfig._parse_yaml(path)
 
 
 def load_sources(config_path: str | Path | None = None) -> SourceConfig:
@@ -2,17 +2,15 @@
 
 from src.pipeline.cleaner import TextCleaner, clean_text
 from src.pipeline.deduplicator import Deduplicator
-from src.pipeline.language_filter import LanguageFilter
 from src.pipeline.validator import ReviewValidator, ValidationResult
-from src.pipeline.transformer import ReviewTransformer, Pipeline
+from src.pipeline.transformer import ReviewPipeline, PipelineBuilder
 
 __all__ = [
     "TextCleaner",
     "clean_text",
     "Deduplicator",
-    "LanguageFilter",
     "ReviewValidator",
     "ValidationResult",
-    "ReviewTransformer",
-    "Pipeline",
-]
\ No newline at end of file
+    "ReviewPipeline",
+    "PipelineBuilder",
+]
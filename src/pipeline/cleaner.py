@@ -0,0 +1,80 @@
+"""Text cleaning and normalization for review texts."""
+
+import html
+import re
+import unicodedata
+
+import ftfy
+
+from src.pipeline.deduplicator import text_hash
+
+# Only tag-shaped markup ("<p>", "</b>", "<br/>"), so a "<" or ">" in prose stays
+_HTML_TAG_RE = re.compile(r"</?[A-Za-z][^<>]*>")
+_SPACES_RE = re.compile(r"[ \t ]+")
+_SPACE_AROUND_NEWLINE_RE = re.compile(r" ?\n ?")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+class TextCleaner:
+    """
+    Cleans review text for training data.
+
+    Steps:
+    - Fix mojibake / broken encodings (ftfy)
+    - Strip leftover HTML tags, then decode HTML entities
+    - Unicode NFKC normalization
+    - Collapse runs of spaces and blank lines, keeping paragraph breaks
+    """
+
+    def __init__(
+        self,
+        fix_encoding: bool = True,
+        normalize_unicode: bool = True,
+        strip_html: bool = True,
+    ):
+        self.fix_encoding = fix_encoding
+        self.normalize_unicode = normalize_unicode
+        self.strip_html = strip_html
+
+    def clean(self, text: str) -> str:
+        """Clean a review text."""
+        if not text:
+            return ""
+
+        if self.fix_encoding:
+            # Entities are decoded below, after the tags are gone; ftfy would
+            # skip them whenever the text contains a "<"
+            text = ftfy.fix_text(text, unescape_html=False)
+        if self.strip_html:
+            text = _HTML_TAG_RE.sub(" ", text)
+            text = html.unescape(text)
+        if self.normalize_unicode:
+            text = unicodedata.normalize("NFKC", text)
+
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        text = _SPACES_RE.sub(" ", text)
+        text = _SPACE_AROUND_NEWLINE_RE.sub("\n", text)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
+        return text.strip()
+
+    def clean_and_hash(self, text: str) -> tuple[str, int, int]:
+        """
+        Clean a text and return it with its length and dedup hash.
+
+        Lets the pipeline clean, length-filter and deduplicate from a single
+        call instead of re-reading and re-hashing the text in each step.
+        The hash is the same one Deduplicator computes for the cleaned text.
+
+        Returns:
+            Tuple of (cleaned text, length, hash)
+        """
+        cleaned = self.clean(text)
+        return cleaned, len(cleaned), text_hash(cleaned)
+
+
+_default_cleaner = TextCleaner()
+
+
+def clean_text(text: str) -> str:
+    """Clean a text with the default TextCleaner settings."""
+    return _default_cleaner.clean(text)
@@ -0,0 +1,303 @@
+"""Duplicate detection for review texts."""
+
+import math
+import re
+
+import xxhash
+from loguru import logger
+
+# Rolling hash over token shingles (Rabin-Karp)
+_SHINGLE_BASE = 60013
+_SHINGLE_MOD = 10**18 + 3
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def normalize_for_hash(text: str) -> str:
+    """Normalize text so trivial case/whitespace differences hash the same."""
+    return " ".join(text.lower().split())
+
+
+def text_hash(text: str) -> int:
+    """128-bit hash of the normalized text."""
+    return xxhash.xxh3_128_intdigest(normalize_for_hash(text).encode())
+
+
+def shingle_hashes(text: str, size: int = 32) -> list[int]:
+    """
+    Hashes of all windows of ``size`` consecutive word tokens.
+
+    Uses a Rabin-Karp rolling hash, so each window after the first costs
+    O(1) instead of re-hashing ``size`` tokens. Texts shorter than one
+    window have no shingles.
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) < size:
+        return []
+
+    base, mod = _SHINGLE_BASE, _SHINGLE_MOD
+    codes = [xxhash.xxh3_64_intdigest(token.encode()) % mod for token in tokens]
+    top = pow(base, size - 1, mod)  # Weight of the token leaving the window
+
+    h = 0
+    for code in codes[:size]:
+        h = (h * base + code) % mod
+    result = [h]
+    for old, new in zip(codes, codes[size:]):
+        h = ((h - old * top) * base + new) % mod
+        result.append(h)
+    return result
+
+
+def _spread(h: int) -> int:
+    """Spread a ~60-bit shingle hash over 128 bits for BloomFilter's double hashing."""
+    return (h * 0x9E3779B97F4A7C15) & ((1 << 128) - 1)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over 128-bit hashes.
+
+    Uses double hashing (low/high 64 bits of the hash) to derive the k bit
+    positions, so each membership test or insert costs one hash of the text.
+    Memory is bounded by the configured capacity, at the cost of a small
+    false-positive rate (a unique review occasionally reported as duplicate).
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, h: int) -> list[int]:
+        """Bit positions for a 128-bit hash."""
+        h1 = h & 0xFFFFFFFFFFFFFFFF
+        h2 = (h >> 64) | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.num_hashes)]
+
+    def contains(self, h: int) -> bool:
+        """Check whether a hash was (probably) added."""
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(h))
+
+    def add(self, h: int) -> None:
+        """Add a hash to the filter."""
+        bits = self._bits
+        for p in self._positions(h):
+            bits[p >> 3] |= 1 << (p & 7)
+
+    def add_new(self, hashes: list[int]) -> list[bool]:
+        """
+        Test-and-add a batch of hashes in one pass.
+
+        Returns one flag per hash: True if it was not (probably) in the
+        filter yet, in which case it is added. Same result as calling
+        contains() then add() per hash, without the per-hash method calls
+        and with the bit positions computed only once.
+        """
+        bits = self._bits
+        size = self.size
+        rounds = range(self.num_hashes)
+        result = []
+        for h in hashes:
+            h1 = h & 0xFFFFFFFFFFFFFFFF
+            h2 = (h >> 64) | 1
+            positions = [(h1 + i * h2) % size for i in rounds]
+            if all(bits[p >> 3] & (1 << (p & 7)) for p in positions):
+                result.append(False)
+                continue
+            for p in positions:
+                bits[p >> 3] |= 1 << (p & 7)
+            result.append(True)
+        return result
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._bits = bytearray(len(self._bits))
+
+
+class Deduplicator:
+    """
+    Detects duplicate reviews.
+
+    Exact duplicates (after case/whitespace normalization) are found by a
+    128-bit xxhash of the text; only hashes are kept, never the texts
+    themselves. By default hashes go into a set (exact, memory grows with
+    the number of unique reviews). With ``use_bloom=True`` they go into a
+    Bloom filter of fixed size for unbounded streams.
+
+    With ``near_duplicates=True``, texts are also split into overlapping
+    windows of ``shingle_size`` words (see shingle_hashes). A text sharing
+    at least ``min_shared_shingles`` windows with earlier texts counts as a
+    duplicate, which catches template reviews with small edits. Near
+    duplicate checks need the text, so the hash-only methods
+    (is_duplicate_hash, filter_new_hashes) stay exact.
+    """
+
+    def __init__(
+        self,
+        use_bloom: bool = False,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        near_duplicates: bool = False,
+        shingle_size: int = 32,
+        min_shared_shingles: int = 4,
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            use_bloom: Store hashes in a fixed-size Bloom filter instead of a set
+            capacity: Expected number of unique reviews (Bloom filter sizing)
+            error_rate: Target false-positive rate (Bloom filter sizing)
+            near_duplicates: Also detect near-duplicates via word shingles
+            shingle_size: Words per shingle window
+            min_shared_shingles: Shared windows needed to count as a near-duplicate
+        """
+        self.use_bloom = use_bloom
+        self.near_duplicates = near_duplicates
+        self.shingle_size = shingle_size
+        self.min_shared_shingles = min_shared_shingles
+        self._seen: set[int] = set()
+        self._bloom = BloomFilter(capacity, error_rate) if use_bloom else None
+        self._shingles: set[int] = set()
+        # Many shingles per review, so size the filter for several per text
+        self._shingle_bloom = (
+            BloomFilter(capacity * 8, error_rate) if use_bloom and near_duplicates else None
+        )
+        self._count = 0
+
+    def is_duplicate(self, text: str) -> bool:
+        """Check if a text (or, with near_duplicates, a close variant) has been seen."""
+        if self._contains(text_hash(text)):
+            return True
+        return self.near_duplicates and self._is_near(shingle_hashes(text, self.shingle_size))
+
+    def add(self, text: str) -> None:
+        """Mark a text as seen."""
+        self._insert(text_hash(text))
+        if self.near_duplicates:
+            self._add_shingles(shingle_hashes(text, self.shingle_size))
+
+    def check_new(self, text: str, h: int | None = None) -> bool:
+        """
+        Check a text and record it if it is new.
+
+        Args:
+            text: Review text
+            h: Precomputed text_hash(text), if available
+
+        Returns:
+            True if the text is new, False if it is a duplicate
+        """
+        if h is None:
+            h = text_hash(text)
+        if self._contains(h):
+            return False
+        if self.near_duplicates:
+            shingles = shingle_hashes(text, self.shingle_size)
+            if self._is_near(shingles):
+                return False
+            self._add_shingles(shingles)
+        self._store(h)
+        return True
+
+    def is_duplicate_hash(self, h: int) -> bool:
+        """Check a precomputed text_hash() value (see TextCleaner.clean_and_hash)."""
+        return self._contains(h)
+
+    def add_hash(self, h: int) -> None:
+        """Mark a precomputed text_hash() value as seen."""
+        self._insert(h)
+
+    def filter_new(self, texts: list[str], hashes: list[int] | None = None) -> list[bool]:
+        """
+        Check and record a batch of texts in one pass.
+
+        Returns one flag per text: True if it is new (including the first
+        occurrence of a duplicate within the batch), False if it was seen.
+        New texts are recorded as seen.
+
+        Args:
+            texts: Review texts
+            hashes: Precomputed text_hash() values for ``texts``, if available
+        """
+        if hashes is None:
+            hashes = list(map(text_hash, texts))
+        if not self.near_duplicates:
+            return self.filter_new_hashes(hashes)
+        return list(map(self.check_new, texts, hashes))
+
+    def filter_new_hashes(self, hashes: list[int]) -> list[bool]:
+        """Same as filter_new(), for precomputed text_hash() values."""
+        if self._bloom is None:
+            # Set backend: test and insert inline, without a method call per hash
+            seen = self._seen
+            add = seen.add
+            before = len(seen)
+            # set.add returns None, so "not add(h)" records h and yields True
+            result = [h not in seen and not add(h) for h in hashes]
+            self._count += len(seen) - before
+            return result
+
+        result = self._bloom.add_new(hashes)
+        self._count += sum(result)
+        return result
+
+    def _is_near(self, shingles: list[int]) -> bool:
+        """Check whether enough shingles were seen before."""
+        if not shingles:
+            return False
+        needed = min(self.min_shared_shingles, len(shingles))
+        if self._shingle_bloom is not None:
+            contains = self._shingle_bloom.contains
+            shingles = [_spread(s) for s in shingles]
+        else:
+            contains = self._shingles.__contains__
+        shared = 0
+        for s in shingles:
+            if contains(s):
+                shared += 1
+                if shared >= needed:
+                    return True
+        return False
+
+    def _add_shingles(self, shingles: list[int]) -> None:
+        if self._shingle_bloom is not None:
+            for s in shingles:
+                self._shingle_bloom.add(_spread(s))
+        else:
+            self._shingles.update(shingles)
+
+    def _contains(self, h: int) -> bool:
+        if self._bloom is not None:
+            return self._bloom.contains(h)
+        return h in self._seen
+
+    def _insert(self, h: int) -> None:
+        if not self._contains(h):
+            self._store(h)
+
+    def _store(self, h: int) -> None:
+        if self._bloom is not None:
+            self._bloom.add(h)
+        else:
+            self._seen.add(h)
+        self._count += 1
+
+    def __len__(self) -> int:
+        """Number of unique texts recorded."""
+        return self._count
+
+    def reset(self) -> None:
+        """Forget all seen texts."""
+        self._seen.clear()
+        self._shingles.clear()
+        if self._bloom is not None:
+            self._bloom.clear()
+        if self._shingle_bloom is not None:
+            self._shingle_bloom.clear()
+        self._count = 0
+        logger.debug("Deduplicator reset")
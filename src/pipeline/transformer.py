@@ -4,10 +4,22 @@ from typing import AsyncIterator, Callable
 
 from loguru import logger
 
-from src.models.review import Review
+from src.models.review import Review, ReviewColumns, ReviewFactory
 from src.pipeline.cleaner import TextCleaner
 from src.pipeline.deduplicator import Deduplicator
 
+# Pipeline counters: a list indexed by these constants, exposed as a dict
+# by get_stats(), so hot-path increments skip dict hashing
+_STAT_KEYS = (
+    "input",
+    "cleaned",
+    "deduplicated",
+    "filtered_length",
+    "filtered_quality",
+    "output",
+)
+_INPUT, _CLEANED, _DEDUPLICATED, _FILTERED_LENGTH, _FILTERED_QUALITY, _OUTPUT = range(len(_STAT_KEYS))
+
 
 class ReviewPipeline:
     """
@@ -26,6 +38,7 @@ class ReviewPipeline:
         max_length: int = 10000,
         dedupe: bool = True,
         clean: bool = True,
+        near_duplicates: bool = False,
     ):
         """
         Initialize the pipeline.
@@ -35,6 +48,7 @@ class ReviewPipeline:
             max_length: Maximum review text length
             dedupe: Enable deduplication
             clean: Enable text cleaning
+            near_duplicates: Also drop near-duplicates (see Deduplicator)
         """
         self.min_length = min_length
         self.max_length = max_length
@@ -42,18 +56,11 @@ class ReviewPipeline:
         self.clean = clean
 
         self._cleaner = TextCleaner()
-        self._deduplicator = Deduplicator()
+        self._deduplicator = Deduplicator(near_duplicates=near_duplicates)
         self._transforms: list[Callable[[Review], Review | None]] = []
         
-        # Stats
-        self._stats = {
-            "input": 0,
-            "cleaned": 0,
-            "deduplicated": 0,
-            "filtered_length": 0,
-            "filtered_quality": 0,
-            "output": 0,
-        }
+        # Stats, indexed by the _INPUT.._OUTPUT constants (see get_stats)
+        self._stats = [0] * len(_STAT_KEYS)
 
     def add_transform(self, transform: Callable[[Review], Review | None]) -> "ReviewPipeline":
         """
@@ -76,48 +83,144 @@ class ReviewPipeline:
         """
         Process a list of reviews through the pipeline.
 
+        Cleaning and length filtering run over the whole batch first, then
+        deduplication checks all surviving texts in one pass.
+
         Args:
             reviews: Input reviews
 
         Returns:
             Processed reviews
         """
-        self._stats["input"] += len(reviews)
-        result = []
+        stats = self._stats
+        stats[_INPUT] += len(reviews)
+        min_length, max_length = self.min_length, self.max_length
+
+        # Step 1-2: Clean text (and hash it for dedup) and filter by length.
+        # One specialized loop per configuration, so the per-review loop
+        # carries no branches for disabled steps.
+        hashes = None
+        if not self.clean:
+            candidates = [r for r in reviews if min_length <= len(r.text) <= max_length]
+        elif not self.dedupe:
+            clean = self._cleaner.clean
+            candidates = []
+            for review in reviews:
+                review.text = text = clean(review.text)
+                if min_length <= len(text) <= max_length:
+                    candidates.append(review)
+        else:
+            clean_and_hash = self._cleaner.clean_and_hash
+            candidates = []
+            hashes = []
+            for review in reviews:
+                review.text, text_len, text_h = clean_and_hash(review.text)
+                if min_length <= text_len <= max_length:
+                    candidates.append(review)
+                    hashes.append(text_h)
 
-        for review in reviews:
-            processed = self._process_one(review)
-            if processed:
-                result.append(processed)
+        if self.clean:
+            stats[_CLEANED] += len(reviews)
+        stats[_FILTERED_LENGTH] += len(reviews) - len(candidates)
+
+        # Step 3: Deduplication (one batched membership pass)
+        if self.dedupe and candidates:
+            is_new = self._deduplicator.filter_new([r.text for r in candidates], hashes)
+            unique = [r for r, new in zip(candidates, is_new) if new]
+            stats[_DEDUPLICATED] += len(candidates) - len(unique)
+            candidates = unique
+
+        # Step 4: Custom transforms
+        result = self._apply_transforms(candidates)
+        stats[_OUTPUT] += len(result)
+        return result
+
+    def process_columns(self, columns: ReviewColumns, factory: ReviewFactory) -> list[Review]:
+        """
+        Process column-stored reviews, creating Review objects only for survivors.
+
+        Cleaning, length filtering and deduplication run over
+        ``columns.texts`` alone. Only the rows that pass become Review
+        objects (with IDs from ``factory``), and then go through the custom
+        transforms. Cleaned texts are written back into ``columns``.
+
+        Args:
+            columns: Parsed reviews from a scraper
+            factory: Assigns IDs to the surviving reviews
+
+        Returns:
+            Processed reviews
+        """
+        texts = columns.texts
+        self._stats[_INPUT] += len(texts)
+
+        # Step 1: Clean text
+        if self.clean:
+            clean = self._cleaner.clean
+            texts[:] = [clean(text) for text in texts]
+            self._stats[_CLEANED] += len(texts)
+
+        # Step 2: Length filter
+        min_length, max_length = self.min_length, self.max_length
+        rows = [i for i, n in enumerate(map(len, texts)) if min_length <= n <= max_length]
+        self._stats[_FILTERED_LENGTH] += len(texts) - len(rows)
+
+        # Step 3: Deduplication (one batched membership pass)
+        if self.dedupe and rows:
+            is_new = self._deduplicator.filter_new(list(map(texts.__getitem__, rows)))
+            unique = [i for i, new in zip(rows, is_new) if new]
+            self._stats[_DEDUPLICATED] += len(rows) - len(unique)
+            rows = unique
 
-        self._stats["output"] += len(result)
+        # Step 4: Custom transforms
+        result = self._apply_transforms(columns.to_reviews(factory, rows))
+        self._stats[_OUTPUT] += len(result)
+        return result
+
+    def _apply_transforms(self, reviews: list[Review]) -> list[Review]:
+        """Run the custom transforms, dropping reviews a transform rejects."""
+        if not self._transforms:
+            return reviews
+
+        result = []
+        for review in reviews:
+            for transform in self._transforms:
+                review = transform(review)
+                if review is None:
+                    self._stats[_FILTERED_QUALITY] += 1
+                    break
+            else:
+                result.append(review)
         return result
 
     def _process_one(self, review: Review) -> Review | None:
         """Process a single review."""
         # Step 1: Clean text
+        text_h = None
+        if self.clean and self.dedupe:
+            review.text, text_len, text_h = self._cleaner.clean_and_hash(review.text)
+        else:
+            if self.clean:
+                review.text = self._cleaner.clean(review.text)
+            text_len = len(review.text)
         if self.clean:
-            review.text = self._cleaner.clean(review.text)
-            self._stats["cleaned"] += 1
+            self._stats[_CLEANED] += 1
 
         # Step 2: Length filter
-        text_len = len(review.text)
         if text_len < self.min_length or text_len > self.max_length:
-            self._stats["filtered_length"] += 1
+            self._stats[_FILTERED_LENGTH] += 1
             return None
 
         # Step 3: Deduplication
-        if self.dedupe:
-            if self._deduplicator.is_duplicate(review.text):
-                self._stats["deduplicated"] += 1
-                return None
-            self._deduplicator.add(review.text)
+        if self.dedupe and not self._deduplicator.check_new(review.text, text_h):
+            self._stats[_DEDUPLICATED] += 1
+            return None
 
         # Step 4: Custom transforms
         for transform in self._transforms:
             review = transform(review)
             if review is None:
-                self._stats["filtered_quality"] += 1
+                self._stats[_FILTERED_QUALITY] += 1
                 return None
 
         return review
@@ -135,19 +238,65 @@ class ReviewPipeline:
         Yields:
             Processed reviews
         """
+        stats = self._stats
+        if not (self.clean or self.dedupe or self._transforms):
+            # Length filter only: skip the general per-review path
+            min_length, max_length = self.min_length, self.max_length
+            async for review in reviews:
+                stats[_INPUT] += 1
+                if min_length <= len(review.text) <= max_length:
+                    stats[_OUTPUT] += 1
+                    yield review
+                else:
+                    stats[_FILTERED_LENGTH] += 1
+            return
+
         async for review in reviews:
+            stats[_INPUT] += 1
             processed = self._process_one(review)
             if processed:
+                stats[_OUTPUT] += 1
+                yield processed
+
+    async def process_stream_batched(
+        self,
+        reviews: AsyncIterator[Review],
+        batch_size: int = 256,
+    ) -> AsyncIterator[Review]:
+        """
+        Process reviews as an async stream in batches.
+
+        Buffers up to ``batch_size`` reviews and runs them through
+        process(), so cleaning and deduplication work on whole batches.
+        Output is delayed until a batch fills (or the stream ends); use
+        process_stream() when per-review latency matters.
+
+        Args:
+            reviews: Async iterator of reviews
+            batch_size: Number of reviews per batch
+
+        Yields:
+            Processed reviews
+        """
+        batch: list[Review] = []
+        async for review in reviews:
+            batch.append(review)
+            if len(batch) >= batch_size:
+                for processed in self.process(batch):
+                    yield processed
+                batch = []
+
+        if batch:
+            for processed in self.process(batch):
                 yield processed
 
     def get_stats(self) -> dict[str, int]:
         """Get processing statistics."""
-        return self._stats.copy()
+        return dict(zip(_STAT_KEYS, self._stats))
 
     def reset_stats(self) -> None:
         """Reset statistics."""
-        for key in self._stats:
-            self._stats[key] = 0
+        self._stats[:] = [0] * len(_STAT_KEYS)
 
     def reset_deduplicator(self) -> None:
         """Reset the deduplicator state."""
@@ -162,6 +311,7 @@ class PipelineBuilder:
         self._max_length = 10000
         self._dedupe = True
         self._clean = True
+        self._near_duplicates = False
         self._transforms = []
 
     def min_length(self, length: int) -> "PipelineBuilder":
@@ -184,6 +334,11 @@ class PipelineBuilder:
         self._clean = False
         return self
 
+    def near_duplicates(self) -> "PipelineBuilder":
+        """Also drop near-duplicate reviews (shared word shingles)."""
+        self._near_duplicates = True
+        return self
+
     def add_transform(self, transform: Callable[[Review], Review | None]) -> "PipelineBuilder":
         """Add a custom transform."""
         self._transforms.append(transform)
@@ -218,6 +373,7 @@ class PipelineBuilder:
             max_length=self._max_length,
             dedupe=self._dedupe,
             clean=self._clean,
+            near_duplicates=self._near_duplicates,
         )
         for transform in self._transforms:
             pipeline.add_transform(transform)
@@ -1,12 +1,73 @@
 """Review validation for quality control."""
 
 import re
+import string
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
 from loguru import logger
 
+# Spam indicators, in reporting order
+_SPAM_PATTERNS = (
+    r"click\s+here",
+    r"buy\s+now",
+    r"free\s+money",
+    r"make\s+\$[0-9]+",
+    r"work\s+from\s+home",
+    r"(?-i:https?://\S+\s*https?://)",  # Multiple URLs (case-sensitive)
+)
+
+# All spam indicators as one alternation, so a text is scanned once instead
+# of once per pattern. Group n (1-based) is _SPAM_PATTERNS[n - 1]. The
+# indicators are plain ASCII, so re.ASCII keeps \s and case folding on the
+# ASCII tables (cleaned texts have non-ASCII spaces normalized already).
+_SPAM_RE = re.compile(
+    "|".join(f"({p})" for p in _SPAM_PATTERNS),
+    re.IGNORECASE | re.ASCII,
+)
+_SPAM_MESSAGES = tuple(f"Potential spam detected: {p}" for p in _SPAM_PATTERNS)
+
+# Whole-text placeholders (case-insensitive, trailing whitespace ignored)
+_PLACEHOLDERS = frozenset({"test", "n/a", "."})
+_PLACEHOLDER_MAX_LEN = max(map(len, _PLACEHOLDERS))
+
+
+def _looks_placeholder(text: str) -> bool:
+    """
+    Check for placeholder texts: "test", "n/a", ".", only dashes, or
+    starting with "lorem ipsum".
+
+    One set lookup and a few prefix checks instead of a regex per pattern.
+    """
+    text = text.rstrip()
+    if len(text) <= _PLACEHOLDER_MAX_LEN and text.lower() in _PLACEHOLDERS:
+        return True
+    if text and not text.strip("-"):
+        return True
+    # "lorem" + whitespace + "ipsum" at the start
+    rest = text[5:]
+    return (
+        text[:5].lower() == "lorem"
+        and rest[:1].isspace()
+        and rest.lstrip()[:5].lower() == "ipsum"
+    )
+
+
+_REPEATED_CHAR_RE = re.compile(r"(.)\1{4,}")
+
+_ASCII_UPPER = string.ascii_uppercase.encode()
+
+
+def _count_upper(text: str) -> int:
+    """Count uppercase characters without a per-character Python loop."""
+    if text.isascii():
+        # bytes.translate deletes A-Z in one C pass; the length difference is the count
+        data = text.encode("ascii")
+        return len(data) - len(data.translate(None, _ASCII_UPPER))
+    return sum(map(str.isupper, text))
+
 
 class ValidationLevel(str, Enum):
     """Validation result levels."""
@@ -15,7 +76,7 @@ class ValidationLevel(str, Enum):
     FAIL = "fail"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of a validation check."""
     level: ValidationLevel
@@ -32,6 +93,11 @@ class ValidationResult:
         return self.level == ValidationLevel.FAIL
 
 
+# Returned by the check helpers when nothing fires, so clean reviews
+# allocate no per-check result lists
+_EMPTY: tuple[ValidationResult, ...] = ()
+
+
 class ReviewValidator:
     """
     Validates reviews for quality and completeness.
@@ -55,16 +121,6 @@ class ReviewValidator:
         self.require_rating = require_rating
         self.check_spam = check_spam
 
-        # Spam patterns
-        self._spam_patterns = [
-            r"(?i)click\s+here",
-            r"(?i)buy\s+now",
-            r"(?i)free\s+money",
-            r"(?i)make\s+\$\d+",
-            r"(?i)work\s+from\s+home",
-            r"https?://[^\s]+\s*https?://",  # Multiple URLs
-        ]
-
     def validate(self, review) -> list[ValidationResult]:
         """
         Validate a review.
@@ -101,19 +157,23 @@ class ReviewValidator:
         results = self.validate(review)
         return not any(r.failed for r in results)
 
-    def _validate_text(self, text: str) -> list[ValidationResult]:
+    def _validate_text(self, text: str) -> Sequence[ValidationResult]:
         """Validate review text."""
-        results = []
-
         if not text:
-            results.append(ValidationResult(
+            return [ValidationResult(
                 level=ValidationLevel.FAIL,
                 message="Text is empty",
                 field="text",
-            ))
-            return results
+            )]
 
         length = len(text)
+        # Check for placeholder text
+        placeholder = _looks_placeholder(text)
+
+        if not placeholder and self.min_length <= length <= self.max_length:
+            return _EMPTY
+
+        results = []
 
         if length < self.min_length:
             results.append(ValidationResult(
@@ -130,63 +190,58 @@ class ReviewValidator:
                 value=length,
             ))
 
-        # Check for placeholder text
-        placeholder_patterns = [
-            r"^test\s*$",
-            r"^lorem\s+ipsum",
-            r"^n/a\s*$",
-            r"^\.\s*$",
-            r"^-+\s*$",
-        ]
-        for pattern in placeholder_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                results.append(ValidationResult(
-                    level=ValidationLevel.FAIL,
-                    message="Text appears to be placeholder",
-                    field="text",
-                ))
-                break
+        if placeholder:
+            results.append(ValidationResult(
+                level=ValidationLevel.FAIL,
+                message="Text appears to be placeholder",
+                field="text",
+            ))
 
         return results
 
-    def _validate_rating(self, rating: float) -> list[ValidationResult]:
+    def _validate_rating(self, rating: float) -> Sequence[ValidationResult]:
         """Validate rating value."""
-        results = []
-
         if rating < 0 or rating > 5:
-            results.append(ValidationResult(
+            return [ValidationResult(
                 level=ValidationLevel.FAIL,
                 message=f"Rating out of range (0-5): {rating}",
                 field="rating",
                 value=rating,
-            ))
+            )]
 
-        return results
+        return _EMPTY
 
-    def _check_spam(self, text: str) -> list[ValidationResult]:
+    def _check_spam(self, text: str) -> Sequence[ValidationResult]:
         """Check for spam indicators."""
+        spam = _SPAM_RE.search(text)
+        caps_ratio = _count_upper(text) / len(text) if len(text) > 20 else 0.0
+        repeated = _REPEATED_CHAR_RE.search(text)
+
+        if spam is None and caps_ratio <= 0.5 and repeated is None:
+            return _EMPTY
+
         results = []
 
-        for pattern in self._spam_patterns:
-            if re.search(pattern, text):
+        if spam is not None:
+            # One warning per distinct indicator, in pattern order
+            matched = {m.lastindex for m in _SPAM_RE.finditer(text, spam.start())}
+            for group in sorted(matched):
                 results.append(ValidationResult(
                     level=ValidationLevel.WARNING,
-                    message=f"Potential spam detected: {pattern}",
+                    message=_SPAM_MESSAGES[group - 1],
                     field="text",
                 ))
 
         # Check for excessive caps
-        if len(text) > 20:
-            caps_ratio = sum(1 for c in text if c.isupper()) / len(text)
-            if caps_ratio > 0.5:
-                results.append(ValidationResult(
-                    level=ValidationLevel.WARNING,
-                    message=f"Excessive caps ({caps_ratio:.0%})",
-                    field="text",
-                ))
+        if caps_ratio > 0.5:
+            results.append(ValidationResult(
+                level=ValidationLevel.WARNING,
+                message=f"Excessive caps ({caps_ratio:.0%})",
+                field="text",
+            ))
 
         # Check for repetitive characters
-        if re.search(r"(.)\1{4,}", text):
+        if repeated is not None:
             results.append(ValidationResult(
                 level=ValidationLevel.WARNING,
                 message="Repetitive characters detected",
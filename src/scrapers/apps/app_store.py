@@ -1,12 +1,17 @@
 """Apple App Store review scraper using app-store-scraper library."""
 
 import asyncio
+import re
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 
 from loguru import logger
 
 from src.core.base_scraper import BaseScraper
-from src.models.review import Review, ReviewFactory
+from src.models.review import Review, ReviewColumns, ReviewFactory
+from src.utils.async_utils import use_shared_executor
+from src.utils.text_utils import intern_text
 
 # Try to import the library
 try:
@@ -16,6 +21,12 @@ except ImportError:
     HAS_LIBRARY = False
     logger.warning("app-store-scraper not installed. Run: pip install app-store-scraper")
 
+_APP_URL_RE = re.compile(r"/app/([^/]+)/id(\d+)")
+
+# Review dict fields used by _parse_columns, fetched with one itemgetter call
+_REVIEW_KEYS = ('title', 'review', 'rating', 'date', 'userName')
+_get_review_fields = itemgetter(*_REVIEW_KEYS)
+
 
 class AppStoreScraper(BaseScraper):
     """
@@ -61,79 +72,99 @@ class AppStoreScraper(BaseScraper):
         
         try:
             # Run in thread pool since library is synchronous
-            loop = asyncio.get_event_loop()
+            use_shared_executor()
             
             # Create app store scraper
             app = AppStore(country='de', app_name=app_name, app_id=app_id)
             
             # Fetch reviews
             count = max_reviews or 500
-            await loop.run_in_executor(
-                None,
-                lambda: app.review(how_many=count)
-            )
+            await asyncio.to_thread(app.review, how_many=count)
             
-            reviews_list = self._parse_reviews(app.reviews, app_name)
+            # Parsing stops at max_reviews instead of truncating afterwards
+            reviews_list = self._parse_reviews(app.reviews, app_name, limit=max_reviews)
             logger.info(f"[{self.name}] Collected {len(reviews_list)} reviews")
             
-            if max_reviews:
-                reviews_list = reviews_list[:max_reviews]
-                
             return reviews_list
 
         except Exception as e:
             logger.error(f"[{self.name}] Error scraping {app_name}: {e}")
             return []
 
-    def _parse_reviews(self, raw_reviews: list[dict], app_name: str) -> list[Review]:
+    def _parse_reviews(
+        self,
+        raw_reviews: list[dict],
+        app_name: str,
+        limit: int | None = None,
+    ) -> list[Review]:
         """Parse reviews from library response."""
-        reviews_list = []
+        return self._parse_columns(raw_reviews, app_name, limit).to_reviews(self._review_factory)
+
+    def _parse_columns(
+        self,
+        raw_reviews: list[dict],
+        app_name: str,
+        limit: int | None = None,
+    ) -> ReviewColumns:
+        """
+        Parse reviews from library response into columns.
+
+        Feed the result to ReviewPipeline.process_columns to create Review
+        objects only for reviews that survive cleaning, length and dedup.
+        Parsing stops once ``limit`` reviews were collected.
+        """
+        columns = ReviewColumns(
+            source=self.name,
+            source_url=f"https://apps.apple.com/de/app/{app_name}",
+        )
+        
+        name = self.name
+        append = columns.append
+        get_fields = _get_review_fields
         
         for item in raw_reviews:
             try:
+                try:
+                    title, content, rating, date, author = get_fields(item)
+                except KeyError:
+                    # Some library versions omit keys
+                    title, content, rating, date, author = map(item.get, _REVIEW_KEYS)
+                
                 # Get review text (title + review content)
-                title = item.get('title', '').strip()
-                content = item.get('review', '').strip()
+                title = title.strip() if title else ''
+                content = content.strip() if content else ''
                 
                 if title and content:
                     text = f"{title}\n\n{content}"
                 else:
                     text = content or title
                     
-                if not text or len(text) < 5:
+                if len(text) < 5:
                     continue
+                text = intern_text(text)
                 
-                # Rating (1-5 scale)
-                rating = item.get('rating')
-                
-                # Date
-                date = item.get('date')
-                
-                # Author
-                author = item.get('userName')
-                
-                review = self._review_factory.create(
-                    text=text,
-                    source=self.name,
-                    source_url=f"https://apps.apple.com/de/app/{app_name}",
-                    rating=float(rating) if rating else None,
+                append(
+                    text,
+                    rating=float(rating) if rating else None,  # 1-5 scale
                     date=date,
                     author=author,
                 )
-                reviews_list.append(review)
                 
             except Exception as e:
-                logger.debug(f"[{self.name}] Error parsing review: {e}")
+                logger.debug(f"[{name}] Error parsing review: {e}")
                 continue
+            
+            if limit and len(columns) >= limit:
+                break
         
-        return reviews_list
+        return columns
 
-    def _parse_app_info(self, url: str) -> tuple[str | None, int | None]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse_app_info(url: str) -> tuple[str | None, int | None]:
         """Extract app name and ID from URL or input."""
-        import re
-        
         # If it's a full URL: https://apps.apple.com/de/app/adac/id397267553
-        match = re.search(r'/app/([^/]+)/id(\d+)', url)
+        match = _APP_URL_RE.search(url)
         if match:
             return match.group(1), int(match.group(2))
         
@@ -1,12 +1,18 @@
 """Google Play Store app review scraper using google-play-scraper library."""
 
 import asyncio
+import re
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 
 from loguru import logger
 
 from src.core.base_scraper import BaseScraper
-from src.models.review import Review, ReviewFactory
+from src.models.review import Review, ReviewColumns, ReviewFactory
+from src.utils.async_utils import use_shared_executor
+from src.utils.cache_utils import SeenIds
+from src.utils.text_utils import intern_text
 
 # Try to import the library
 try:
@@ -16,6 +22,29 @@ except ImportError:
     HAS_LIBRARY = False
     logger.warning("google-play-scraper not installed. Run: pip install google-play-scraper")
 
+_PKG_RE = re.compile(r"[?&]id=([^&]+)")
+
+# Review dict fields used by _parse_columns, fetched with one itemgetter call
+_REVIEW_KEYS = ('content', 'score', 'at', 'userName', 'thumbsUpCount', 'reviewId')
+_get_review_fields = itemgetter(*_REVIEW_KEYS)
+
+# Date shapes fromisoformat accepts: YYYY-MM-DD with optional time and UTC offset
+_ISO_DATE_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:?\d{2})?)?"
+)
+
+
+def _parse_date(value: str) -> datetime | None:
+    """Parse an ISO date string, or None if it is not one."""
+    # Reject other shapes up front instead of raising and catching per review
+    if not _ISO_DATE_RE.fullmatch(value):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:  # Right shape, out-of-range field (e.g. month 13)
+        return None
+
 
 class GooglePlayScraper(BaseScraper):
     """
@@ -33,6 +62,8 @@ class GooglePlayScraper(BaseScraper):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._review_factory = ReviewFactory()
+        # Review IDs already parsed by this scraper (skips repeats across calls)
+        self._seen_ids = SeenIds()
         
         if not HAS_LIBRARY:
             logger.error("google-play-scraper library not installed!")
@@ -40,6 +71,10 @@ class GooglePlayScraper(BaseScraper):
     async def scrape_reviews(self, url: str, max_reviews: int | None = None) -> list[Review]:
         """
         Scrape reviews from Google Play Store.
+
+        Review IDs are remembered per scraper instance, so scraping the same
+        package again with this scraper only returns reviews not seen
+        before. Call reset_seen_ids() first to get the full set again.
         
         Args:
             url: Google Play app URL or package ID (e.g., de.adac.android)
@@ -61,93 +96,114 @@ class GooglePlayScraper(BaseScraper):
         
         try:
             # Run in thread pool since library is synchronous
-            loop = asyncio.get_event_loop()
+            use_shared_executor()
             
             if max_reviews and max_reviews <= 200:
                 # Use single batch for small requests
-                result, _ = await loop.run_in_executor(
-                    None,
-                    lambda: reviews(
-                        package_id,
-                        lang='de',
-                        country='de',
-                        sort=Sort.NEWEST,
-                        count=max_reviews,
-                    )
+                result, _ = await asyncio.to_thread(
+                    reviews,
+                    package_id,
+                    lang='de',
+                    country='de',
+                    sort=Sort.NEWEST,
+                    count=max_reviews,
                 )
             else:
                 # Use reviews_all for larger requests
                 count = max_reviews or 5000
-                result = await loop.run_in_executor(
-                    None,
-                    lambda: reviews_all(
-                        package_id,
-                        lang='de',
-                        country='de',
-                        sort=Sort.NEWEST,
-                        count=count,
-                    )
+                result = await asyncio.to_thread(
+                    reviews_all,
+                    package_id,
+                    lang='de',
+                    country='de',
+                    sort=Sort.NEWEST,
+                    count=count,
                 )
             
-            reviews_list = self._parse_reviews(result, package_id)
+            # Parsing stops at max_reviews instead of truncating afterwards
+            reviews_list = self._parse_reviews(result, package_id, limit=max_reviews)
             logger.info(f"[{self.name}] Collected {len(reviews_list)} reviews")
             
-            if max_reviews:
-                reviews_list = reviews_list[:max_reviews]
-                
             return reviews_list
 
         except Exception as e:
             logger.error(f"[{self.name}] Error scraping {package_id}: {e}")
             return []
 
-    def _parse_reviews(self, raw_reviews: list[dict], package_id: str) -> list[Review]:
+    def reset_seen_ids(self) -> None:
+        """Forget the review IDs seen so far, so a rescrape returns them again."""
+        self._seen_ids.clear()
+
+    def _parse_reviews(
+        self,
+        raw_reviews: list[dict],
+        package_id: str,
+        limit: int | None = None,
+    ) -> list[Review]:
         """Parse reviews from library response."""
-        reviews_list = []
+        return self._parse_columns(raw_reviews, package_id, limit).to_reviews(self._review_factory)
+
+    def _parse_columns(
+        self,
+        raw_reviews: list[dict],
+        package_id: str,
+        limit: int | None = None,
+    ) -> ReviewColumns:
+        """
+        Parse reviews from library response into columns.
+
+        Feed the result to ReviewPipeline.process_columns to create Review
+        objects only for reviews that survive cleaning, length and dedup.
+        Parsing stops once ``limit`` reviews were collected.
+        """
+        columns = ReviewColumns(
+            source=self.name,
+            source_url=f"https://play.google.com/store/apps/details?id={package_id}",
+        )
+        
+        name = self.name
+        append = columns.append
+        get_fields = _get_review_fields
+        is_new_id = self._seen_ids.check_new
         
         for item in raw_reviews:
             try:
-                text = item.get('content', '').strip()
-                if not text or len(text) < 5:
-                    continue
+                try:
+                    content, rating, date, author, helpful, review_id = get_fields(item)
+                except KeyError:
+                    # Some library versions omit keys
+                    content, rating, date, author, helpful, review_id = map(item.get, _REVIEW_KEYS)
                 
-                # Rating (1-5 scale)
-                rating = item.get('score')
+                if not is_new_id(review_id):
+                    continue
+                if not content:
+                    continue
+                text = content.strip()
+                if len(text) < 5:
+                    continue
+                text = intern_text(text)
                 
                 # Date
-                date = item.get('at')
                 if isinstance(date, str):
-                    try:
-                        date = datetime.fromisoformat(date)
-                    except:
-                        date = None
-                
-                # Author
-                author = item.get('userName')
-                
-                # Helpful count
-                helpful = item.get('thumbsUpCount', 0)
-                
-                # Review ID
-                review_id = item.get('reviewId')
+                    date = _parse_date(date)
                 
-                review = self._review_factory.create(
-                    text=text,
-                    source=self.name,
-                    source_url=f"https://play.google.com/store/apps/details?id={package_id}",
-                    source_id=review_id,
-                    rating=float(rating) if rating else None,
+                append(
+                    text,
+                    rating=float(rating) if rating else None,  # 1-5 scale
                     date=date,
                     author=author,
+                    source_id=review_id,
                     helpful_count=helpful,
                 )
-                reviews_list.append(review)
                 
             except Exception as e:
-                logger.debug(f"[{self.name}] Error parsing review: {e}")
+                logger.debug(f"[{name}] Error parsing review: {e}")
                 continue
+            
+            if limit and len(columns) >= limit:
+                break
         
-        return reviews_list
+        return columns
 
     async def get_pagination_urls(self, base_url: str, max_pages: int | None = None) -> list[str]:
         """Return base URL - pagination is handled internally."""
@@ -158,16 +214,21 @@ class GooglePlayScraper(BaseScraper):
         """Not used - library handles parsing."""
         return None
 
-    def _extract_package_id(self, url: str) -> str | None:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _extract_package_id(url: str) -> str | None:
         """Extract package ID from URL or return as-is if already an ID."""
-        import re
-        
         # If it looks like a package ID (e.g., de.adac.android)
         if "." in url and "/" not in url and "http" not in url:
             return url
         
+        # Common shape .../details?id=<package>&...: slice without the regex
+        package_id = url.partition("?id=")[2].partition("&")[0]
+        if package_id:
+            return package_id
+        
         # Extract from URL parameter
-        match = re.search(r"[?&]id=([^&]+)", url)
+        match = _PKG_RE.search(url)
         if match:
             return match.group(1)
         
@@ -1,15 +1,30 @@
 """Steam game review scraper."""
 
+import asyncio
 import json
 import re
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import islice
 from urllib.parse import urljoin, urlparse, parse_qs
 
+import soupsieve as sv
 from bs4 import BeautifulSoup, Tag
 from loguru import logger
 
 from src.core.base_scraper import BaseScraper
 from src.models.review import Review, ReviewFactory
+from src.utils.cache_utils import SeenIds
+
+_APP_ID_RE = re.compile(r"/app/(\d+)")
+
+# Timestamps past this (year ~3200) are garbage and would overflow
+# datetime.fromtimestamp
+_MAX_TIMESTAMP = 4e10
+
+# CSS selectors for the HTML fallback, compiled once (soupsieve ships with bs4)
+_SEL_CONTENT = sv.compile("div.content")
+_SEL_THUMB_UP = sv.compile("div.thumb img[src*='thumbsUp']")
 
 
 class SteamScraper(BaseScraper):
@@ -40,10 +55,19 @@ class SteamScraper(BaseScraper):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._review_factory = ReviewFactory()
+        # Recommendation IDs already parsed by this scraper (skips repeats on rescrape)
+        self._seen_ids = SeenIds()
 
     async def scrape_reviews(self, url: str, max_reviews: int | None = None) -> list[Review]:
         """
         Scrape reviews from Steam.
+
+        Recommendation IDs are remembered per scraper instance, so scraping
+        the same app again with this scraper only returns reviews not seen
+        before. Call reset_seen_ids() first to get the full set again.
+
+        Pagination stops when the API repeats a cursor or a page adds no
+        new reviews.
         
         Args:
             url: Steam app URL or app ID
@@ -57,60 +81,104 @@ class SteamScraper(BaseScraper):
             logger.error(f"[{self.name}] Could not extract app ID from {url}")
             return []
 
+        api_url = f"{self.base_url}/appreviews/{app_id}"
+
+        def fetch_page(cursor: str) -> asyncio.Task:
+            params = {**self.API_PARAMS, "cursor": cursor}
+            task = asyncio.create_task(self.http_client.get_json(api_url, params=params))
+            # A prefetch may fail after we stopped paginating; don't log it as unretrieved
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            return task
+
+        pending: asyncio.Task | None = None
         try:
             reviews = []
-            cursor = "*"
+            prev_cursor = "*"
+            pending = fetch_page(prev_cursor)
             
             while True:
-                # Build API URL
-                api_url = f"{self.base_url}/appreviews/{app_id}"
-                params = {**self.API_PARAMS, "cursor": cursor}
-                
-                response = await self.http_client.get(api_url, params=params)
-                data = response.json()
+                data = await pending
+                pending = None
                 
                 if not data.get("success"):
                     logger.warning(f"[{self.name}] API returned unsuccessful response")
                     break
 
-                batch = self._parse_api_reviews(data, url)
-                reviews.extend(batch)
+                # Prefetch: the next cursor is known before this page is parsed,
+                # so request the next page now and parse while it is in flight
+                cursor = data.get("cursor")
+                page_size = len(data.get("reviews", ()))
+                if cursor and cursor != prev_cursor and page_size and not (
+                    max_reviews and len(reviews) + page_size >= max_reviews
+                ):
+                    pending = fetch_page(cursor)
+                    await asyncio.sleep(0)  # Let the request start before parsing
+
+                # Parse lazily, stopping exactly at max_reviews
+                remaining = max_reviews - len(reviews) if max_reviews else None
+                before = len(reviews)
+                reviews.extend(islice(self._parse_api_reviews(data, url), remaining))
+                # Release the decoded page before waiting on the next one, so
+                # at most one raw payload is alive at a time
+                del data
                 
-                logger.debug(f"[{self.name}] Fetched {len(batch)} reviews (total: {len(reviews)})")
+                logger.debug(f"[{self.name}] Fetched {len(reviews) - before} reviews (total: {len(reviews)})")
 
-                # Check for more pages
-                cursor = data.get("cursor")
-                if not cursor or not batch:
+                # Check for more pages; a repeated cursor or a page with no new
+                # reviews would otherwise be requested again forever
+                if not cursor or cursor == prev_cursor or len(reviews) == before:
                     break
 
                 # Check max limit
                 if max_reviews and len(reviews) >= max_reviews:
-                    reviews = reviews[:max_reviews]
                     break
 
+                prev_cursor = cursor
+                if pending is None:
+                    pending = fetch_page(cursor)
+
             return reviews
 
         except Exception as e:
             logger.error(f"[{self.name}] Error scraping {url}: {e}")
             return []
 
-    def _parse_api_reviews(self, data: dict, source_url: str) -> list[Review]:
-        """Parse reviews from Steam API response."""
-        reviews = []
-        
-        for review_data in data.get("reviews", []):
-            review = self._parse_review_data(review_data, source_url)
-            if review:
-                reviews.append(review)
+        finally:
+            if pending is not None:
+                pending.cancel()
 
-        return reviews
+    def reset_seen_ids(self) -> None:
+        """Forget the recommendation IDs seen so far, so a rescrape returns them again."""
+        self._seen_ids.clear()
+
+    def _parse_api_reviews(self, data: dict, source_url: str) -> Iterator[Review]:
+        """Parse reviews from Steam API response, lazily."""
+        parse = self._parse_review_data
+        return (
+            review
+            for review_data in data.get("reviews", [])
+            if (review := parse(review_data, source_url))
+        )
 
     def _parse_review_data(self, data: dict, source_url: str) -> Review | None:
-        """Parse a single review from API data."""
+        """
+        Parse a single review from API data.
+
+        Malformed fields are handled by type and range guards (a bad
+        optional field is left unset), so the except clause only catches
+        unexpected failures instead of driving control flow per review.
+        """
         try:
+            review_id = data.get("recommendationid")
+            if not self._seen_ids.check_new(review_id):
+                return None
+
             # Get review text
-            text = data.get("review", "").strip()
-            if not text or len(text) < 10:
+            text = data.get("review")
+            if not isinstance(text, str):
+                return None
+            text = text.strip()
+            if len(text) < 10:
                 return None
 
             # Get recommendation (thumbs up/down)
@@ -118,35 +186,31 @@ class SteamScraper(BaseScraper):
             # Convert to 5-star scale (1 for negative, 5 for positive)
             rating = 5.0 if voted_up else 1.0
 
-            # Get timestamp
-            date = None
+            # Get timestamp (seconds); a malformed value leaves the date unset
+            # instead of raising and dropping the whole review
             timestamp = data.get("timestamp_created")
-            if timestamp:
+            date = None
+            if isinstance(timestamp, (int, float)) and 0 < timestamp < _MAX_TIMESTAMP:
                 date = datetime.fromtimestamp(timestamp)
 
-            # Get author info
-            author_data = data.get("author", {})
+            # Get author info (one lookup for steamid and playtime)
+            author_data = data.get("author")
+            if not isinstance(author_data, dict):
+                author_data = {}
             author = author_data.get("steamid")
 
-            # Get helpful count
+            # Get helpful count (Review rejects negative counts)
             helpful_count = data.get("votes_up", 0)
+            if not isinstance(helpful_count, int) or helpful_count < 0:
+                helpful_count = None
 
-            # Get playtime
-            playtime_hours = data.get("author", {}).get("playtime_forever", 0) / 60
+            # Get playtime (kept as a field; Review.display_text formats it)
+            playtime = author_data.get("playtime_forever", 0)
+            playtime_hours = playtime / 60 if isinstance(playtime, (int, float)) else None
 
-            # Add playtime context to text if significant
-            if playtime_hours > 1:
-                text = f"[{playtime_hours:.1f} hours played]\n\n{text}"
-
-            return self._review_factory.create(
-                text=text,
-                source=self.name,
-                source_url=source_url,
-                source_id=data.get("recommendationid"),
-                rating=rating,
-                date=date,
-                author=author,
-                helpful_count=helpful_count,
+            return self._review_factory.create_fast(
+                text, self.name, source_url, review_id, rating, date, author, helpful_count,
+                playtime_hours,
             )
 
         except Exception as e:
@@ -156,7 +220,7 @@ class SteamScraper(BaseScraper):
     def parse_review_element(self, element: Tag) -> Review | None:
         """Parse review from HTML element (fallback method)."""
         try:
-            text_el = element.select_one("div.content")
+            text_el = _SEL_CONTENT.select_one(element)
             if not text_el:
                 return None
 
@@ -165,7 +229,7 @@ class SteamScraper(BaseScraper):
                 return None
 
             # Get recommendation
-            thumb_up = element.select_one("div.thumb img[src*='thumbsUp']")
+            thumb_up = _SEL_THUMB_UP.select_one(element)
             rating = 5.0 if thumb_up else 1.0
 
             return self._review_factory.create(
@@ -197,8 +261,14 @@ class SteamScraper(BaseScraper):
         if url.isdigit():
             return url
 
+        # Common shape .../app/<id>/...: slice without the regex
+        # (isdecimal matches exactly what \d does)
+        app_id = url.partition("/app/")[2].partition("/")[0]
+        if app_id.isdecimal():
+            return app_id
+
         # Extract from URL
-        match = re.search(r"/app/(\d+)", url)
+        match = _APP_ID_RE.search(url)
         return match.group(1) if match else None
 
     @staticmethod
@@ -210,8 +280,7 @@ class SteamScraper(BaseScraper):
         """Get app information from Steam."""
         try:
             url = f"https://store.steampowered.com/api/appdetails?appids={app_id}"
-            response = await self.http_client.get(url)
-            data = response.json()
+            data = await self.http_client.get_json(url)
             
             if data.get(app_id, {}).get("success"):
                 return data[app_id]["data"]
@@ -220,3 +289,21 @@ class SteamScraper(BaseScraper):
         except Exception as e:
             logger.error(f"[{self.name}] Error getting app info: {e}")
             return None
+
+    async def get_app_infos(self, app_ids: list[str]) -> dict[str, dict]:
+        """
+        Get app information for several apps concurrently.
+
+        The lookups run together on this scraper's HTTP client, so with the
+        shared HTTP/2 connection they are multiplexed instead of paying one
+        round trip each (the domain rate limit still applies).
+
+        Args:
+            app_ids: Steam app IDs (duplicates are fetched once)
+
+        Returns:
+            App ID -> app data, for the apps that could be fetched
+        """
+        unique_ids = list(dict.fromkeys(app_ids))
+        infos = await asyncio.gather(*map(self.get_app_info, unique_ids))
+        return {app_id: info for app_id, info in zip(unique_ids, infos) if info is not None}
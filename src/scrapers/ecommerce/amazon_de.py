@@ -1,14 +1,33 @@
 """Amazon.de product review scraper."""
 
 import re
-from datetime import datetime
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from loguru import logger
 
 from src.core.base_scraper import BaseScraper
 from src.models.review import Review, ReviewFactory
+from src.utils.date_utils import parse_german_date
+
+# Patterns used per review / per URL, compiled once
+_ASIN_RE = re.compile(r'^[A-Z0-9]{10}$')
+_DP_ASIN_RE = re.compile(r'/dp/([A-Z0-9]{10})')
+_REVIEWS_ASIN_RE = re.compile(r'/product-reviews/([A-Z0-9]{10})')
+_STARS_PREFIX_RE = re.compile(r'^\d+[.,]\d*\s*von\s*\d+\s*Sternen?\s*')
+_ARIA_RATING_RE = re.compile(r"(\d+)[.,]?(\d*)\s*von\s*5")
+# A count with optional German thousands dots ("1.234"), read in place
+# instead of stripping the dots from the whole text first
+_COUNT_RE = re.compile(r"\d[\d.]*")
+
+# Review pages are large; build only the review and product-link subtrees
+_REVIEW_STRAINER = SoupStrainer(attrs={"data-hook": ["review", "product-link"]})
+# Product names outside a product-link are read in a second, equally small
+# pass. While parsing, the class attribute is still one string, so match the
+# class as a word in it.
+_TITLE_STRAINER = SoupStrainer(class_=re.compile(r"(?:^|\s)product-title(?:\s|$)"))
+_PRODUCT_SEL = sv.compile("[data-hook='product-link'], .product-title")
 
 
 class AmazonDEScraper(BaseScraper):
@@ -43,6 +62,13 @@ class AmazonDEScraper(BaseScraper):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._review_factory = ReviewFactory()
+        # Selectors compiled once per scraper. Field selectors stay split into
+        # their alternatives, tried in order (the first one with content wins).
+        self._selectors = {
+            key: tuple(map(sv.compile, alternatives))
+            for key, alternatives in self.SELECTOR_ALTERNATIVES.items()
+        }
+        self._container_sel = sv.compile(self.SELECTORS["review_container"])
         # Add German headers
         self._extra_headers = {
             "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
@@ -61,12 +87,12 @@ class AmazonDEScraper(BaseScraper):
     def _normalize_url(self, url: str) -> str:
         """Normalize URL to reviews page."""
         # If it's an ASIN, build review URL
-        if re.match(r'^[A-Z0-9]{10}$', url):
+        if _ASIN_RE.match(url):
             return f"{self.base_url}/product-reviews/{url}"
         
         # If it's a product URL, convert to reviews URL
         if "/dp/" in url:
-            match = re.search(r'/dp/([A-Z0-9]{10})', url)
+            match = _DP_ASIN_RE.search(url)
             if match:
                 return f"{self.base_url}/product-reviews/{match.group(1)}"
         
@@ -78,18 +104,26 @@ class AmazonDEScraper(BaseScraper):
 
     def _parse_reviews(self, html: str, source_url: str) -> list[Review]:
         """Parse reviews from HTML."""
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", parse_only=_REVIEW_STRAINER)
+        containers = self._container_sel.select(soup)
+        strained = bool(containers)
+        if not strained:
+            # Markup without data-hook attributes: fall back to the whole page
+            soup = BeautifulSoup(html, "lxml")
+            containers = self._container_sel.select(soup)
         reviews = []
         
         # Get product name
         product_name = None
-        product_el = soup.select_one("[data-hook='product-link'], .product-title")
+        product_el = _PRODUCT_SEL.select_one(soup)
+        if product_el is None and strained:
+            # The review strainer drops .product-title elements
+            product_el = _PRODUCT_SEL.select_one(
+                BeautifulSoup(html, "lxml", parse_only=_TITLE_STRAINER)
+            )
         if product_el:
             product_name = product_el.get_text(strip=True)
         
-        # Find review containers
-        containers = soup.select(self.SELECTORS["review_container"])
-        
         logger.debug(f"[{self.name}] Found {len(containers)} review containers")
         
         for container in containers:
@@ -107,20 +141,20 @@ class AmazonDEScraper(BaseScraper):
         try:
             # Title
             title = None
-            for selector in self.SELECTORS["review_title"].split(", "):
-                title_el = element.select_one(selector)
+            for selector in self._selectors["review_title"]:
+                title_el = selector.select_one(element)
                 if title_el:
                     # Amazon often wraps title in multiple elements
                     title = title_el.get_text(strip=True)
                     # Remove "X von 5 Sternen" prefix
-                    title = re.sub(r'^\d+[.,]\d*\s*von\s*\d+\s*Sternen?\s*', '', title)
+                    title = _STARS_PREFIX_RE.sub('', title)
                     if title:
                         break
             
             # Review text
             text = None
-            for selector in self.SELECTORS["review_text"].split(", "):
-                text_el = element.select_one(selector)
+            for selector in self._selectors["review_text"]:
+                text_el = selector.select_one(element)
                 if text_el:
                     text = text_el.get_text(strip=True)
                     if text:
@@ -137,36 +171,38 @@ class AmazonDEScraper(BaseScraper):
             
             # Rating
             rating = None
-            for selector in self.SELECTORS["rating"].split(", "):
-                rating_el = element.select_one(selector)
+            for selector in self._selectors["rating"]:
+                rating_el = selector.select_one(element)
                 if rating_el:
                     # Try aria-label
                     aria = rating_el.get("aria-label", "")
-                    match = re.search(r"(\d+)[.,]?(\d*)\s*von\s*5", aria)
+                    match = _ARIA_RATING_RE.search(aria)
                     if match:
                         rating = float(f"{match.group(1)}.{match.group(2) or 0}")
                     else:
-                        # Try class name
-                        classes = ' '.join(rating_el.get('class', []))
-                        match = re.search(r'a-star-(\d)', classes)
-                        if match:
-                            rating = float(match.group(1))
+                        # Try class name ("a-star-4", "a-star-4-5"), read
+                        # from the class list without joining it
+                        for cls in rating_el.get('class', ()):
+                            if cls.startswith('a-star-') and cls[7:8].isdecimal():
+                                rating = float(cls[7])
+                                break
                     if rating:
                         break
             
             # Date
             date = None
-            for selector in self.SELECTORS["date"].split(", "):
-                date_el = element.select_one(selector)
+            for selector in self._selectors["date"]:
+                date_el = selector.select_one(element)
                 if date_el:
-                    date = self._parse_german_date(date_el.get_text(strip=True))
+                    # "Rezension aus Deutschland vom 27. November 2025"
+                    date = parse_german_date(date_el.get_text(strip=True))
                     if date:
                         break
             
             # Author
             author = None
-            for selector in self.SELECTORS["author"].split(", "):
-                author_el = element.select_one(selector)
+            for selector in self._selectors["author"]:
+                author_el = selector.select_one(element)
                 if author_el:
                     author = author_el.get_text(strip=True)
                     if author:
@@ -174,20 +210,20 @@ class AmazonDEScraper(BaseScraper):
             
             # Verified purchase
             verified = False
-            for selector in self.SELECTORS["verified"].split(", "):
-                if element.select_one(selector):
+            for selector in self._selectors["verified"]:
+                if selector.select_one(element):
                     verified = True
                     break
             
             # Helpful votes
             helpful = 0
-            for selector in self.SELECTORS["helpful_votes"].split(", "):
-                helpful_el = element.select_one(selector)
+            for selector in self._selectors["helpful_votes"]:
+                helpful_el = selector.select_one(element)
                 if helpful_el:
                     helpful_text = helpful_el.get_text(strip=True)
-                    match = re.search(r"(\d+)", helpful_text.replace(".", ""))
+                    match = _COUNT_RE.search(helpful_text)
                     if match:
-                        helpful = int(match.group(1))
+                        helpful = int(match.group().replace(".", ""))
                     break
             
             return self._review_factory.create(
@@ -205,33 +241,6 @@ class AmazonDEScraper(BaseScraper):
             logger.warning(f"[{self.name}] Error parsing review: {e}")
             return None
 
-    def _parse_german_date(self, text: str) -> datetime | None:
-        """Parse German Amazon date format."""
-        if not text:
-            return None
-        
-        # Pattern: "Rezension aus Deutschland vom 27. November 2025"
-        german_months = {
-            "januar": 1, "februar": 2, "märz": 3, "april": 4,
-            "mai": 5, "juni": 6, "juli": 7, "august": 8,
-            "september": 9, "oktober": 10, "november": 11, "dezember": 12,
-        }
-        
-        text_lower = text.lower()
-        match = re.search(r"(\d{1,2})\.\s*(\w+)\s*(\d{4})", text_lower)
-        if match:
-            day = int(match.group(1))
-            month_name = match.group(2)
-            year = int(match.group(3))
-            month = german_months.get(month_name)
-            if month:
-                try:
-                    return datetime(year, month, day)
-                except:
-                    pass
-        
-        return None
-
     async def get_pagination_urls(self, base_url: str, max_pages: int | None = None) -> list[str]:
         """Get pagination URLs for Amazon reviews."""
         base_url = self._normalize_url(base_url)
@@ -239,7 +248,7 @@ class AmazonDEScraper(BaseScraper):
         max_pages = max_pages or 10
         
         # Extract ASIN
-        match = re.search(r'/product-reviews/([A-Z0-9]{10})', base_url)
+        match = _REVIEWS_ASIN_RE.search(base_url)
         if match:
             asin = match.group(1)
             for page in range(2, max_pages + 1):
@@ -2,14 +2,26 @@
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from loguru import logger
 
 from src.core.base_scraper import BaseScraper
 from src.models.review import Review, ReviewFactory
 
+# Parse only the subtrees the scraper reads: review containers, the
+# div.parent holding the movie title and the load-more marker. One strainer
+# for all three, so a page parsed for pagination can be reused for reviews.
+_PAGE_STRAINER = SoupStrainer("div", class_=["review-container", "parent", "load-more-data"])
+_MOVIE_TITLE_SEL = sv.compile("h3[itemprop='name'] a, div.parent h3 a")
+_ALT_TEXT_SEL = sv.compile("div.content div.text")
+
+# Pages get_pagination_urls parsed that scrape_reviews hasn't consumed yet
+_MAX_CACHED_PAGES = 8
+
 
 class IMDBScraper(BaseScraper):
     """
@@ -41,14 +53,21 @@ class IMDBScraper(BaseScraper):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._review_factory = ReviewFactory()
+        # Selectors compiled once per scraper instead of on every lookup
+        self._selectors = {key: sv.compile(value) for key, value in self.SELECTORS.items()}
+        # First pages parsed by get_pagination_urls, handed to scrape_reviews
+        # (popped on use) so the same URL isn't fetched and parsed twice
+        self._page_cache: dict[str, BeautifulSoup] = {}
 
     async def scrape_reviews(self, url: str, max_reviews: int | None = None) -> list[Review]:
         """Scrape reviews from an IMDB page."""
         try:
             # Normalize URL - handle title ID input
             url = self._normalize_url(url)
-            html = await self.http_client.get_text(url)
-            return self._parse_reviews(html, url)
+            soup = self._page_cache.pop(url, None)
+            if soup is None:
+                soup = await self._fetch_page(url)
+            return self._parse_reviews(soup, url)
         except Exception as e:
             logger.error(f"[{self.name}] Error scraping {url}: {e}")
             return []
@@ -67,16 +86,20 @@ class IMDBScraper(BaseScraper):
         # It's a title ID (e.g., tt0111161)
         return self.build_url(url)
 
-    def _parse_reviews(self, html: str, source_url: str) -> list[Review]:
-        """Parse reviews from HTML content."""
-        soup = BeautifulSoup(html, "lxml")
+    async def _fetch_page(self, url: str) -> BeautifulSoup:
+        """Fetch a reviews page and parse the parts the scraper reads."""
+        html = await self.http_client.get_text(url)
+        return BeautifulSoup(html, "lxml", parse_only=_PAGE_STRAINER)
+
+    def _parse_reviews(self, soup: BeautifulSoup, source_url: str) -> list[Review]:
+        """Parse reviews from a parsed page."""
         reviews = []
 
         # Extract movie title for context
-        title_el = soup.select_one("h3[itemprop='name'] a, div.parent h3 a")
+        title_el = _MOVIE_TITLE_SEL.select_one(soup)
         movie_title = title_el.get_text(strip=True) if title_el else None
 
-        containers = soup.select(self.SELECTORS["review_container"])
+        containers = self._selectors["review_container"].select(soup)
         logger.debug(f"[{self.name}] Found {len(containers)} review containers")
 
         for container in containers:
@@ -93,10 +116,10 @@ class IMDBScraper(BaseScraper):
         """Parse a single review element."""
         try:
             # Extract review text
-            text_el = element.select_one(self.SELECTORS["review_text"])
+            text_el = self._selectors["review_text"].select_one(element)
             if not text_el:
                 # Try alternative selector
-                text_el = element.select_one("div.content div.text")
+                text_el = _ALT_TEXT_SEL.select_one(element)
             
             if not text_el:
                 return None
@@ -106,7 +129,7 @@ class IMDBScraper(BaseScraper):
                 return None
 
             # Extract title
-            title_el = element.select_one(self.SELECTORS["review_title"])
+            title_el = self._selectors["review_title"].select_one(element)
             title = title_el.get_text(strip=True) if title_el else None
 
             # Combine title and text
@@ -114,7 +137,7 @@ class IMDBScraper(BaseScraper):
 
             # Extract rating (IMDB uses X/10 scale)
             rating = None
-            rating_el = element.select_one(self.SELECTORS["rating"])
+            rating_el = self._selectors["rating"].select_one(element)
             if rating_el:
                 rating_text = rating_el.get_text(strip=True)
                 try:
@@ -126,20 +149,20 @@ class IMDBScraper(BaseScraper):
 
             # Extract date
             date = None
-            date_el = element.select_one(self.SELECTORS["date"])
+            date_el = self._selectors["date"].select_one(element)
             if date_el:
                 date_text = date_el.get_text(strip=True)
                 date = self._parse_imdb_date(date_text)
 
             # Extract author
             author = None
-            author_el = element.select_one(self.SELECTORS["author"])
+            author_el = self._selectors["author"].select_one(element)
             if author_el:
                 author = author_el.get_text(strip=True)
 
             # Extract helpful count
             helpful_count = None
-            helpful_el = element.select_one(self.SELECTORS["helpful"])
+            helpful_el = self._selectors["helpful"].select_one(element)
             if helpful_el:
                 helpful_text = helpful_el.get_text()
                 match = re.search(r"(\d+)\s+out\s+of\s+\d+\s+found\s+this\s+helpful", helpful_text)
@@ -160,8 +183,10 @@ class IMDBScraper(BaseScraper):
             logger.warning(f"[{self.name}] Error parsing review: {e}")
             return None
 
-    def _parse_imdb_date(self, date_text: str) -> datetime | None:
-        """Parse IMDB date format (e.g., '15 March 2024')."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_imdb_date(date_text: str) -> datetime | None:
+        """Parse IMDB date format (e.g., '15 March 2024'), cached: strptime is slow."""
         try:
             # Common IMDB date format
             return datetime.strptime(date_text, "%d %B %Y")
@@ -189,11 +214,14 @@ class IMDBScraper(BaseScraper):
         # To get more, you'd need to handle the "Load More" button via browser automation
         
         try:
-            html = await self.http_client.get_text(base_url)
-            soup = BeautifulSoup(html, "lxml")
+            soup = await self._fetch_page(base_url)
+            # scrape_reviews starts with this same page; keep it for that call
+            if len(self._page_cache) >= _MAX_CACHED_PAGES:
+                del self._page_cache[next(iter(self._page_cache))]
+            self._page_cache[base_url] = soup
             
             # Check for pagination key
-            load_more = soup.select_one(self.SELECTORS["load_more"])
+            load_more = self._selectors["load_more"].select_one(soup)
             if load_more:
                 pagination_key = load_more.get("data-key")
                 if pagination_key:
@@ -8,14 +8,56 @@ Total available: 154+ reviews
 Based on actual HTML analysis from January 2026.
 """
 
+import asyncio
 import re
 import time
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 
 import requests
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from src.utils.async_utils import use_shared_executor
+
+# Patterns used per review block, compiled once
+_EXPERIENCE_RE = re.compile(r'ADAC Erfahrung #(\d+)')
+_RATING_ANY_RE = re.compile(r'\d[,.]?\d?\s*von\s*5')
+_BLOCK_RATING_RE = re.compile(r'(\d)[,.](\d)\s*von\s*5|(\d)\s*von\s*5')
+_DATE_RE = re.compile(r'\d{2}\.\d{2}\.\d{4}')
+_AUTHOR_RE = re.compile(r'Bewertung von\s+(\w+(?:\s+\w+)?)\s+am')
+# Review text candidates: whole lines over 20 characters, minus UI labels
+# and further date lines
+_LONG_LINE_RE = re.compile(r'[^\n]{21,}')
+_BLOCK_SKIP_RE = re.compile(
+    r'Link kopieren|Melden|von 5|Bewertung von|ADAC Erfahrung|\d{2}\.\d{2}\.\d{4}'
+)
+
+# Everything _extract_from_text reads or strips in a review segment, as one
+# alternation so the segment is scanned once: the rating ("2,5 von 5", with
+# an optional "Sternen" suffix that marks it for removal), the date, the
+# "Bewertung von ... am" line and UI labels
+_SEGMENT_RE = re.compile(
+    r'(?P<rating>(?P<whole>\d)[,.]?(?P<frac>\d)?\s*von\s*5)(?P<stars>\s*Sternen?)?'
+    r'|(?P<date>\d{2}\.\d{2}\.\d{4})'
+    r'|Bewertung von.*?am'
+    r'|Link kopieren|Melden'
+)
+
+# Tags that can hold a review block
+_CONTAINER_TAGS = frozenset({'div', 'article', 'section'})
+
+
+@lru_cache(maxsize=4096)
+def _parse_dotted_date(value: str) -> datetime | None:
+    """Parse a DD.MM.YYYY date (cached, review dates repeat a lot)."""
+    day, month, year = value.split('.')
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:  # Right shape, impossible date (e.g. 31.02.2024)
+        return None
+
 
 class FinanzflussADACScraper:
     """Scraper for Finanzfluss ADAC reviews."""
@@ -46,7 +88,9 @@ class FinanzflussADACScraper:
             response = self._session.get(self.base_url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Raw bytes: bs4/lxml detect the charset from the markup, and requests
+            # skips decoding (and guessing the encoding of) the whole body
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract reviews from page
             reviews = self._extract_reviews(soup)
@@ -59,61 +103,68 @@ class FinanzflussADACScraper:
         
         return all_reviews[:max_reviews]
 
+    async def scrape_reviews_async(self, max_reviews: int = 200) -> list[dict]:
+        """
+        Async version of scrape_reviews for use inside an event loop.
+
+        The blocking requests call runs on the loop's shared worker pool, so
+        it neither stalls the loop nor serializes with other sources
+        scraped concurrently (e.g. via asyncio.gather).
+        """
+        use_shared_executor()
+        return await asyncio.to_thread(self.scrape_reviews, max_reviews)
+
     def _extract_reviews(self, soup: BeautifulSoup) -> list[dict]:
         """Extract reviews from page."""
         reviews = []
+        # First 50 characters of each kept text, to drop repeats in O(1)
+        seen_prefixes: set[str] = set()
         
         # Finanzfluss uses emoji indicators for review sentiment
         # 😊 = positive, 😐 = neutral, 😒 = negative
         
-        # Find all review blocks - they contain "ADAC Erfahrung #" in text
-        page_text = soup.get_text()
-        
-        # Method 1: Find by experience number pattern
-        experience_pattern = r'ADAC Erfahrung #(\d+)'
-        matches = list(re.finditer(experience_pattern, page_text))
-        
-        if matches:
-            logger.debug(f"[{self.name}] Found {len(matches)} experience markers")
-        
-        # Method 2: Find review containers by structure
+        # Method 1: Find review containers by structure
         # Reviews have: emoji, title, rating, date, text
         
         # Look for rating patterns like "5 von 5 Sternen" or "2,5 von 5"
-        rating_elements = soup.find_all(string=re.compile(r'\d[,.]?\d?\s*von\s*5'))
+        # (matching text nodes only; the page text is never joined here)
+        rating_elements = soup.find_all(string=_RATING_ANY_RE)
+        logger.debug(f"[{self.name}] Found {len(rating_elements)} rating markers")
         
         for rating_el in rating_elements:
             try:
-                # Navigate to parent container
-                container = rating_el.find_parent(['div', 'article', 'section'])
+                # Navigate to parent container (one lazy walk up the tree)
+                ancestors = (p for p in rating_el.parents if p.name in _CONTAINER_TAGS)
+                container = next(ancestors, None)
                 if not container:
                     continue
                 
                 # Try to find the full review container
-                for _ in range(5):  # Go up to 5 levels
-                    parent = container.find_parent(['div', 'article', 'section'])
-                    if parent:
-                        text = parent.get_text()
-                        if 'ADAC Erfahrung' in text or 'Bewertung von' in text:
-                            container = parent
-                            break
-                        container = parent
+                for parent in islice(ancestors, 5):  # Go up to 5 levels
+                    container = parent
+                    text = parent.get_text()
+                    if 'ADAC Erfahrung' in text or 'Bewertung von' in text:
+                        break
                 
                 review = self._parse_review_block(container)
                 if review and len(review.get('text', '')) > 30:
                     # Avoid duplicates
-                    if not any(r['text'][:50] == review['text'][:50] for r in reviews):
+                    key = review['text'][:50]
+                    if key not in seen_prefixes:
+                        seen_prefixes.add(key)
                         reviews.append(review)
                         
             except Exception as e:
                 logger.debug(f"Error parsing review: {e}")
                 continue
         
-        # Method 3: Parse using text patterns directly
+        # Method 2: Parse using text patterns directly
         if len(reviews) < 10:
             text_reviews = self._extract_from_text(soup)
             for review in text_reviews:
-                if not any(r['text'][:50] == review['text'][:50] for r in reviews):
+                key = review['text'][:50]
+                if key not in seen_prefixes:
+                    seen_prefixes.add(key)
                     reviews.append(review)
         
         return reviews
@@ -123,13 +174,13 @@ class FinanzflussADACScraper:
         try:
             text = container.get_text(separator='\n', strip=True)
             
-            # Extract review number
-            num_match = re.search(r'ADAC Erfahrung #(\d+)', text)
+            # Extract review number (cheap substring test before the regex)
+            num_match = _EXPERIENCE_RE.search(text) if 'ADAC Erfahrung #' in text else None
             review_num = num_match.group(1) if num_match else None
             
             # Extract rating
             rating = None
-            rating_match = re.search(r'(\d)[,.](\d)\s*von\s*5|(\d)\s*von\s*5', text)
+            rating_match = _BLOCK_RATING_RE.search(text)
             if rating_match:
                 if rating_match.group(3):
                     rating = float(rating_match.group(3))
@@ -138,47 +189,25 @@ class FinanzflussADACScraper:
             
             # Extract date - pattern: "Bewertung von X am DD.MM.YYYY"
             date = None
-            date_match = re.search(r'(\d{2})\.(\d{2})\.(\d{4})', text)
+            date_match = _DATE_RE.search(text)
             if date_match:
-                try:
-                    date = datetime(
-                        int(date_match.group(3)),
-                        int(date_match.group(2)),
-                        int(date_match.group(1))
-                    )
-                except:
-                    pass
+                date = _parse_dotted_date(date_match.group(0))
             
             # Extract author
             author = None
-            author_match = re.search(r'Bewertung von\s+(\w+(?:\s+\w+)?)\s+am', text)
+            author_match = _AUTHOR_RE.search(text)
             if author_match:
                 author = author_match.group(1)
             
-            # Extract review text - everything after the date line
-            lines = text.split('\n')
+            # Extract review text - the first substantial line after the date
+            # line, found by scanning the text in place instead of splitting it
             review_text = ""
-            
-            # Find the actual review content
-            capture = False
-            skip_patterns = ['Link kopieren', 'Melden', 'von 5', 'Bewertung von', 'ADAC Erfahrung']
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Start capturing after date
-                if re.search(r'\d{2}\.\d{2}\.\d{4}', line):
-                    capture = True
-                    continue
-                
-                if capture:
+            line_end = text.find('\n', date_match.end()) if date_match else -1
+            if line_end != -1:
+                for line_match in _LONG_LINE_RE.finditer(text, line_end):
                     # Skip UI elements
-                    if any(skip in line for skip in skip_patterns):
-                        continue
-                    if len(line) > 20:
-                        review_text = line
+                    if not _BLOCK_SKIP_RE.search(line_match.group()):
+                        review_text = line_match.group()
                         break
             
             if not review_text or len(review_text) < 30:
@@ -202,60 +231,48 @@ class FinanzflussADACScraper:
         reviews = []
         text = soup.get_text()
         
-        # Split by review markers
-        parts = re.split(r'(ADAC Erfahrung #\d+)', text)
+        # Each review runs from its "ADAC Erfahrung #N" marker to the next one
+        markers = list(_EXPERIENCE_RE.finditer(text))
+        ends = [marker.start() for marker in markers[1:]]
+        ends.append(len(text))
         
-        for i, part in enumerate(parts):
-            if 'ADAC Erfahrung #' in part:
-                # Get the next part which contains the review
-                if i + 1 < len(parts):
-                    review_text = parts[i + 1]
-                    
-                    # Extract rating
-                    rating = None
-                    rating_match = re.search(r'(\d)[,.]?(\d)?\s*von\s*5', review_text)
-                    if rating_match:
-                        if rating_match.group(2):
-                            rating = float(f"{rating_match.group(1)}.{rating_match.group(2)}")
-                        else:
-                            rating = float(rating_match.group(1))
-                    
-                    # Extract date
-                    date = None
-                    date_match = re.search(r'(\d{2})\.(\d{2})\.(\d{4})', review_text)
-                    if date_match:
-                        try:
-                            date = datetime(
-                                int(date_match.group(3)),
-                                int(date_match.group(2)),
-                                int(date_match.group(1))
-                            )
-                        except:
-                            pass
-                    
-                    # Get review number
-                    num_match = re.search(r'#(\d+)', part)
-                    review_num = num_match.group(1) if num_match else None
-                    
-                    # Extract actual review content
-                    # Remove rating and date lines
-                    clean_text = re.sub(r'\d[,.]?\d?\s*von\s*5\s*Sternen?', '', review_text)
-                    clean_text = re.sub(r'\d{2}\.\d{2}\.\d{4}', '', clean_text)
-                    clean_text = re.sub(r'Bewertung von.*?am', '', clean_text)
-                    clean_text = re.sub(r'Link kopieren|Melden', '', clean_text)
-                    
-                    # Get first substantial paragraph
-                    paragraphs = [p.strip() for p in clean_text.split('\n') if len(p.strip()) > 50]
-                    if paragraphs:
-                        content = paragraphs[0][:1000]
-                        
-                        reviews.append({
-                            'text': f"[ADAC Finanzfluss #{review_num}] {content}" if review_num else f"[ADAC Finanzfluss] {content}",
-                            'rating': rating,
-                            'date': date.isoformat() if date else None,
-                            'source': 'finanzfluss',
-                            'source_url': self.base_url,
-                        })
+        for marker, end in zip(markers, ends):
+            review_num = marker.group(1)
+            
+            # One scan for rating, date and the spans to strip
+            rating = None
+            date_match = None
+            kept = []
+            pos = marker.end()
+            for match in _SEGMENT_RE.finditer(text, pos, end):
+                if match.group('rating') is not None:
+                    if rating is None:
+                        whole, frac = match.group('whole', 'frac')
+                        rating = float(f"{whole}.{frac}") if frac else float(whole)
+                    if match.group('stars') is None:
+                        continue  # Bare "X von 5" stays in the text
+                elif match.group('date') is not None and date_match is None:
+                    date_match = match
+                kept.append(text[pos:match.start()])
+                pos = match.end()
+            kept.append(text[pos:end])
+            clean_text = ''.join(kept)
+            
+            # Extract date
+            date = _parse_dotted_date(date_match.group(0)) if date_match else None
+            
+            # Get first substantial paragraph
+            paragraphs = [p.strip() for p in clean_text.split('\n') if len(p.strip()) > 50]
+            if paragraphs:
+                content = paragraphs[0][:1000]
+                
+                reviews.append({
+                    'text': f"[ADAC Finanzfluss #{review_num}] {content}",
+                    'rating': rating,
+                    'date': date.isoformat() if date else None,
+                    'source': 'finanzfluss',
+                    'source_url': self.base_url,
+                })
         
         return reviews
 
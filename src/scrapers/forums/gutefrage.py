@@ -1,14 +1,37 @@
 """Gutefrage.net Q&A scraper for German discussions."""
 
+import asyncio
 import re
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
-from urllib.parse import urljoin, quote
+from itertools import islice
+from time import monotonic
+from urllib.parse import quote
 
-from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from loguru import logger
 
 from src.core.base_scraper import BaseScraper
 from src.models.review import Review, ReviewFactory
+from src.utils.date_utils import parse_relative_german_date
+from src.utils.url_utils import absolute_url
+
+# Patterns used per answer, compiled once
+_DIGITS_RE = re.compile(r"(\d+)")
+
+# Helpful votes -> rating: 0 -> 1.0, 1 -> 2.0, 2-4 -> 3.0, 5-9 -> 4.0, 10+ -> 5.0
+_VOTE_THRESHOLDS = (1, 2, 5, 10)
+_VOTE_RATINGS = (1.0, 2.0, 3.0, 4.0, 5.0)
+
+_BEST_ANSWER_SEL = sv.compile("[class*='best'], [class*='Best'], .hilfreichste")
+
+# Search pages are only read for their links; build just the anchors
+_LINK_STRAINER = SoupStrainer("a", href=True)
+
+# Upper bound on question pages fetched ahead from one search page
+_MAX_FETCH_WINDOW = 16
 
 
 class GutefrageScraper(BaseScraper):
@@ -45,6 +68,12 @@ class GutefrageScraper(BaseScraper):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._review_factory = ReviewFactory()
+        # Selectors compiled once per scraper, each field's alternatives
+        # tried in order
+        self._selectors = {
+            key: tuple(map(sv.compile, alternatives))
+            for key, alternatives in self.SELECTOR_ALTERNATIVES.items()
+        }
 
     async def scrape_reviews(self, url: str, max_reviews: int | None = None) -> list[Review]:
         """
@@ -76,35 +105,70 @@ class GutefrageScraper(BaseScraper):
 
     async def _scrape_search_results(self, html: str, source_url: str, max_reviews: int | None) -> list[Review]:
         """Scrape search results and follow links to questions."""
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", parse_only=_LINK_STRAINER)
         reviews = []
         
         # Find all question links
         question_links = []
-        for selector in self.SELECTORS["question_link"].split(", "):
-            links = soup.select(selector)
+        for selector in self._selectors["question_link"]:
+            links = selector.select(soup)
             for link in links:
                 href = link.get("href", "")
                 if "/frage/" in href:
-                    full_url = urljoin(self.base_url, href)
-                    if full_url not in question_links:
-                        question_links.append(full_url)
+                    question_links.append(absolute_url(self.base_url, href))
+        # Drop repeats, keeping page order
+        question_links = list(dict.fromkeys(question_links))
         
         logger.info(f"[{self.name}] Found {len(question_links)} questions to scrape")
         
-        # Scrape each question page
-        for i, question_url in enumerate(question_links):
-            if max_reviews and len(reviews) >= max_reviews:
-                break
-                
-            try:
-                question_html = await self.http_client.get_text(question_url)
-                question_reviews = self._parse_question_page(question_html, question_url)
-                reviews.extend(question_reviews)
-                logger.debug(f"[{self.name}] Question {i+1}: {len(question_reviews)} items")
-            except Exception as e:
-                logger.warning(f"[{self.name}] Error scraping question {question_url}: {e}")
-                continue
+        # Scrape the question pages concurrently through a bounded window of
+        # tasks, collecting them in link order. The window is derived from the
+        # rate limit. HttpClient does not space concurrent requests, so each
+        # task gets a start time one anti-bot delay after the previous one.
+        window = max(1, min(_MAX_FETCH_WINDOW, self.rate_limit_rpm // 4))
+        delay_manager = self.http_client.delay_manager
+        next_start = monotonic()
+
+        async def scrape_question(question_url: str, start: float) -> list[Review]:
+            wait = start - monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            question_html = await self.http_client.get_text(question_url)
+            return self._parse_question_page(question_html, question_url)
+
+        def schedule(question_url: str) -> tuple[str, asyncio.Task]:
+            nonlocal next_start
+            start = max(monotonic(), next_start)
+            next_start = start + delay_manager.get_delay()
+            task = asyncio.create_task(scrape_question(question_url, start))
+            # Tasks left behind at max_reviews are cancelled or never awaited; don't log them
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            return question_url, task
+
+        links = iter(question_links)
+        pending = deque(map(schedule, islice(links, window)))
+        try:
+            i = 0
+            while pending:
+                if max_reviews and len(reviews) >= max_reviews:
+                    break
+
+                question_url, task = pending.popleft()
+                next_url = next(links, None)
+                if next_url is not None:
+                    pending.append(schedule(next_url))
+
+                i += 1
+                try:
+                    question_reviews = await task
+                    reviews.extend(question_reviews)
+                    logger.debug(f"[{self.name}] Question {i}: {len(question_reviews)} items")
+                except Exception as e:
+                    logger.warning(f"[{self.name}] Error scraping question {question_url}: {e}")
+                    continue
+        finally:
+            for _, task in pending:
+                task.cancel()
         
         return reviews
 
@@ -120,8 +184,8 @@ class GutefrageScraper(BaseScraper):
         
         # Extract all answers
         answer_containers = []
-        for selector in self.SELECTORS["answer_container"].split(", "):
-            answer_containers = soup.select(selector)
+        for selector in self._selectors["answer_container"]:
+            answer_containers = selector.select(soup)
             if answer_containers:
                 break
         
@@ -137,8 +201,8 @@ class GutefrageScraper(BaseScraper):
         try:
             # Title
             title = None
-            for selector in self.SELECTORS["question_title"].split(", "):
-                title_el = soup.select_one(selector)
+            for selector in self._selectors["question_title"]:
+                title_el = selector.select_one(soup)
                 if title_el:
                     title = title_el.get_text(strip=True)
                     if title:
@@ -146,8 +210,8 @@ class GutefrageScraper(BaseScraper):
             
             # Question text
             text = None
-            for selector in self.SELECTORS["question_text"].split(", "):
-                text_el = soup.select_one(selector)
+            for selector in self._selectors["question_text"]:
+                text_el = selector.select_one(soup)
                 if text_el:
                     text = text_el.get_text(strip=True)
                     if text:
@@ -171,8 +235,8 @@ class GutefrageScraper(BaseScraper):
             
             # Tags
             tags = []
-            for selector in self.SELECTORS["tags"].split(", "):
-                tag_els = soup.select(selector)
+            for selector in self._selectors["tags"]:
+                tag_els = selector.select(soup)
                 for tag_el in tag_els:
                     tag = tag_el.get_text(strip=True)
                     if tag:
@@ -196,8 +260,8 @@ class GutefrageScraper(BaseScraper):
         try:
             # Answer text
             text = None
-            for selector in self.SELECTORS["answer_text"].split(", "):
-                text_el = container.select_one(selector)
+            for selector in self._selectors["answer_text"]:
+                text_el = selector.select_one(container)
                 if text_el:
                     text = text_el.get_text(strip=True)
                     if text:
@@ -214,8 +278,8 @@ class GutefrageScraper(BaseScraper):
             
             # Author
             author = None
-            for selector in self.SELECTORS["author"].split(", "):
-                author_el = container.select_one(selector)
+            for selector in self._selectors["author"]:
+                author_el = selector.select_one(container)
                 if author_el:
                     author = author_el.get_text(strip=True)
                     if author:
@@ -223,29 +287,20 @@ class GutefrageScraper(BaseScraper):
             
             # Rating (helpful votes)
             rating = None
-            for selector in self.SELECTORS["answer_rating"].split(", "):
-                rating_el = container.select_one(selector)
+            for selector in self._selectors["answer_rating"]:
+                rating_el = selector.select_one(container)
                 if rating_el:
                     rating_text = rating_el.get_text(strip=True)
-                    match = re.search(r"(\d+)", rating_text)
+                    match = _DIGITS_RE.search(rating_text)
                     if match:
                         # Normalize to 1-5 scale based on helpful votes
                         votes = int(match.group(1))
-                        if votes >= 10:
-                            rating = 5.0
-                        elif votes >= 5:
-                            rating = 4.0
-                        elif votes >= 2:
-                            rating = 3.0
-                        elif votes >= 1:
-                            rating = 2.0
-                        else:
-                            rating = 1.0
+                        rating = _VOTE_RATINGS[bisect_right(_VOTE_THRESHOLDS, votes)]
                     break
             
             # Check for "beste Antwort" (best answer)
             is_best = False
-            if container.select_one("[class*='best'], [class*='Best'], .hilfreichste"):
+            if _BEST_ANSWER_SEL.select_one(container):
                 is_best = True
                 rating = 5.0
             
@@ -264,68 +319,25 @@ class GutefrageScraper(BaseScraper):
 
     def _extract_date(self, soup: BeautifulSoup) -> datetime | None:
         """Extract date from page."""
-        for selector in self.SELECTORS["date"].split(", "):
-            date_el = soup.select_one(selector)
+        for selector in self._selectors["date"]:
+            date_el = selector.select_one(soup)
             if date_el:
                 # Try datetime attribute
                 datetime_attr = date_el.get("datetime")
                 if datetime_attr:
                     try:
-                        return datetime.fromisoformat(datetime_attr.replace("Z", "+00:00"))
+                        return datetime.fromisoformat(datetime_attr)
                     except:
                         pass
                 
                 # Try text parsing
                 date_text = date_el.get_text(strip=True)
-                date = self._parse_german_date(date_text)
+                date = parse_relative_german_date(date_text)
                 if date:
                     return date
         
         return None
 
-    def _parse_german_date(self, text: str) -> datetime | None:
-        """Parse German date formats."""
-        if not text:
-            return None
-        
-        # Handle relative dates
-        text_lower = text.lower()
-        if "heute" in text_lower:
-            return datetime.now()
-        if "gestern" in text_lower:
-            from datetime import timedelta
-            return datetime.now() - timedelta(days=1)
-        
-        # German month names
-        german_months = {
-            "januar": 1, "februar": 2, "märz": 3, "april": 4,
-            "mai": 5, "juni": 6, "juli": 7, "august": 8,
-            "september": 9, "oktober": 10, "november": 11, "dezember": 12,
-        }
-        
-        # Try pattern: "27. November 2025"
-        match = re.search(r"(\d{1,2})\.\s*(\w+)\s*(\d{4})", text_lower)
-        if match:
-            day = int(match.group(1))
-            month_name = match.group(2)
-            year = int(match.group(3))
-            month = german_months.get(month_name)
-            if month:
-                try:
-                    return datetime(year, month, day)
-                except:
-                    pass
-        
-        # Try pattern: "27.11.2025"
-        match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", text)
-        if match:
-            try:
-                return datetime(int(match.group(3)), int(match.group(2)), int(match.group(1)))
-            except:
-                pass
-        
-        return None
-
     def parse_review_element(self, element: Tag) -> Review | None:
         """Parse review from element - not used directly."""
         return None
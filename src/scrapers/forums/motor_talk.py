@@ -1,14 +1,43 @@
 """Motor-Talk.de forum scraper for German automotive discussions."""
 
+import asyncio
 import re
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
-from urllib.parse import urljoin, quote
+from itertools import islice
+from time import monotonic
+from urllib.parse import quote
 
-from bs4 import BeautifulSoup, Tag
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from loguru import logger
 
 from src.core.base_scraper import BaseScraper
 from src.models.review import Review, ReviewFactory
+from src.utils.date_utils import parse_relative_german_date
+from src.utils.url_utils import absolute_url
+
+# Patterns used per link / post, compiled once
+_QUERY_RE = re.compile(r'\?.*$')
+_DIGITS_RE = re.compile(r"(\d+)")
+
+# Likes -> rating: 0-1 -> 2.0, 2-4 -> 3.0, 5-9 -> 4.0, 10+ -> 5.0
+_LIKE_THRESHOLDS = (2, 5, 10)
+_LIKE_RATINGS = (2.0, 3.0, 4.0, 5.0)
+
+# Fixed selectors, compiled once
+_THREAD_LINK_SEL = sv.compile("a[href*='/forum/'][href*='-t']")
+_TITLE_SEL = sv.compile("h1")
+_POST_SEL = sv.compile(".post, .message, [class*='message-']")
+_POST_FALLBACK_SEL = sv.compile("div[id^='post'], article")
+_QUOTE_SEL = sv.compile(".quote, blockquote")
+
+# Search pages are only read for their links; build just the anchors
+_LINK_STRAINER = SoupStrainer("a", href=True)
+
+# Upper bound on thread pages fetched ahead from one search page
+_MAX_FETCH_WINDOW = 16
 
 
 class MotorTalkScraper(BaseScraper):
@@ -43,6 +72,12 @@ class MotorTalkScraper(BaseScraper):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._review_factory = ReviewFactory()
+        # Selectors compiled once per scraper, each field's alternatives
+        # tried in order
+        self._selectors = {
+            key: tuple(map(sv.compile, alternatives))
+            for key, alternatives in self.SELECTOR_ALTERNATIVES.items()
+        }
 
     async def scrape_reviews(self, url: str, max_reviews: int | None = None) -> list[Review]:
         """Scrape discussions from Motor-Talk."""
@@ -67,36 +102,71 @@ class MotorTalkScraper(BaseScraper):
 
     async def _scrape_search_results(self, html: str, source_url: str, max_reviews: int | None) -> list[Review]:
         """Scrape search results and follow links to threads."""
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", parse_only=_LINK_STRAINER)
         reviews = []
         
         # Find all thread links
         thread_links = []
-        links = soup.select("a[href*='/forum/'][href*='-t']")
+        links = _THREAD_LINK_SEL.select(soup)
         for link in links:
             href = link.get("href", "")
             if "/forum/" in href and "-t" in href:
-                full_url = urljoin(self.base_url, href)
+                full_url = absolute_url(self.base_url, href)
                 # Clean URL (remove page params for now)
-                full_url = re.sub(r'\?.*$', '', full_url)
-                if full_url not in thread_links:
-                    thread_links.append(full_url)
+                thread_links.append(_QUERY_RE.sub('', full_url))
+        # Drop repeats, keeping page order
+        thread_links = list(dict.fromkeys(thread_links))
         
         logger.info(f"[{self.name}] Found {len(thread_links)} threads to scrape")
         
-        # Scrape each thread
-        for i, thread_url in enumerate(thread_links):
-            if max_reviews and len(reviews) >= max_reviews:
-                break
-                
-            try:
-                thread_html = await self.http_client.get_text(thread_url)
-                thread_reviews = self._parse_thread_page(thread_html, thread_url)
-                reviews.extend(thread_reviews)
-                logger.debug(f"[{self.name}] Thread {i+1}: {len(thread_reviews)} posts")
-            except Exception as e:
-                logger.warning(f"[{self.name}] Error scraping thread {thread_url}: {e}")
-                continue
+        # Scrape the thread pages concurrently through a bounded window of
+        # tasks, collecting them in link order. The window is derived from the
+        # rate limit. HttpClient does not space concurrent requests, so each
+        # task gets a start time one anti-bot delay after the previous one.
+        window = max(1, min(_MAX_FETCH_WINDOW, self.rate_limit_rpm // 4))
+        delay_manager = self.http_client.delay_manager
+        next_start = monotonic()
+
+        async def scrape_thread(thread_url: str, start: float) -> list[Review]:
+            wait = start - monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            thread_html = await self.http_client.get_text(thread_url)
+            return self._parse_thread_page(thread_html, thread_url)
+
+        def schedule(thread_url: str) -> tuple[str, asyncio.Task]:
+            nonlocal next_start
+            start = max(monotonic(), next_start)
+            next_start = start + delay_manager.get_delay()
+            task = asyncio.create_task(scrape_thread(thread_url, start))
+            # Tasks left behind at max_reviews are cancelled or never awaited; don't log them
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            return thread_url, task
+
+        links = iter(thread_links)
+        pending = deque(map(schedule, islice(links, window)))
+        try:
+            i = 0
+            while pending:
+                if max_reviews and len(reviews) >= max_reviews:
+                    break
+
+                thread_url, task = pending.popleft()
+                next_url = next(links, None)
+                if next_url is not None:
+                    pending.append(schedule(next_url))
+
+                i += 1
+                try:
+                    thread_reviews = await task
+                    reviews.extend(thread_reviews)
+                    logger.debug(f"[{self.name}] Thread {i}: {len(thread_reviews)} posts")
+                except Exception as e:
+                    logger.warning(f"[{self.name}] Error scraping thread {thread_url}: {e}")
+                    continue
+        finally:
+            for _, task in pending:
+                task.cancel()
         
         return reviews
 
@@ -107,16 +177,16 @@ class MotorTalkScraper(BaseScraper):
         
         # Get thread title
         thread_title = None
-        title_el = soup.select_one("h1")
+        title_el = _TITLE_SEL.select_one(soup)
         if title_el:
             thread_title = title_el.get_text(strip=True)
         
         # Find all posts
-        post_containers = soup.select(".post, .message, [class*='message-']")
+        post_containers = _POST_SEL.select(soup)
         
         # Fallback: look for divs with post content
         if not post_containers:
-            post_containers = soup.select("div[id^='post'], article")
+            post_containers = _POST_FALLBACK_SEL.select(soup)
         
         for container in post_containers:
             review = self._extract_post(container, source_url, thread_title)
@@ -130,11 +200,11 @@ class MotorTalkScraper(BaseScraper):
         try:
             # Post content
             text = None
-            for selector in self.SELECTORS["post_content"].split(", "):
-                content_el = container.select_one(selector)
+            for selector in self._selectors["post_content"]:
+                content_el = selector.select_one(container)
                 if content_el:
                     # Remove quotes
-                    for quote in content_el.select(".quote, blockquote"):
+                    for quote in _QUOTE_SEL.select(content_el):
                         quote.decompose()
                     text = content_el.get_text(strip=True)
                     if text:
@@ -142,7 +212,7 @@ class MotorTalkScraper(BaseScraper):
             
             # Fallback: get text directly
             if not text:
-                for quote in container.select(".quote, blockquote"):
+                for quote in _QUOTE_SEL.select(container):
                     quote.decompose()
                 text = container.get_text(strip=True)
             
@@ -157,8 +227,8 @@ class MotorTalkScraper(BaseScraper):
             
             # Author
             author = None
-            for selector in self.SELECTORS["post_author"].split(", "):
-                author_el = container.select_one(selector)
+            for selector in self._selectors["post_author"]:
+                author_el = selector.select_one(container)
                 if author_el:
                     author = author_el.get_text(strip=True)
                     if author:
@@ -166,37 +236,30 @@ class MotorTalkScraper(BaseScraper):
             
             # Date
             date = None
-            for selector in self.SELECTORS["post_date"].split(", "):
-                date_el = container.select_one(selector)
+            for selector in self._selectors["post_date"]:
+                date_el = selector.select_one(container)
                 if date_el:
                     datetime_attr = date_el.get("datetime")
                     if datetime_attr:
                         try:
-                            date = datetime.fromisoformat(datetime_attr.replace("Z", "+00:00"))
+                            date = datetime.fromisoformat(datetime_attr)
                         except:
                             pass
                     if not date:
-                        date = self._parse_german_date(date_el.get_text(strip=True))
+                        date = parse_relative_german_date(date_el.get_text(strip=True))
                     if date:
                         break
             
             # Reactions/likes for rating
             rating = None
-            for selector in self.SELECTORS["reactions"].split(", "):
-                reactions_el = container.select_one(selector)
+            for selector in self._selectors["reactions"]:
+                reactions_el = selector.select_one(container)
                 if reactions_el:
                     reaction_text = reactions_el.get_text(strip=True)
-                    match = re.search(r"(\d+)", reaction_text)
+                    match = _DIGITS_RE.search(reaction_text)
                     if match:
                         likes = int(match.group(1))
-                        if likes >= 10:
-                            rating = 5.0
-                        elif likes >= 5:
-                            rating = 4.0
-                        elif likes >= 2:
-                            rating = 3.0
-                        else:
-                            rating = 2.0
+                        rating = _LIKE_RATINGS[bisect_right(_LIKE_THRESHOLDS, likes)]
                     break
             
             return self._review_factory.create(
@@ -214,50 +277,6 @@ class MotorTalkScraper(BaseScraper):
             logger.warning(f"[{self.name}] Error extracting post: {e}")
             return None
 
-    def _parse_german_date(self, text: str) -> datetime | None:
-        """Parse German date formats."""
-        if not text:
-            return None
-        
-        text_lower = text.lower()
-        
-        # Relative dates
-        if "heute" in text_lower:
-            return datetime.now()
-        if "gestern" in text_lower:
-            from datetime import timedelta
-            return datetime.now() - timedelta(days=1)
-        
-        # German months
-        german_months = {
-            "januar": 1, "februar": 2, "märz": 3, "april": 4,
-            "mai": 5, "juni": 6, "juli": 7, "august": 8,
-            "september": 9, "oktober": 10, "november": 11, "dezember": 12,
-        }
-        
-        # Pattern: "12. Februar 2025"
-        match = re.search(r"(\d{1,2})\.\s*(\w+)\s*(\d{4})", text_lower)
-        if match:
-            day = int(match.group(1))
-            month_name = match.group(2)
-            year = int(match.group(3))
-            month = german_months.get(month_name)
-            if month:
-                try:
-                    return datetime(year, month, day)
-                except:
-                    pass
-        
-        # Pattern: "12.02.2025"
-        match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", text)
-        if match:
-            try:
-                return datetime(int(match.group(3)), int(match.group(2)), int(match.group(1)))
-            except:
-                pass
-        
-        return None
-
     def parse_review_element(self, element: Tag) -> Review | None:
         """Not used directly."""
         return None
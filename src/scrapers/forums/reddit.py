@@ -170,7 +170,7 @@ class RedditScraper(BaseScraper):
                 datetime_attr = time_el.get("datetime")
                 if datetime_attr:
                     try:
-                        date = datetime.fromisoformat(datetime_attr.replace("Z", "+00:00"))
+                        date = datetime.fromisoformat(datetime_attr)
                     except:
                         pass
             
@@ -245,7 +245,7 @@ class RedditScraper(BaseScraper):
                 datetime_attr = time_el.get("datetime")
                 if datetime_attr:
                     try:
-                        date = datetime.fromisoformat(datetime_attr.replace("Z", "+00:00"))
+                        date = datetime.fromisoformat(datetime_attr)
                     except:
                         pass
             
@@ -1,7 +1,6 @@
 """Gelbe Seiten (German Yellow Pages) review scraper."""
 
 import re
-from datetime import datetime
 from urllib.parse import quote, urljoin
 
 import requests
@@ -10,6 +9,7 @@ from loguru import logger
 
 from src.core.base_scraper import BaseScraper
 from src.models.review import Review, ReviewFactory
+from src.utils.date_utils import parse_german_date
 
 
 class GelbeSeitenScraper(BaseScraper):
@@ -78,7 +78,7 @@ class GelbeSeitenScraper(BaseScraper):
         
         # Find business links
         business_links = []
-        for selector in self.SELECTORS["business_link"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["business_link"]:
             links = soup.select(selector)
             for link in links:
                 href = link.get("href", "")
@@ -112,7 +112,7 @@ class GelbeSeitenScraper(BaseScraper):
         
         # Get business name
         business_name = None
-        for selector in self.SELECTORS["business_name"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["business_name"]:
             name_el = soup.select_one(selector)
             if name_el:
                 business_name = name_el.get_text(strip=True)
@@ -121,7 +121,7 @@ class GelbeSeitenScraper(BaseScraper):
         
         # Find review containers
         containers = []
-        for selector in self.SELECTORS["review_container"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["review_container"]:
             containers = soup.select(selector)
             if containers:
                 break
@@ -144,7 +144,7 @@ class GelbeSeitenScraper(BaseScraper):
         try:
             # Review text
             text = None
-            for selector in self.SELECTORS["review_text"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["review_text"]:
                 text_el = container.select_one(selector)
                 if text_el:
                     text = text_el.get_text(strip=True)
@@ -163,16 +163,16 @@ class GelbeSeitenScraper(BaseScraper):
             
             # Date
             date = None
-            for selector in self.SELECTORS["date"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["date"]:
                 date_el = container.select_one(selector)
                 if date_el:
-                    date = self._parse_german_date(date_el.get_text(strip=True))
+                    date = parse_german_date(date_el.get_text(strip=True))
                     if date:
                         break
             
             # Author
             author = None
-            for selector in self.SELECTORS["author"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["author"]:
                 author_el = container.select_one(selector)
                 if author_el:
                     author = author_el.get_text(strip=True)
@@ -196,7 +196,7 @@ class GelbeSeitenScraper(BaseScraper):
     def _extract_rating(self, container: Tag) -> float | None:
         """Extract rating from various formats."""
         # Try star count
-        for selector in self.SELECTORS["rating"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["rating"]:
             rating_el = container.select_one(selector)
             if rating_el:
                 # Check for filled stars
@@ -220,7 +220,7 @@ class GelbeSeitenScraper(BaseScraper):
 
     def _extract_overall_rating(self, soup: BeautifulSoup, source_url: str, business_name: str | None) -> Review | None:
         """Extract overall rating as a summary review."""
-        for selector in self.SELECTORS["overall_rating"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["overall_rating"]:
             rating_el = soup.select_one(selector)
             if rating_el:
                 text = rating_el.get_text(strip=True)
@@ -241,42 +241,6 @@ class GelbeSeitenScraper(BaseScraper):
         
         return None
 
-    def _parse_german_date(self, text: str) -> datetime | None:
-        """Parse German date formats."""
-        if not text:
-            return None
-        
-        german_months = {
-            "januar": 1, "februar": 2, "märz": 3, "april": 4,
-            "mai": 5, "juni": 6, "juli": 7, "august": 8,
-            "september": 9, "oktober": 10, "november": 11, "dezember": 12,
-        }
-        
-        text_lower = text.lower().strip()
-        
-        # Pattern: "27. November 2025"
-        match = re.search(r"(\d{1,2})\.\s*(\w+)\s*(\d{4})", text_lower)
-        if match:
-            day = int(match.group(1))
-            month_name = match.group(2)
-            year = int(match.group(3))
-            month = german_months.get(month_name)
-            if month:
-                try:
-                    return datetime(year, month, day)
-                except:
-                    pass
-        
-        # Pattern: "27.11.2025"
-        match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", text)
-        if match:
-            try:
-                return datetime(int(match.group(3)), int(match.group(2)), int(match.group(1)))
-            except:
-                pass
-        
-        return None
-
     def parse_review_element(self, element: Tag) -> Review | None:
         """Parse review element - calls _extract_review."""
         return self._extract_review(element, "", None)
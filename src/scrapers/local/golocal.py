@@ -1,7 +1,6 @@
 """GoLocal.de local business review scraper."""
 
 import re
-from datetime import datetime
 from urllib.parse import quote, urljoin
 
 import requests
@@ -10,6 +9,7 @@ from loguru import logger
 
 from src.core.base_scraper import BaseScraper
 from src.models.review import Review, ReviewFactory
+from src.utils.date_utils import parse_german_date
 
 
 class GoLocalScraper(BaseScraper):
@@ -107,7 +107,7 @@ class GoLocalScraper(BaseScraper):
         
         # Get business name
         business_name = None
-        for selector in self.SELECTORS["business_name"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["business_name"]:
             name_el = soup.select_one(selector)
             if name_el:
                 business_name = name_el.get_text(strip=True)
@@ -116,7 +116,7 @@ class GoLocalScraper(BaseScraper):
         
         # Find reviews
         containers = []
-        for selector in self.SELECTORS["review_container"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["review_container"]:
             containers = soup.select(selector)
             if containers:
                 break
@@ -134,7 +134,7 @@ class GoLocalScraper(BaseScraper):
             text_parts = []
             
             # Title
-            for selector in self.SELECTORS["review_title"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["review_title"]:
                 title_el = container.select_one(selector)
                 if title_el:
                     title = title_el.get_text(strip=True)
@@ -143,7 +143,7 @@ class GoLocalScraper(BaseScraper):
                     break
             
             # Review text
-            for selector in self.SELECTORS["review_text"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["review_text"]:
                 text_el = container.select_one(selector)
                 if text_el:
                     text = text_el.get_text(strip=True)
@@ -164,16 +164,16 @@ class GoLocalScraper(BaseScraper):
             
             # Date
             date = None
-            for selector in self.SELECTORS["date"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["date"]:
                 date_el = container.select_one(selector)
                 if date_el:
-                    date = self._parse_german_date(date_el.get_text(strip=True))
+                    date = parse_german_date(date_el.get_text(strip=True))
                     if date:
                         break
             
             # Author
             author = None
-            for selector in self.SELECTORS["author"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["author"]:
                 author_el = container.select_one(selector)
                 if author_el:
                     author = author_el.get_text(strip=True)
@@ -196,7 +196,7 @@ class GoLocalScraper(BaseScraper):
 
     def _extract_rating(self, container: Tag) -> float | None:
         """Extract rating from element."""
-        for selector in self.SELECTORS["rating"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["rating"]:
             rating_el = container.select_one(selector)
             if rating_el:
                 # Count filled stars
@@ -212,40 +212,6 @@ class GoLocalScraper(BaseScraper):
         
         return None
 
-    def _parse_german_date(self, text: str) -> datetime | None:
-        """Parse German date formats."""
-        if not text:
-            return None
-        
-        german_months = {
-            "januar": 1, "februar": 2, "märz": 3, "april": 4,
-            "mai": 5, "juni": 6, "juli": 7, "august": 8,
-            "september": 9, "oktober": 10, "november": 11, "dezember": 12,
-        }
-        
-        text_lower = text.lower().strip()
-        
-        match = re.search(r"(\d{1,2})\.\s*(\w+)\s*(\d{4})", text_lower)
-        if match:
-            day = int(match.group(1))
-            month_name = match.group(2)
-            year = int(match.group(3))
-            month = german_months.get(month_name)
-            if month:
-                try:
-                    return datetime(year, month, day)
-                except:
-                    pass
-        
-        match = re.search(r"(\d{1,2})\.(\d{1,2})\.(\d{4})", text)
-        if match:
-            try:
-                return datetime(int(match.group(3)), int(match.group(2)), int(match.group(1)))
-            except:
-                pass
-        
-        return None
-
     def parse_review_element(self, element: Tag) -> Review | None:
         """Parse review element."""
         return self._extract_review(element, "", None)
@@ -124,7 +124,7 @@ class GoogleMapsScraper(BaseScraper):
             date_str = data.get('review_datetime_utc')
             if date_str:
                 try:
-                    date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                    date = datetime.fromisoformat(date_str)
                 except:
                     pass
             
@@ -149,7 +149,7 @@ class GoogleMapsScraper(BaseScraper):
                     if isinstance(date_str, (int, float)):
                         date = datetime.fromtimestamp(date_str)
                     else:
-                        date = datetime.fromisoformat(str(date_str).replace('Z', '+00:00'))
+                        date = datetime.fromisoformat(str(date_str))
                 except:
                     pass
             
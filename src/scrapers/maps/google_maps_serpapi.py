@@ -220,7 +220,7 @@ class GoogleMapsSerpApiScraper(BaseScraper):
             date_str = data.get("iso_date") or data.get("date")
             if date_str:
                 try:
-                    date = datetime.fromisoformat(str(date_str).replace('Z', '+00:00'))
+                    date = datetime.fromisoformat(str(date_str))
                 except:
                     # Try to parse relative date
                     date = self._parse_relative_date(date_str)
@@ -77,7 +77,7 @@ class KununuScraper(BaseScraper):
 
         # Find review containers - try multiple selectors
         containers = []
-        for selector in self.SELECTORS["review_container"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["review_container"]:
             containers = soup.select(selector)
             if containers:
                 break
@@ -106,7 +106,7 @@ class KununuScraper(BaseScraper):
             
             # Main review title
             title = None
-            for selector in self.SELECTORS["review_title"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["review_title"]:
                 title_el = element.select_one(selector)
                 if title_el:
                     title = title_el.get_text(strip=True)
@@ -115,7 +115,7 @@ class KununuScraper(BaseScraper):
                     break
 
             # Main description/text
-            for selector in self.SELECTORS["review_text"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["review_text"]:
                 text_el = element.select_one(selector)
                 if text_el:
                     text = text_el.get_text(strip=True)
@@ -124,7 +124,7 @@ class KununuScraper(BaseScraper):
                     break
 
             # Pros (Gut am Arbeitgeber)
-            for selector in self.SELECTORS["pros"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["pros"]:
                 pros_el = element.select_one(selector)
                 if pros_el:
                     pros_text = pros_el.get_text(strip=True)
@@ -133,7 +133,7 @@ class KununuScraper(BaseScraper):
                     break
 
             # Cons (Schlecht am Arbeitgeber)
-            for selector in self.SELECTORS["cons"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["cons"]:
                 cons_el = element.select_one(selector)
                 if cons_el:
                     cons_text = cons_el.get_text(strip=True)
@@ -148,7 +148,7 @@ class KununuScraper(BaseScraper):
 
             # Extract rating (Kununu uses 1-5 scale)
             rating = None
-            for selector in self.SELECTORS["rating"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["rating"]:
                 rating_el = element.select_one(selector)
                 if rating_el:
                     rating_text = rating_el.get_text(strip=True)
@@ -166,7 +166,7 @@ class KununuScraper(BaseScraper):
 
             # Extract date
             date = None
-            for selector in self.SELECTORS["date"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["date"]:
                 date_el = element.select_one(selector)
                 if date_el:
                     date_text = date_el.get_text(strip=True)
@@ -181,7 +181,7 @@ class KununuScraper(BaseScraper):
 
             # Extract author info (job title + department)
             author_parts = []
-            for selector in self.SELECTORS["author_position"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["author_position"]:
                 pos_el = element.select_one(selector)
                 if pos_el:
                     pos = pos_el.get_text(strip=True)
@@ -189,7 +189,7 @@ class KununuScraper(BaseScraper):
                         author_parts.append(pos)
                     break
             
-            for selector in self.SELECTORS["author_department"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["author_department"]:
                 dept_el = element.select_one(selector)
                 if dept_el:
                     dept = dept_el.get_text(strip=True)
@@ -221,7 +221,7 @@ class KununuScraper(BaseScraper):
         
         # Try ISO format first
         try:
-            return datetime.fromisoformat(date_text.replace("Z", "+00:00"))
+            return datetime.fromisoformat(date_text)
         except ValueError:
             pass
         
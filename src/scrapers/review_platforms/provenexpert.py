@@ -60,7 +60,7 @@ class ProvenExpertScraper(BaseScraper):
 
         # Try to find review containers
         containers = []
-        for selector in self.SELECTORS["review_container"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["review_container"]:
             containers = soup.select(selector)
             if containers:
                 break
@@ -80,7 +80,7 @@ class ProvenExpertScraper(BaseScraper):
         try:
             # Get review text
             text = None
-            for selector in self.SELECTORS["review_text"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["review_text"]:
                 text_el = element.select_one(selector)
                 if text_el:
                     text = text_el.get_text(strip=True)
@@ -92,7 +92,7 @@ class ProvenExpertScraper(BaseScraper):
 
             # Get rating
             rating = None
-            for selector in self.SELECTORS["rating"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["rating"]:
                 rating_el = element.select_one(selector)
                 if rating_el:
                     # Try to extract from class or data attribute
@@ -110,7 +110,7 @@ class ProvenExpertScraper(BaseScraper):
 
             # Get date
             date = None
-            for selector in self.SELECTORS["date"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["date"]:
                 date_el = element.select_one(selector)
                 if date_el:
                     date_text = date_el.get_text(strip=True)
@@ -120,7 +120,7 @@ class ProvenExpertScraper(BaseScraper):
 
             # Get author
             author = None
-            for selector in self.SELECTORS["author"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["author"]:
                 author_el = element.select_one(selector)
                 if author_el:
                     author = author_el.get_text(strip=True)
@@ -68,7 +68,7 @@ class ReclaboxScraper(BaseScraper):
 
         # Find complaint containers
         containers = []
-        for selector in self.SELECTORS["complaint_container"].split(", "):
+        for selector in self.SELECTOR_ALTERNATIVES["complaint_container"]:
             containers = soup.select(selector)
             if containers:
                 break
@@ -95,7 +95,7 @@ class ReclaboxScraper(BaseScraper):
             
             # Title
             title = None
-            for selector in self.SELECTORS["complaint_title"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["complaint_title"]:
                 title_el = element.select_one(selector)
                 if title_el:
                     title = title_el.get_text(strip=True)
@@ -104,7 +104,7 @@ class ReclaboxScraper(BaseScraper):
                     break
 
             # Main complaint text
-            for selector in self.SELECTORS["complaint_text"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["complaint_text"]:
                 text_el = element.select_one(selector)
                 if text_el:
                     text = text_el.get_text(strip=True)
@@ -113,7 +113,7 @@ class ReclaboxScraper(BaseScraper):
                     break
 
             # Category
-            for selector in self.SELECTORS["category"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["category"]:
                 cat_el = element.select_one(selector)
                 if cat_el:
                     cat = cat_el.get_text(strip=True)
@@ -127,7 +127,7 @@ class ReclaboxScraper(BaseScraper):
 
             # Date
             date = None
-            for selector in self.SELECTORS["date"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["date"]:
                 date_el = element.select_one(selector)
                 if date_el:
                     date_text = date_el.get_text(strip=True)
@@ -137,7 +137,7 @@ class ReclaboxScraper(BaseScraper):
 
             # Status (resolved, unresolved, etc.)
             status = None
-            for selector in self.SELECTORS["status"].split(", "):
+            for selector in self.SELECTOR_ALTERNATIVES["status"]:
                 status_el = element.select_one(selector)
                 if status_el:
                     status = status_el.get_text(strip=True)
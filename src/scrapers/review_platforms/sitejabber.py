@@ -97,7 +97,7 @@ class SitejabberScraper(BaseScraper):
                 datetime_str = date_el.get("datetime", "")
                 if datetime_str:
                     try:
-                        date = datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
+                        date = datetime.fromisoformat(datetime_str)
                     except ValueError:
                         pass
 
@@ -142,7 +142,7 @@ class TrustpilotScraper(BaseScraper):
                 datetime_str = date_el.get("datetime", "")
                 if datetime_str:
                     try:
-                        date = datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
+                        date = datetime.fromisoformat(datetime_str)
                     except ValueError:
                         pass
 
@@ -113,7 +113,7 @@ class JsonStorage(FileStorage):
                 reviews = []
                 for item in data:
                     try:
-                        review = Review(**item)
+                        review = Review.from_dict(item)
                         reviews.append(review)
                     except Exception as e:
                         logger.warning(f"Error parsing review: {e}")
@@ -218,7 +218,7 @@ class JsonLinesStorage(FileStorage):
                         continue
                     try:
                         data = json.loads(line)
-                        reviews.append(Review(**data))
+                        reviews.append(Review.from_dict(data))
                     except Exception as e:
                         logger.warning(f"Error parsing line: {e}")
 
@@ -0,0 +1,29 @@
+"""Async helpers."""
+
+import asyncio
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+# Worker threads for blocking library calls (app store scrapers, etc.)
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_configured_loops: weakref.WeakSet = weakref.WeakSet()
+
+
+def use_shared_executor() -> None:
+    """
+    Give the running loop a bounded default executor for asyncio.to_thread.
+
+    All blocking calls made through asyncio.to_thread in this loop share one
+    pool of MAX_WORKERS threads. The pool belongs to the loop, so
+    asyncio.run() shuts it down with the loop and a later loop gets a fresh
+    one. Calling this again in the same loop is a no-op.
+    """
+    loop = asyncio.get_running_loop()
+    if loop in _configured_loops:
+        return
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="scraper")
+    )
+    _configured_loops.add(loop)
@@ -0,0 +1,50 @@
+"""Small in-process caches shared by scrapers."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+
+# Enough for several full scrapes of a large app while staying a few MB
+SEEN_IDS_MAX = 200_000
+
+
+class SeenIds:
+    """
+    Bounded record of recently seen review IDs.
+
+    Paginated APIs sometimes return the same review twice (overlapping
+    cursor windows, a rescrape of the same app). Checking the source ID
+    here lets a scraper drop the repeat before building a Review. Once
+    ``maxsize`` IDs are recorded, the least recently seen one is evicted.
+    """
+
+    def __init__(self, maxsize: int = SEEN_IDS_MAX):
+        self.maxsize = maxsize
+        self._ids: OrderedDict[Hashable, None] = OrderedDict()
+
+    def check_new(self, review_id: Hashable | None) -> bool:
+        """
+        Check an ID and record it if it is new.
+
+        Missing IDs (None or empty) cannot be compared, so they always
+        count as new and are not recorded.
+
+        Returns:
+            True if the ID is new, False if it was seen recently
+        """
+        if not review_id:
+            return True
+        ids = self._ids
+        if review_id in ids:
+            ids.move_to_end(review_id)
+            return False
+        ids[review_id] = None
+        if len(ids) > self.maxsize:
+            ids.popitem(last=False)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def clear(self) -> None:
+        """Forget all recorded IDs."""
+        self._ids.clear()
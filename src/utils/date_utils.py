@@ -0,0 +1,79 @@
+"""Date helpers shared by scrapers."""
+
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+GERMAN_MONTHS = {
+    "januar": 1, "februar": 2, "märz": 3, "april": 4,
+    "mai": 5, "juni": 6, "juli": 7, "august": 8,
+    "september": 9, "oktober": 10, "november": 11, "dezember": 12,
+}
+
+# Only real month names match, case-insensitively, so the text is neither
+# lowercased nor matched against arbitrary words
+_GERMAN_DATE_RE = re.compile(
+    r"(\d{1,2})\.\s*(" + "|".join(GERMAN_MONTHS) + r")\s*(\d{4})",
+    re.IGNORECASE,
+)
+_DOTTED_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+
+
+@lru_cache(maxsize=4096)
+def parse_german_date(text: str) -> datetime | None:
+    """
+    Parse an absolute German date ("27. November 2025" or "27.11.2025").
+
+    Cached, since the same date strings repeat across a page or thread.
+    Relative dates are handled by parse_relative_german_date.
+
+    Args:
+        text: Text containing the date
+
+    Returns:
+        The date, or None if no valid date was found
+    """
+    if not text:
+        return None
+
+    match = _GERMAN_DATE_RE.search(text)
+    if match:
+        month = GERMAN_MONTHS[match.group(2).lower()]
+        try:
+            return datetime(int(match.group(3)), month, int(match.group(1)))
+        except ValueError:
+            pass
+
+    match = _DOTTED_DATE_RE.search(text)
+    if match:
+        try:
+            return datetime(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+        except ValueError:
+            pass
+
+    return None
+
+
+def parse_relative_german_date(text: str) -> datetime | None:
+    """
+    Parse a German date that may be relative ("heute", "gestern").
+
+    Relative dates depend on the current time and are never cached;
+    anything else goes through the cached parse_german_date.
+
+    Args:
+        text: Text containing the date
+
+    Returns:
+        The date, or None if no valid date was found
+    """
+    if not text:
+        return None
+
+    text_lower = text.lower()
+    if "heute" in text_lower:
+        return datetime.now()
+    if "gestern" in text_lower:
+        return datetime.now() - timedelta(days=1)
+
+    return parse_german_date(text)
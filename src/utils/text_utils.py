@@ -0,0 +1,26 @@
+"""Text helpers shared by scrapers and the pipeline."""
+
+import sys
+
+# Pool of review texts seen in this process. Store reviews repeat a lot of
+# boilerplate ("Super App!", "Top!"), so identical texts share one object.
+_TEXT_POOL: dict[str, str] = {}
+_TEXT_POOL_MAX = 200_000
+_INTERN_MAX_LEN = 64
+
+
+def intern_text(text: str) -> str:
+    """
+    Return a canonical instance of a text.
+
+    Short texts go through sys.intern; longer ones through a bounded
+    process-wide pool. Once the pool is full, new texts are returned as-is.
+    """
+    if len(text) < _INTERN_MAX_LEN:
+        return sys.intern(text)
+    pooled = _TEXT_POOL.get(text)
+    if pooled is not None:
+        return pooled
+    if len(_TEXT_POOL) < _TEXT_POOL_MAX:
+        _TEXT_POOL[text] = text
+    return text
@@ -0,0 +1,26 @@
+"""URL helpers shared by scrapers."""
+
+from urllib.parse import urljoin
+
+
+def absolute_url(base_url: str, href: str) -> str:
+    """
+    Resolve a link found on a page of ``base_url``'s site.
+
+    Absolute links and root-relative paths ("/frage/...") are handled with
+    string checks, which covers nearly every link on a results page;
+    anything else (page-relative, protocol-relative, dot segments) goes
+    through urljoin.
+
+    Args:
+        base_url: Site root without a trailing slash (e.g. "https://www.gutefrage.net")
+        href: Link as found in the page
+
+    Returns:
+        Absolute URL
+    """
+    if href.startswith(("https://", "http://")):
+        return href
+    if href.startswith("/") and not href.startswith("//") and "/." not in href:
+        return base_url + href
+    return urljoin(base_url, href)
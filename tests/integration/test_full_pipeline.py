@@ -1,9 +1,11 @@
 """Tests for data models."""
 
+import json
+
 import pytest
 from datetime import datetime
 
-from src.models.review import Review, ReviewFactory, ReviewBatch
+from src.models.review import Review, ReviewFactory, ReviewBatch, ReviewColumns
 
 
 class TestReview:
@@ -58,6 +60,16 @@ class TestReview:
         with pytest.raises(ValueError):
             Review(id=1, text="")
 
+    def test_rating_validation(self):
+        """Test that out-of-range ratings are rejected."""
+        with pytest.raises(ValueError):
+            Review(id=1, text="Test review", rating=6.0)
+
+    def test_date_from_iso_string(self):
+        """Test that ISO date strings (e.g. reloaded exports) become datetimes."""
+        review = Review(id=1, text="Test review", date="2024-01-15T10:30:00")
+        assert review.date == datetime(2024, 1, 15, 10, 30)
+
 
 class TestReviewFactory:
     """Tests for the ReviewFactory."""
@@ -76,6 +88,26 @@ class TestReviewFactory:
         assert len(reviews) == 3
         assert all(r.source == "test" for r in reviews)
 
+    def test_create_many(self, review_factory):
+        """Test creation from per-field columns."""
+        reviews = review_factory.create_many(
+            {"text": ["Review 1", "Review 2"], "rating": [4.0, None]},
+            source="test",
+        )
+        assert [r.id for r in reviews] == [1, 2]
+        assert [r.rating for r in reviews] == [4.0, None]
+        assert all(r.source == "test" for r in reviews)
+        with pytest.raises(ValueError):
+            review_factory.create_many({"text": ["Review"], "rating": [6.0]})
+
+    def test_create_fast(self, review_factory):
+        """Test positional creation matches create()."""
+        review = review_factory.create_fast("Fast review", "test", None, "42", 5.0, None, "alice", 3)
+        assert review.id == 1
+        assert (review.source_id, review.rating, review.author) == ("42", 5.0, "alice")
+        assert review.helpful_count == 3
+        assert review.title is None
+
 
 class TestReviewBatch:
     """Tests for ReviewBatch."""
@@ -91,4 +123,27 @@ class TestReviewBatch:
         batch = ReviewBatch(reviews=sample_reviews)
         export = batch.to_export_list()
         assert len(export) == len(sample_reviews)
-        assert all("id" in item and "text" in item for item in export)
\ No newline at end of file
+        assert all("id" in item and "text" in item for item in export)
+
+    def test_jsonl_bytes(self, sample_reviews):
+        """Test exporting batch as JSON lines."""
+        batch = ReviewBatch(reviews=sample_reviews)
+        lines = batch.to_jsonl_bytes().splitlines()
+        assert len(lines) == len(sample_reviews)
+        assert json.loads(lines[0]) == sample_reviews[0].to_export_dict()
+
+
+class TestReviewColumns:
+    """Tests for ReviewColumns."""
+
+    def test_to_reviews_selected_rows(self, review_factory):
+        """Test materializing only selected rows."""
+        columns = ReviewColumns(source="test")
+        columns.append("First review", rating=4.0)
+        columns.append("Second review")
+        reviews = columns.to_reviews(review_factory, [1])
+        assert len(reviews) == 1
+        assert reviews[0].id == 1
+        assert reviews[0].text == "Second review"
+        assert reviews[0].rating is None
+        assert reviews[0].source == "test"
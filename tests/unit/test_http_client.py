@@ -0,0 +1,125 @@
+"""Tests for the HTTP client's shared connection pool."""
+
+import asyncio
+from time import monotonic
+
+import httpx
+import pytest
+
+from config.settings import settings
+from src.core import http_client
+from src.core.http_client import HttpClient, HttpClientPool, close_shared_clients
+
+
+@pytest.fixture(autouse=True)
+def mock_async_client(monkeypatch):
+    """
+    Build clients on a mock transport, so no request leaves the process.
+
+    Yields a dict whose "handler" (sync or async) answers the requests.
+    """
+    real_client = httpx.AsyncClient
+    mock = {"handler": lambda request: httpx.Response(200, text="ok")}
+    transport = httpx.MockTransport(lambda request: mock["handler"](request))
+
+    def make_client(**kwargs):
+        kwargs["http2"] = False
+        kwargs["transport"] = transport
+        return real_client(**kwargs)
+
+    monkeypatch.setattr(http_client.httpx, "AsyncClient", make_client)
+    yield mock
+    http_client._CLIENTS.clear()
+    http_client._REFS.clear()
+    http_client._IDLE_TIMERS.clear()
+
+
+class TestSharedClient:
+    """Tests for HttpClient's per-loop shared client."""
+
+    async def test_same_loop_shares_client(self):
+        """Test that two HttpClients on one loop use the same AsyncClient."""
+        async with HttpClient() as first, HttpClient() as second:
+            assert first._client is second._client
+        await close_shared_clients()
+
+    def test_separate_loops_get_separate_clients(self):
+        """Test that each asyncio.run gets its own AsyncClient."""
+
+        async def scrape() -> httpx.AsyncClient:
+            async with HttpClient() as client:
+                shared = client._client
+            await close_shared_clients()
+            return shared
+
+        first = asyncio.run(scrape())
+        second = asyncio.run(scrape())
+
+        assert first is not second
+        assert first.is_closed and second.is_closed
+
+    async def test_reuse_within_linger_window(self):
+        """Test that a client released moments ago is reused, not reopened."""
+        async with HttpClient() as client:
+            shared = client._client
+
+        assert not shared.is_closed
+        async with HttpClient() as client:
+            assert client._client is shared
+        await close_shared_clients()
+
+    async def test_idle_client_closed_after_linger(self, monkeypatch):
+        """Test that an unreferenced client closes after one keep-alive period."""
+        monkeypatch.setattr(settings, "http_keepalive_expiry", 0.01)
+        async with HttpClient() as client:
+            shared = client._client
+
+        await asyncio.sleep(0.05)
+        await close_shared_clients()
+
+        assert shared.is_closed
+        async with HttpClient() as client:
+            assert client._client is not shared
+        await close_shared_clients()
+
+    async def test_close_shared_clients(self):
+        """Test that close_shared_clients closes an idle client right away."""
+        async with HttpClient() as client:
+            shared = client._client
+
+        await close_shared_clients()
+
+        assert shared.is_closed
+        assert not http_client._CLIENTS
+        assert not http_client._IDLE_TIMERS
+
+    async def test_requests_go_through_shared_client(self, monkeypatch):
+        """Test that a request on a shared client goes through its transport."""
+        async with HttpClient() as client:
+            monkeypatch.setattr(client.delay_manager, "get_delay", lambda: 0.0)
+            assert await client.get_text("https://example.com/") == "ok"
+        await close_shared_clients()
+
+
+class TestHttpClientPool:
+    """Tests for HttpClientPool concurrency."""
+
+    async def test_slots_run_concurrently(self, mock_async_client, monkeypatch):
+        """Test that a proxy-less pool's slots are not spaced one delay apart."""
+        starts = []
+
+        async def handler(request):
+            starts.append(monotonic())
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, text="ok")
+
+        mock_async_client["handler"] = handler
+        monkeypatch.setattr(http_client._shared_delay_manager(), "get_delay", lambda: 0.5)
+
+        async with HttpClientPool(size=3) as pool:
+            responses = await asyncio.gather(
+                *(pool.get(f"https://example.com/{i}") for i in range(3))
+            )
+
+        assert [r.text for r in responses] == ["ok"] * 3
+        assert max(starts) - min(starts) < 0.25
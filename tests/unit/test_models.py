@@ -0,0 +1,81 @@
+"""Tests for the Review model."""
+
+import json
+
+import pytest
+
+from src.models.review import Review
+from src.storage.json_storage import JsonLinesStorage, JsonStorage
+
+
+class TestReviewFromDict:
+    """Tests for Review.from_dict, used when reloading stored reviews."""
+
+    def test_ignores_unknown_keys(self):
+        """Test that keys which are not Review fields are dropped."""
+        review = Review.from_dict({"id": 1, "text": "Great!", "metadata": {"x": 1}})
+        assert review.id == 1
+        assert review.text == "Great!"
+
+    def test_coerces_numeric_strings(self):
+        """Test that numeric strings become numbers."""
+        review = Review.from_dict(
+            {"id": "7", "text": "Great!", "rating": "4", "helpful_count": "12"}
+        )
+        assert review.id == 7
+        assert review.rating == 4.0
+        assert isinstance(review.rating, float)
+        assert review.helpful_count == 12
+
+    def test_blank_numbers_become_none(self):
+        """Test that empty strings in numeric fields are treated as missing."""
+        review = Review.from_dict({"id": 1, "text": "Great!", "rating": " ", "helpful_count": ""})
+        assert review.rating is None
+        assert review.helpful_count is None
+
+    def test_round_trip(self):
+        """Test that a full dict export loads back to an equal review."""
+        original = Review(id=3, text="Great!", source="test", rating=4.5, helpful_count=2)
+        data = json.loads(json.dumps(original.to_full_dict(), default=str))
+        assert Review.from_dict(data) == original
+
+    @pytest.mark.parametrize("data", [
+        {"id": 1, "text": "Great!", "rating": "viele"},
+        {"id": 1, "text": "Great!", "rating": "9"},
+        {"id": 1, "text": ""},
+    ])
+    def test_invalid_values_raise(self, data):
+        """Test that values which cannot be coerced still raise ValueError."""
+        with pytest.raises(ValueError):
+            Review.from_dict(data)
+
+
+class TestJsonStorageLoad:
+    """Tests for reloading stored reviews."""
+
+    async def test_json_load_skips_only_bad_records(self, tmp_path):
+        """Test that extra keys and string ratings load and bad records are skipped."""
+        path = tmp_path / "reviews.json"
+        path.write_text(json.dumps([
+            {"id": 1, "text": "Great!", "rating": "4", "metadata": {}},
+            {"id": 2, "text": "Okay.", "rating": "viele"},
+            {"id": 3, "text": "Bad."},
+        ]), encoding="utf-8")
+
+        reviews = await JsonStorage(path).load()
+
+        assert [r.id for r in reviews] == [1, 3]
+        assert reviews[0].rating == 4.0
+
+    async def test_jsonl_load(self, tmp_path):
+        """Test that JSON Lines records load through Review.from_dict."""
+        path = tmp_path / "reviews.jsonl"
+        path.write_text(
+            '{"id": 1, "text": "Great!", "helpful_count": "3", "extra": true}\n',
+            encoding="utf-8",
+        )
+
+        reviews = await JsonLinesStorage(path).load()
+
+        assert len(reviews) == 1
+        assert reviews[0].helpful_count == 3
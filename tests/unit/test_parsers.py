@@ -0,0 +1,312 @@
+"""Tests for scraper parsing and pagination."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from time import monotonic
+from types import SimpleNamespace
+
+import pytest
+
+from src.models.review import Review
+from src.scrapers.apps import google_play
+from src.scrapers.apps.steam import SteamScraper
+from src.scrapers.ecommerce.amazon_de import AmazonDEScraper
+from src.scrapers.forums.gutefrage import GutefrageScraper
+from src.utils.date_utils import parse_german_date
+
+
+def steam_page(ids, cursor, success=1):
+    """Build a Steam reviews API page with one review per recommendation ID."""
+    return {
+        "success": success,
+        "cursor": cursor,
+        "reviews": [
+            {
+                "recommendationid": str(review_id),
+                "review": f"Review number {review_id} of this game.",
+                "voted_up": True,
+                "timestamp_created": 1700000000,
+                "author": {"steamid": "1", "playtime_forever": 60},
+                "votes_up": 0,
+            }
+            for review_id in ids
+        ],
+    }
+
+
+class StubSteamClient:
+    """HTTP client stub serving Steam API pages by cursor."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.cursors = []
+
+    async def get_json(self, url, params=None):
+        cursor = params["cursor"]
+        self.cursors.append(cursor)
+        return self.pages[cursor]
+
+
+STEAM_URL = "https://store.steampowered.com/app/42/"
+
+
+class TestSteamPagination:
+    """Tests for SteamScraper.scrape_reviews pagination."""
+
+    async def test_repeated_cursor_stops(self):
+        """Test that a cursor the API already returned ends pagination."""
+        client = StubSteamClient({
+            "*": steam_page([1, 2], "a"),
+            "a": steam_page([3, 4], "a"),
+        })
+        scraper = SteamScraper(http_client=client)
+
+        reviews = await scraper.scrape_reviews(STEAM_URL)
+
+        assert [r.source_id for r in reviews] == ["1", "2", "3", "4"]
+        assert client.cursors == ["*", "a"]
+
+    async def test_page_without_new_reviews_stops(self):
+        """Test that a page of already seen reviews ends pagination."""
+        client = StubSteamClient({
+            "*": steam_page([1, 2], "a"),
+            "a": steam_page([1, 2], "b"),
+            "b": steam_page([5], "c"),
+        })
+        scraper = SteamScraper(http_client=client)
+
+        reviews = await scraper.scrape_reviews(STEAM_URL)
+
+        assert [r.source_id for r in reviews] == ["1", "2"]
+        assert "c" not in client.cursors
+
+    async def test_rescrape_skips_seen_reviews(self):
+        """Test that the same scraper only returns unseen reviews on rescrape."""
+        client = StubSteamClient({"*": steam_page([1, 2], "")})
+        scraper = SteamScraper(http_client=client)
+
+        assert len(await scraper.scrape_reviews(STEAM_URL)) == 2
+        assert await scraper.scrape_reviews(STEAM_URL) == []
+
+    async def test_reset_seen_ids_allows_rescrape(self):
+        """Test that reset_seen_ids returns the full set again."""
+        client = StubSteamClient({"*": steam_page([1, 2], "")})
+        scraper = SteamScraper(http_client=client)
+
+        await scraper.scrape_reviews(STEAM_URL)
+        scraper.reset_seen_ids()
+
+        assert len(await scraper.scrape_reviews(STEAM_URL)) == 2
+
+
+class TestSteamPrefetch:
+    """Tests for SteamScraper's next-page prefetch."""
+
+    async def test_max_reviews_stops_exactly(self):
+        """Test that max_reviews returns exactly N without requesting an extra page."""
+        client = StubSteamClient({
+            "*": steam_page([1, 2, 3], "a"),
+            "a": steam_page([4, 5, 6], "b"),
+            "b": steam_page([7, 8, 9], "c"),
+        })
+        scraper = SteamScraper(http_client=client)
+
+        reviews = await scraper.scrape_reviews(STEAM_URL, max_reviews=5)
+
+        assert [r.source_id for r in reviews] == ["1", "2", "3", "4", "5"]
+        assert client.cursors == ["*", "a"]
+
+    async def test_pending_prefetch_cancelled_on_error(self):
+        """Test that an in-flight prefetch is cancelled when parsing raises."""
+        started = asyncio.Event()
+        prefetch: list[asyncio.Task] = []
+
+        class BlockingClient(StubSteamClient):
+            async def get_json(self, url, params=None):
+                if params["cursor"] == "*":
+                    return await super().get_json(url, params)
+                prefetch.append(asyncio.current_task())
+                started.set()
+                await asyncio.Event().wait()
+
+        class FailingSteamScraper(SteamScraper):
+            def _parse_api_reviews(self, data, source_url):
+                raise RuntimeError("parse failed")
+
+        client = BlockingClient({"*": steam_page([1, 2], "a")})
+        scraper = FailingSteamScraper(http_client=client)
+
+        assert await scraper.scrape_reviews(STEAM_URL) == []
+        assert started.is_set()
+        await asyncio.sleep(0)
+        assert prefetch[0].cancelled()
+
+
+AMAZON_PAGE = """
+<html><body>
+<h1 class="a-size-large product-title">ADAC Camping Guide</h1>
+<div data-hook="review"><span data-hook="review-body">Very useful guide for the trip.</span></div>
+<div data-hook="review"><span data-hook="review-body">Maps are a bit outdated.</span></div>
+</body></html>
+"""
+
+
+class TestAmazonProductName:
+    """Tests for AmazonDEScraper's product name lookup."""
+
+    @pytest.fixture
+    def scraper(self):
+        """An Amazon scraper whose reviews keep only the body text."""
+
+        class BodyOnlyScraper(AmazonDEScraper):
+            def parse_review_element(self, element):
+                return Review(id=0, text=element.get_text(strip=True))
+
+        return BodyOnlyScraper()
+
+    def test_product_title_outside_strainer(self, scraper):
+        """Test that a .product-title outside the review subtrees is found."""
+        reviews = scraper._parse_reviews(AMAZON_PAGE, "https://www.amazon.de/product-reviews/B000000000")
+
+        assert len(reviews) == 2
+        assert all(r.product_name == "ADAC Camping Guide" for r in reviews)
+
+    def test_product_link_preferred(self, scraper):
+        """Test that a product-link is used without a second pass."""
+        html = AMAZON_PAGE.replace(
+            "<h1", '<a data-hook="product-link">ADAC Reiseführer</a><h1', 1
+        )
+        reviews = scraper._parse_reviews(html, "https://www.amazon.de/product-reviews/B000000000")
+
+        assert all(r.product_name == "ADAC Reiseführer" for r in reviews)
+
+
+class StubForumClient:
+    """HTTP client stub serving a search page and slow question pages."""
+
+    def __init__(self, search_html, delay):
+        self.search_html = search_html
+        self.starts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay_manager = SimpleNamespace(get_delay=lambda: delay)
+
+    async def get_text(self, url, **kwargs):
+        if "/suche" in url:
+            return self.search_html
+        self.starts.append(monotonic())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.1)
+        self.in_flight -= 1
+        return "<html><body></body></html>"
+
+
+class TestGutefrageFetchWindow:
+    """Tests for GutefrageScraper's concurrent question fetches."""
+
+    async def test_fetches_spaced_but_concurrent(self):
+        """Test that question fetches start one delay apart and still overlap."""
+        links = "".join(f'<a href="/frage/q{i}">Q{i}</a>' for i in range(4))
+        client = StubForumClient(f"<html><body>{links}</body></html>", delay=0.03)
+        scraper = GutefrageScraper(http_client=client)
+
+        await scraper.scrape_reviews("ADAC Erfahrungen")
+
+        gaps = [b - a for a, b in zip(client.starts, client.starts[1:])]
+        assert len(client.starts) == 4
+        assert all(gap >= 0.025 for gap in gaps)
+        assert client.max_in_flight > 1
+
+
+class TestGooglePlaySeenIds:
+    """Tests for GooglePlayScraper's per-instance seen review IDs."""
+
+    @pytest.fixture
+    def scraper(self, monkeypatch):
+        """A Google Play scraper whose library call returns two fixed reviews."""
+        raw = [
+            {
+                "content": f"Review number {i} of this app.",
+                "score": 4,
+                "at": datetime(2025, 1, i),
+                "userName": "user",
+                "thumbsUpCount": 0,
+                "reviewId": f"gp:{i}",
+            }
+            for i in (1, 2)
+        ]
+        monkeypatch.setattr(google_play, "HAS_LIBRARY", True)
+        monkeypatch.setattr(google_play, "Sort", SimpleNamespace(NEWEST=2), raising=False)
+        monkeypatch.setattr(google_play, "reviews", lambda *a, **kw: (raw, None), raising=False)
+        return google_play.GooglePlayScraper(http_client=object())
+
+    async def test_rescrape_skips_seen_reviews(self, scraper):
+        """Test that the same scraper only returns unseen reviews on rescrape."""
+        assert len(await scraper.scrape_reviews("de.adac.android", max_reviews=10)) == 2
+        assert await scraper.scrape_reviews("de.adac.android", max_reviews=10) == []
+
+    async def test_reset_seen_ids_allows_rescrape(self, scraper):
+        """Test that reset_seen_ids returns the full set again."""
+        await scraper.scrape_reviews("de.adac.android", max_reviews=10)
+        scraper.reset_seen_ids()
+
+        assert len(await scraper.scrape_reviews("de.adac.android", max_reviews=10)) == 2
+
+
+class TestFinanzflussAsync:
+    """Tests for FinanzflussADACScraper's async entry point."""
+
+    @pytest.fixture
+    def scraper_cls(self):
+        """The scraper class (needs the optional requests dependency)."""
+        module = pytest.importorskip("src.scrapers.finanzfluss_adac")
+        return module.FinanzflussADACScraper
+
+    async def test_runs_off_the_event_loop(self, scraper_cls, monkeypatch):
+        """Test that the blocking scrape runs in a worker thread while the loop keeps going."""
+        loop_thread = threading.get_ident()
+        calls = []
+
+        def blocking_scrape(self, max_reviews=200):
+            calls.append((threading.get_ident(), max_reviews))
+            time.sleep(0.1)
+            return [{"text": "Gute Erfahrung mit dem ADAC."}]
+
+        monkeypatch.setattr(scraper_cls, "scrape_reviews", blocking_scrape)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        done = False
+        ticker = asyncio.create_task(tick())
+        result = await scraper_cls().scrape_reviews_async(max_reviews=5)
+        done = True
+        await ticker
+
+        assert result == [{"text": "Gute Erfahrung mit dem ADAC."}]
+        assert calls[0][1] == 5
+        assert calls[0][0] != loop_thread
+        assert ticks > 1
+
+
+class TestGermanDates:
+    """Tests for the shared German date parser."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Rezension aus Deutschland vom 27. November 2025", datetime(2025, 11, 27)),
+        ("3. MÄRZ 2024", datetime(2024, 3, 3)),
+        ("am 1. Abend 2025, sonst 3. Mai 2024", datetime(2024, 5, 3)),
+        ("27.11.2025", datetime(2025, 11, 27)),
+        ("31. Februar 2024", None),
+        ("", None),
+    ])
+    def test_parse_german_date(self, text, expected):
+        """Test month-name and dotted dates, skipping words that are not months."""
+        assert parse_german_date(text) == expected
@@ -0,0 +1,281 @@
+"""Tests for the data processing pipeline."""
+
+import pytest
+
+from src.models.review import ReviewColumns, ReviewFactory
+from src.pipeline.cleaner import TextCleaner, clean_text
+from src.pipeline.deduplicator import BloomFilter, Deduplicator, text_hash
+from src.pipeline.transformer import ReviewPipeline
+
+
+TEXTS = [
+    "Great product, would buy again.",
+    "Terrible service, never again.",
+    "Average experience overall.",
+]
+
+
+class TestBloomFilter:
+    """Tests for the Bloom filter used by the deduplicator."""
+
+    def test_add_new_flags_first_occurrence(self):
+        """Test that add_new marks only unseen hashes as new."""
+        bloom = BloomFilter(capacity=1000)
+        hashes = [text_hash(t) for t in TEXTS]
+
+        assert bloom.add_new(hashes) == [True, True, True]
+        assert bloom.add_new(hashes) == [False, False, False]
+
+    def test_add_new_repeat_within_batch(self):
+        """Test that a hash repeated within one batch is new only once."""
+        bloom = BloomFilter(capacity=1000)
+        h = text_hash(TEXTS[0])
+
+        assert bloom.add_new([h, h]) == [True, False]
+        assert bloom.contains(h)
+
+    def test_add_new_matches_contains_then_add(self):
+        """Test that add_new agrees with contains() followed by add()."""
+        batched = BloomFilter(capacity=1000)
+        single = BloomFilter(capacity=1000)
+        hashes = [text_hash(t) for t in TEXTS + TEXTS[:1]]
+
+        expected = []
+        for h in hashes:
+            expected.append(not single.contains(h))
+            single.add(h)
+
+        assert batched.add_new(hashes) == expected
+
+
+@pytest.fixture(params=[False, True], ids=["set", "bloom"])
+def deduplicator(request):
+    """A deduplicator for each storage backend."""
+    return Deduplicator(use_bloom=request.param, capacity=1000)
+
+
+class TestDeduplicator:
+    """Tests for exact duplicate detection."""
+
+    def test_exact_duplicate_caught(self, deduplicator):
+        """Test that a text seen before is reported as duplicate."""
+        assert deduplicator.check_new(TEXTS[0])
+        assert not deduplicator.check_new(TEXTS[0])
+        assert deduplicator.is_duplicate(TEXTS[0])
+
+    def test_normalized_duplicate_caught(self, deduplicator):
+        """Test that case and whitespace differences still count as duplicates."""
+        deduplicator.add("Great  product, would buy AGAIN.")
+        assert deduplicator.is_duplicate(TEXTS[0])
+
+    def test_distinct_texts_kept(self, deduplicator):
+        """Test that different texts are all new."""
+        assert deduplicator.filter_new(TEXTS) == [True, True, True]
+        assert len(deduplicator) == 3
+
+    def test_repeat_within_batch(self, deduplicator):
+        """Test that the second copy of a text within one batch is dropped."""
+        texts = [TEXTS[0], TEXTS[1], TEXTS[0]]
+        assert deduplicator.filter_new(texts) == [True, True, False]
+        assert len(deduplicator) == 2
+
+    def test_check_new_and_filter_new_agree(self):
+        """Test that filter_new gives the same flags as check_new per text."""
+        texts = TEXTS + [TEXTS[1], "Something else entirely.", TEXTS[0]]
+        single = Deduplicator()
+        batched = Deduplicator()
+
+        assert batched.filter_new(texts) == [single.check_new(t) for t in texts]
+        assert len(batched) == len(single)
+
+    def test_filter_new_hashes_matches_filter_new(self, deduplicator):
+        """Test that precomputed hashes give the same result as texts."""
+        texts = TEXTS + TEXTS[:2]
+        by_text = Deduplicator(use_bloom=deduplicator.use_bloom, capacity=1000)
+
+        expected = by_text.filter_new(texts)
+        assert deduplicator.filter_new_hashes([text_hash(t) for t in texts]) == expected
+
+    def test_reset(self, deduplicator):
+        """Test that reset forgets all seen texts."""
+        deduplicator.filter_new(TEXTS)
+        deduplicator.reset()
+
+        assert len(deduplicator) == 0
+        assert deduplicator.check_new(TEXTS[0])
+
+
+class TestTextCleaner:
+    """Tests for review text cleaning."""
+
+    @pytest.fixture
+    def cleaner(self):
+        """A cleaner with the default settings."""
+        return TextCleaner()
+
+    def test_fixes_mojibake(self, cleaner):
+        """Test that UTF-8 decoded as Latin-1 is repaired."""
+        assert cleaner.clean("SchÃ¶n und gut") == "Schön und gut"
+
+    def test_unescapes_html_entities(self, cleaner):
+        """Test that HTML entities are decoded."""
+        assert cleaner.clean("Preis &amp; Leistung") == "Preis & Leistung"
+
+    def test_unescapes_html_entities_inside_tags(self, cleaner):
+        """Test that entities are decoded even when the text has tags."""
+        assert cleaner.clean("<p>Preis &amp; Leistung</p>") == "Preis & Leistung"
+        assert clean_text("<p>5 &lt; 6</p>") == "5 < 6"
+
+    def test_unescapes_html_entities_without_ftfy(self):
+        """Test that entities are decoded when encoding repair is off."""
+        cleaner = TextCleaner(fix_encoding=False)
+        assert cleaner.clean("Preis &amp; Leistung") == "Preis & Leistung"
+
+    def test_nfkc_normalization(self, cleaner):
+        """Test that compatibility characters are normalized."""
+        assert cleaner.clean("ﬁne ① Ｆｕｌｌ") == "fine 1 Full"
+
+    def test_strips_html_tags(self, cleaner):
+        """Test that tags are removed without gluing words together."""
+        assert cleaner.clean("<p>Hello<br>world</p>") == "Hello world"
+        assert cleaner.clean("Hello<br/>world<img src='x.png'>") == "Hello world"
+
+    def test_keeps_angle_brackets_in_prose(self, cleaner):
+        """Test that a plain < or > in the text is not taken for a tag."""
+        assert cleaner.clean("5 < 6 und 7 > 3 super") == "5 < 6 und 7 > 3 super"
+        assert cleaner.clean("<3 tolle App -> gerne wieder") == "<3 tolle App -> gerne wieder"
+
+    def test_collapses_whitespace(self, cleaner):
+        """Test that space runs collapse and paragraph breaks are kept."""
+        text = "a  \t\u00a0b\r\n\r\n\r\n\r\nc \n d"
+        assert cleaner.clean(text) == "a b\n\nc\nd"
+
+    def test_empty_text(self, cleaner):
+        """Test that empty and blank texts clean to an empty string."""
+        assert cleaner.clean("") == ""
+        assert cleaner.clean("   ") == ""
+
+    def test_steps_can_be_disabled(self):
+        """Test that disabled steps leave the text untouched."""
+        cleaner = TextCleaner(fix_encoding=False, normalize_unicode=False, strip_html=False)
+        assert cleaner.clean("SchÃ¶n <b>ﬁ</b>") == "SchÃ¶n <b>ﬁ</b>"
+
+    def test_clean_text_uses_defaults(self, cleaner):
+        """Test that clean_text matches a default TextCleaner."""
+        text = "<b>SchÃ¶n</b>   ﬁne"
+        assert clean_text(text) == cleaner.clean(text)
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "Great product!",
+        "<p>SchÃ¶n</p>\r\n\r\n\r\nﬁne  ok",
+    ])
+    def test_clean_and_hash(self, cleaner, text):
+        """Test that clean_and_hash matches clean, len and text_hash."""
+        cleaned = cleaner.clean(text)
+        assert cleaner.clean_and_hash(text) == (cleaned, len(cleaned), text_hash(cleaned))
+
+
+# (text, rating) rows covering every pipeline step: duplicates that only
+# match after cleaning, case/whitespace duplicates, too short, too long
+PIPELINE_ROWS = [
+    ("Great product, would buy again any time.", 5.0),
+    ("<b>Great product</b>, would buy again any time.", 4.0),
+    ("GREAT   product, would buy again any time.", 5.0),
+    ("Terrible service, never again with them.", 1.0),
+    ("Too short", 3.0),
+    ("Average experience overall, nothing special.", None),
+    ("x" * 300, 2.0),
+    ("Preis &amp; Leistung stimmen bei diesem Anbieter.", 4.0),
+    ("Terrible service, never again with them.", 2.0),
+]
+
+
+def make_pipeline(clean, dedupe, transform):
+    """A pipeline for one clean/dedupe/transform combination."""
+    pipeline = ReviewPipeline(min_length=20, max_length=200, clean=clean, dedupe=dedupe)
+    if transform:
+        pipeline.add_transform(lambda r: r if r.rating is None or r.rating >= 3 else None)
+    return pipeline
+
+
+def make_reviews():
+    """Fresh input reviews (the pipeline cleans texts in place)."""
+    factory = ReviewFactory()
+    return [factory.create(text=text, rating=rating, source="test") for text, rating in PIPELINE_ROWS]
+
+
+async def aiter_reviews(reviews):
+    """Feed a list as an async stream."""
+    for review in reviews:
+        yield review
+
+
+def summarize(reviews):
+    """What the entry points must agree on (IDs differ for process_columns)."""
+    return [(r.text, r.rating) for r in reviews]
+
+
+@pytest.mark.parametrize("clean", [True, False], ids=["clean", "raw"])
+@pytest.mark.parametrize("dedupe", [True, False], ids=["dedupe", "keep"])
+@pytest.mark.parametrize("transform", [True, False], ids=["transform", "plain"])
+class TestPipelineEntryPoints:
+    """Tests that every ReviewPipeline entry point gives the same output and stats."""
+
+    @pytest.fixture
+    def expected(self, clean, dedupe, transform):
+        """Output and stats of process()."""
+        pipeline = make_pipeline(clean, dedupe, transform)
+        return summarize(pipeline.process(make_reviews())), pipeline.get_stats()
+
+    def test_process_matches_reference(self, clean, dedupe, transform, expected):
+        """Test process() against a step-by-step reference of the documented steps."""
+        cleaner = TextCleaner()
+        seen = set()
+        output = []
+        for text, rating in PIPELINE_ROWS:
+            if clean:
+                text = cleaner.clean(text)
+            if not 20 <= len(text) <= 200:
+                continue
+            if dedupe:
+                h = text_hash(text)
+                if h in seen:
+                    continue
+                seen.add(h)
+            if transform and rating is not None and rating < 3:
+                continue
+            output.append((text, rating))
+
+        assert expected[0] == output
+        assert expected[1]["input"] == len(PIPELINE_ROWS)
+        assert expected[1]["output"] == len(output)
+
+    def test_process_columns(self, clean, dedupe, transform, expected):
+        """Test that process_columns matches process()."""
+        columns = ReviewColumns(source="test")
+        for text, rating in PIPELINE_ROWS:
+            columns.append(text, rating=rating)
+        pipeline = make_pipeline(clean, dedupe, transform)
+
+        result = pipeline.process_columns(columns, ReviewFactory())
+
+        assert (summarize(result), pipeline.get_stats()) == expected
+
+    async def test_process_stream(self, clean, dedupe, transform, expected):
+        """Test that process_stream matches process()."""
+        pipeline = make_pipeline(clean, dedupe, transform)
+
+        result = [r async for r in pipeline.process_stream(aiter_reviews(make_reviews()))]
+
+        assert (summarize(result), pipeline.get_stats()) == expected
+
+    @pytest.mark.parametrize("batch_size", [1, 4, 256])
+    async def test_process_stream_batched(self, clean, dedupe, transform, expected, batch_size):
+        """Test that process_stream_batched matches process() for any batch size."""
+        pipeline = make_pipeline(clean, dedupe, transform)
+        stream = pipeline.process_stream_batched(aiter_reviews(make_reviews()), batch_size=batch_size)
+
+        result = [r async for r in stream]
+
+        assert (summarize(result), pipeline.get_stats()) == expected